@@ -1,5 +1,7 @@
 import copy
+import threading
 import typing
+import weakref
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -218,6 +220,138 @@ def _merger(a, b):
     raise TypeError(f'Unexpected value type: {type(a)}: {a}')
 
 
+def _merge_into(a, c):
+    """
+    Same as _merger, but layers 'a' over 'c' in place instead of deep copying 'c' first.
+    'c' must be exclusively owned by the caller. Anything taken from 'a' is copied, so 'a' may be shared.
+    Returns the merged value, which is 'c' itself unless 'a' replaces it.
+    """
+    if type(a) in [bool, int, float, str, bytes, type(None)]:
+        return a
+
+    if isinstance(a, Model):
+        a = a.primitive()
+
+    if isinstance(a, list):
+        if not isinstance(c, list):
+            return copy.deepcopy(a)
+        for entry in a:
+            if entry not in c:  # do not include duplicates
+                c.append(copy.deepcopy(entry))
+
+        if c and type(c[0]) in [str, int, float]:
+            c.sort()
+        return c
+
+    if isinstance(a, dict):
+        if not isinstance(c, dict):
+            return copy.deepcopy(a)
+        for k, v in a.items():
+            if k.endswith('!'):  # full dominant key
+                c[k[:-1]] = copy.deepcopy(v)
+            elif k.endswith('?'):  # default value key
+                k = k[:-1]
+                if k not in c:
+                    c[k] = copy.deepcopy(v)
+            elif k.endswith('-'):  # remove key entirely
+                c.pop(k[:-1], None)
+            elif k in c:
+                c[k] = _merge_into(v, c[k])
+            else:
+                c[k] = copy.deepcopy(v)
+        return c
+
+    raise TypeError(f'Unexpected value type: {type(a)}: {a}')
+
+
+class AssemblyMemberOverrides:
+    """
+    The member metadata overrides of an assembly, flattened across its basis chain and indexed by distgit_key.
+    Computing a member's config otherwise means walking the chain and scanning every members list for each
+    member, which is quadratic for large assemblies.
+    """
+
+    # Indexes are built once per releases_config object. Code which modifies a releases_config in place
+    # (e.g. adding an assembly to it) must call invalidate() so that later lookups see the change.
+    # id(releases_config) -> (weak reference to releases_config, {(assembly, meta_type): AssemblyMemberOverrides})
+    _cache: typing.Dict[
+        int, typing.Tuple[weakref.ref, typing.Dict[typing.Tuple[str, str], "AssemblyMemberOverrides"]]
+    ] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, releases_config: Model, assembly: str, meta_type: str):
+        """
+        :param releases_config: A Model for releases.yaml.
+        :param assembly: The name of the assembly
+        :param meta_type: 'rpm' or 'image'
+        """
+        _check_recursion(releases_config, assembly)
+        chain = []
+        next_assembly = assembly
+        while next_assembly:
+            target_assembly = releases_config.releases[next_assembly].assembly
+            chain.append(target_assembly)
+            next_assembly = target_assembly.basis.assembly
+
+        # Ancestor overrides are applied first, each assembly's entries in the order they are listed
+        wildcard = []
+        explicit: typing.Dict[str, list] = {}
+        position = 0
+        for target_assembly in reversed(chain):
+            for component_entry in target_assembly.members[f'{meta_type}s']:
+                if not component_entry.metadata:
+                    continue
+                entry = (position, component_entry.metadata.primitive())
+                position += 1
+                if component_entry.distgit_key == '*':
+                    wildcard.append(entry)
+                else:
+                    explicit.setdefault(component_entry.distgit_key, []).append(entry)
+
+        self._wildcard = tuple(metadata for _, metadata in wildcard)
+        self._by_key = {
+            distgit_key: tuple(metadata for _, metadata in sorted(wildcard + entries, key=lambda e: e[0]))
+            for distgit_key, entries in explicit.items()
+        }
+
+    @classmethod
+    def get(cls, releases_config: Model, assembly: str, meta_type: str) -> "AssemblyMemberOverrides":
+        """
+        Returns the (cached) index for the given assembly and member type.
+        """
+        key = id(releases_config)
+        with cls._cache_lock:
+            ref, indexes = cls._cache.get(key, (None, None))
+            if ref is None or ref() is not releases_config:
+                ref = weakref.ref(releases_config, lambda _, key=key: cls._evict(key))
+                indexes = {}
+                cls._cache[key] = (ref, indexes)
+            index = indexes.get((assembly, meta_type))
+        if index is None:
+            index = cls(releases_config, assembly, meta_type)
+            with cls._cache_lock:
+                index = indexes.setdefault((assembly, meta_type), index)
+        return index
+
+    @classmethod
+    def invalidate(cls, releases_config: Model):
+        """
+        Drops the indexes built for releases_config; call after modifying it in place.
+        """
+        cls._evict(id(releases_config))
+
+    @classmethod
+    def _evict(cls, key: int):
+        with cls._cache_lock:
+            cls._cache.pop(key, None)
+
+    def overrides_for(self, distgit_key: str) -> typing.Tuple[dict, ...]:
+        """
+        :return: The metadata overrides that apply to distgit_key, in the order they must be layered over its config.
+        """
+        return self._by_key.get(distgit_key, self._wildcard)
+
+
 def assembly_permits(releases_config: Model, group_config: Model, assembly: typing.Optional[str]) -> ListModel:
     """
     :param releases_config: The content of releases.yml in Model form.
@@ -407,25 +541,13 @@ def assembly_metadata_config(
     if not assembly or not isinstance(releases_config, Model):
         return meta_config
 
-    _check_recursion(releases_config, assembly)
-    target_assembly = releases_config.releases[assembly].assembly
-
-    if target_assembly.basis.assembly:  # Does this assembly inherit from another?
-        # Recursive apply ancestor assemblies
-        meta_config = assembly_metadata_config(
-            releases_config, target_assembly.basis.assembly, meta_type, distgit_key, meta_config
-        )
-
+    overrides = AssemblyMemberOverrides.get(releases_config, assembly, meta_type).overrides_for(distgit_key)
     config_dict = meta_config.primitive()
-
-    component_list = target_assembly.members[f'{meta_type}s']
-    for component_entry in component_list:
-        if (
-            component_entry.distgit_key == '*'
-            or component_entry.distgit_key == distgit_key
-            and component_entry.metadata
-        ):
-            config_dict = _merger(component_entry.metadata.primitive(), config_dict)
+    if overrides:
+        # Copy once, then layer every override over the copy in place
+        config_dict = copy.deepcopy(config_dict)
+        for metadata in overrides:
+            config_dict = _merge_into(metadata, config_dict)
 
     return Model(dict_to_model=config_dict)
 
@@ -91,6 +91,7 @@ class BigQueryClient:
         order_by_clause: typing.Optional[UnaryExpression] = None,
         limit=None,
         exclude_columns: typing.Optional[typing.List[str]] = None,
+        latest_per: typing.Optional[str] = None,
     ) -> RowIterator:
         """
         Execute a SELECT statement and return a generator object with the results.
@@ -105,6 +106,10 @@ class BigQueryClient:
         exclude_columns is an optional list of column names to exclude from the SELECT statement
         (using BigQuery's EXCEPT syntax). Useful for excluding large columns like installed_rpms
         and installed_packages to reduce query costs and latency.
+
+        latest_per is an optional column name. When set, only the first row per distinct value of that column
+        (according to order_by_clause) is returned, using a QUALIFY ROW_NUMBER() window filter.
+        This lets a single query return e.g. the latest build for each of several component names.
         """
 
         if exclude_columns:
@@ -125,12 +130,20 @@ class BigQueryClient:
             where_conditions = where_conditions.replace('%%', '%')
             query += f' WHERE {where_conditions}'
 
+        order_by_string = None
         if order_by_clause is not None:
             order_by_string = str(
                 order_by_clause.compile(dialect=mysql.dialect(), compile_kwargs={'literal_binds': True})
             )
             # Un-escape %% to % - BigQuery doesn't need MySQL-style percent escaping
             order_by_string = order_by_string.replace('%%', '%')
+
+        if latest_per:
+            assert where_clauses, 'QUALIFY requires a WHERE clause'
+            assert order_by_string, 'latest_per requires an order_by_clause'
+            query += f' QUALIFY ROW_NUMBER() OVER (PARTITION BY `{latest_per}` ORDER BY {order_by_string}) = 1'
+
+        if order_by_string:
             query += f' ORDER BY {order_by_string}'
 
         if limit is not None:
@@ -1,8 +1,13 @@
+import hashlib
 import io
+import json
 import os
+import pickle
 import shutil
 import string
+import tempfile
 import urllib.parse
+from pathlib import Path
 
 import ruamel.yaml
 import ruamel.yaml.util
@@ -17,6 +22,14 @@ from future.utils import as_native_str
 
 SCHEMES = ['ssh', 'ssh+git', "http", "https"]
 
+# Use the libyaml backed loader when PyYAML was built with it; it constructs the same objects as yaml.full_load
+YAML_LOADER = getattr(yaml, 'CFullLoader', yaml.FullLoader)
+
+# Parsed data files are cached here across runs, keyed by file content and substitution variables
+PARSE_CACHE_DIR_ENV_VAR = 'ART_GITDATA_PARSE_CACHE_DIR'
+# Bump this whenever the layout of a cache entry or the meaning of its key changes
+PARSE_CACHE_FORMAT_VERSION = 1
+
 
 class SafeFormatter(string.Formatter):
     """
@@ -39,6 +52,10 @@ class SafeFormatter(string.Formatter):
             return string.Formatter.get_value(key, args, kwargs)
 
 
+def parse_yaml(text):
+    return yaml.load(text, Loader=YAML_LOADER)
+
+
 class GitDataException(Exception):
     """A broad exception for errors during GitData operations"""
 
@@ -96,6 +113,7 @@ class GitData(object):
         exts=['yaml', 'yml', 'json'],
         reclone=False,
         logger=None,
+        parse_cache_dir=None,
     ):
         """
         Load structured data from a git source.
@@ -106,6 +124,8 @@ class GitData(object):
         :param list exts: List of valid extensions to search for in data, with out period
         :param reclone: If a clone is already present, remove it and reclone latest.
         :param logger: Python logging object to use
+        :param parse_cache_dir: Directory in which parsed data files are cached across runs.
+            Defaults to $ART_GITDATA_PARSE_CACHE_DIR; caching is disabled if neither is set.
         :raises GitDataException:
         """
         self.logger = logger
@@ -121,6 +141,8 @@ class GitData(object):
         self.commit_hash = None
         self.origin_url = None
         self.reclone = reclone
+        parse_cache_dir = parse_cache_dir or os.environ.get(PARSE_CACHE_DIR_ENV_VAR)
+        self.parse_cache_dir = Path(parse_cache_dir) if parse_cache_dir else None
         if data_path:
             self.clone_data(data_path)
 
@@ -233,12 +255,54 @@ class GitData(object):
             raw_text = f.read()
 
         try:
-            data = yaml.full_load(raw_text)
+            data = parse_yaml(raw_text)
         except Exception as e:
             raise ValueError(f"error parsing file {full_path}: {e}")
 
         return data
 
+    @staticmethod
+    def _replace_vars_digest(replace_vars):
+        if not replace_vars:
+            return ''
+        return hashlib.sha256(json.dumps(replace_vars, sort_keys=True, default=repr).encode()).hexdigest()
+
+    def _parse_cache_path(self, raw_text, vars_digest):
+        """
+        Return the location of the cache entry for a data file, or None if caching is disabled.
+        Files with identical content share a single entry regardless of their name.
+        """
+        if not self.parse_cache_dir:
+            return None
+        key = hashlib.sha256(f"{PARSE_CACHE_FORMAT_VERSION}\0{vars_digest}\0{raw_text}".encode()).hexdigest()
+        return self.parse_cache_dir / key[:2] / f"{key}.pickle"
+
+    def _read_parse_cache(self, path):
+        try:
+            with path.open('rb') as f:
+                return True, pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception as e:
+            self.logger.warning('Ignoring unreadable data cache entry %s: %s', path, e)
+            return False, None
+
+    def _write_parse_cache(self, path, data):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a private temp file and rename it into place, so that concurrent
+            # jobs sharing the cache directory never observe a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, pickle.PicklingError) as e:
+            self.logger.warning('Failed to write data cache entry %s: %s', path, e)
+
     def load_data(self, path='', key=None, keys=None, exclude=None, filter_funcs=None, replace_vars=None):
         full_path = os.path.join(self.data_dir, path.replace('\\', '/'))
         if path and not os.path.isdir(full_path):
@@ -269,6 +333,7 @@ class GitData(object):
         else:
             files = os.listdir(full_path)
 
+        vars_digest = self._replace_vars_digest(replace_vars)
         result = {}
 
         for name in files:
@@ -278,6 +343,9 @@ class GitData(object):
                 if os.path.isfile(data_file):
                     with io.open(data_file, 'r', encoding="utf-8") as f:
                         raw_text = f.read()
+                    cache_path = self._parse_cache_path(raw_text, vars_digest)
+                    hit, data = self._read_parse_cache(cache_path) if cache_path else (False, None)
+                    if not hit:
                         if replace_vars:
                             # Use safe substitution - replace found vars, leave unfound ones as-is
                             try:
@@ -287,22 +355,27 @@ class GitData(object):
                                 self.logger.warning(
                                     'Error applying template substitution to {}: {}'.format(data_file, e)
                                 )
+                                # Don't cache, so that the warning is repeated on every run until the file is fixed
+                                cache_path = None
                         try:
-                            data = yaml.full_load(raw_text)
+                            data = parse_yaml(raw_text)
                         except Exception as e:
                             raise ValueError(f"error parsing file {data_file}: {e}")
-                        use = True
-                        if exclude and base_name in exclude:
-                            use = False
-
-                        if use and filter_funcs:
-                            for func in filter_funcs:
-                                use &= func(base_name, data)
-                                if not use:
-                                    break
-
-                        if use:
-                            result[base_name] = DataObj(base_name, data_file, data)
+                        if cache_path:
+                            self._write_parse_cache(cache_path, data)
+
+                    use = True
+                    if exclude and base_name in exclude:
+                        use = False
+
+                    if use and filter_funcs:
+                        for func in filter_funcs:
+                            use &= func(base_name, data)
+                            if not use:
+                                break
+
+                    if use:
+                        result[base_name] = DataObj(base_name, data_file, data)
 
         if key and key in result:
             result = result[key]
@@ -1,14 +1,21 @@
 import asyncio
+import bisect
 import concurrent
+import gzip
 import inspect
 import logging
+import os
+import pickle
 import pprint
+import tempfile
 import threading
+import time
 import typing
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from pathlib import Path
 
 from artcommonlib import bigquery
 from artcommonlib.konflux import konflux_build_record
@@ -30,6 +37,33 @@ BUILDER_BASE_IMAGE_GROUP = "builder_base_image"
 # Large columns that can be excluded from queries to reduce cost and latency
 LARGE_COLUMNS = ['installed_rpms', 'installed_packages']
 
+# Environment variable pointing at a directory where BuildCache snapshots are persisted across runs
+SNAPSHOT_DIR_ENV_VAR = 'KONFLUX_DB_CACHE_DIR'
+
+# Bump whenever the on-disk snapshot layout changes; snapshots with a different version are discarded
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Sort key used for builds without a start_time, so that they sort after every other build
+_NO_START_TIME_EPOCH = -(2**63)
+
+# When refreshing a snapshot, re-read builds that started this long before the snapshot watermark.
+# A build record is written when the pipeline completes, so a long-running build can land in the table
+# with a start_time older than builds that were already captured in the snapshot.
+SNAPSHOT_REFRESH_OVERLAP = timedelta(hours=12)
+
+
+def _utc_epoch_micros(value: typing.Optional[datetime]) -> int:
+    """
+    Normalize a datetime to integer microseconds since the epoch, in UTC.
+    Naive datetimes are assumed to be in UTC. None maps to a value older than any real timestamp.
+    """
+    if value is None:
+        return _NO_START_TIME_EPOCH
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
 
 class CacheRecordsType(Enum):
     """
@@ -59,6 +93,27 @@ class CacheMetrics:
     misses: int = 0
 
 
+@dataclass
+class SnapshotMetrics:
+    """Metrics for on-disk snapshot usage."""
+
+    loads: int = 0
+    saves: int = 0
+    records_loaded: int = 0
+    bytes_saved: int = 0
+    seconds_saved: float = 0.0
+
+
+@dataclass
+class CacheSnapshot:
+    """Information about a snapshot that has been loaded into the cache."""
+
+    newest: typing.Optional[datetime]
+    record_ids: typing.Set[str] = field(default_factory=set)
+    full_load_bytes: int = 0
+    full_load_seconds: float = 0.0
+
+
 class BuildCache:
     """
     Thread-safe in-memory cache of recent builds, per-group.
@@ -69,11 +124,21 @@ class BuildCache:
 
     Stores builds indexed by:
     - group → { name → [builds sorted by start_time desc], nvr → build }
+    - group → { (name, outcome, assembly, el_target, engine) → builds sorted by start_time desc }
+
+    The composite index keeps, for each key, parallel lists of negated UTC epoch microseconds and record ids,
+    so that a completed_before cut-off is a bisect rather than a scan, and builds started at the same time are
+    always chosen in the same order. Index entries are replaced rather than modified, so lookups scan them
+    without holding the lock.
+
+    If a snapshot directory is configured, each group and cache type can be persisted to a gzip-compressed,
+    column-oriented pickle, so that the next process only needs to fetch builds newer than the snapshot.
     """
 
-    def __init__(self, cache_days: int = 30):
+    def __init__(self, cache_days: int = 30, snapshot_dir: typing.Optional[str] = None):
         # Cache groups indexed by cache type
-        # Each cache type has: group → { 'by_name': {}, 'by_nvr': {}, 'oldest': datetime, 'newest': datetime }
+        # Each cache type has: group → { 'by_name': {}, 'by_nvr': {}, 'by_key': {}, 'keys_by_name': {},
+        #                                'oldest': datetime, 'newest': datetime }
         self.cache_groups = {
             CacheRecordsType.SMALL_COLUMNS: {},  # Records without installed_rpms/installed_packages
             CacheRecordsType.ALL_COLUMNS: {},  # Records with all columns
@@ -85,8 +150,15 @@ class BuildCache:
             CacheRecordsType.ALL_COLUMNS: CacheMetrics(),
         }
 
+        # Snapshot metrics indexed by cache type
+        self.snapshot_metrics = {
+            CacheRecordsType.SMALL_COLUMNS: SnapshotMetrics(),
+            CacheRecordsType.ALL_COLUMNS: SnapshotMetrics(),
+        }
+
         self._lock = threading.RLock()
         self._cache_days = cache_days
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else None
         self.logger = logging.getLogger(__name__)
 
     def _increment_hit(self, cache_type: CacheRecordsType):
@@ -110,6 +182,9 @@ class BuildCache:
             groups[group] = {
                 "by_name": defaultdict(list),
                 "by_nvr": {},
+                # (name, outcome, assembly, el_target, engine) → ([-epoch, ...], [record_id, ...], [build, ...])
+                "by_key": {},
+                "keys_by_name": defaultdict(set),  # name → composite keys present for that name
                 "oldest": None,
                 "newest": None,
                 "total_builds": 0,
@@ -153,10 +228,18 @@ class BuildCache:
 
         with self._lock:
             group_cache = self.get_group_cache(group, cache_type=cache_type)
+            touched_names = set()
+            added_by_key = defaultdict(list)
 
             for build in builds:
                 # Index by name
                 group_cache['by_name'][build.name].append(build)
+                touched_names.add(build.name)
+
+                # Index by composite key
+                # Bundle and FBC records have no el_target
+                key = (build.name, build.outcome, build.assembly, getattr(build, 'el_target', None), build.engine)
+                added_by_key[key].append(build)
 
                 # Index by NVR - prioritize successful builds over failed ones
                 existing_build = group_cache['by_nvr'].get(build.nvr)
@@ -181,9 +264,21 @@ class BuildCache:
 
                 group_cache['total_builds'] += 1
 
-            # Sort each name's build list by start_time descending (newest first)
-            for name in group_cache['by_name']:
-                group_cache['by_name'][name].sort(key=lambda b: b.start_time or datetime.min, reverse=True)
+            # Sort each touched name's build list by start_time descending (newest first)
+            for name in touched_names:
+                group_cache['by_name'][name].sort(key=lambda b: _utc_epoch_micros(b.start_time), reverse=True)
+
+            # Rebuild touched composite index entries, newest first and then by record id
+            for key, added in added_by_key.items():
+                neg_epochs, record_ids, key_builds = group_cache['by_key'].get(key, ([], [], []))
+                if not key_builds:
+                    group_cache['keys_by_name'][key[0]].add(key)
+                ranked = sorted(
+                    [*zip(neg_epochs, record_ids, key_builds)]
+                    + [(-_utc_epoch_micros(b.start_time), b.record_id or '', b) for b in added],
+                    key=lambda entry: entry[:2],
+                )
+                group_cache['by_key'][key] = tuple(list(column) for column in zip(*ranked))
 
             self.logger.info(
                 f"{cache_type.display_name} cache loaded {len(builds)} builds for group '{group}' "
@@ -268,6 +363,9 @@ class BuildCache:
         if engine is not None and not isinstance(engine, Engine):
             engine = Engine(engine)
 
+        # Resolve the cut-off outside the lock; builds without a start_time are never excluded by it
+        cb_neg_epoch = -_utc_epoch_micros(completed_before) if completed_before is not None else None
+
         with self._lock:
             groups = self.cache_groups[cache_type]
             # Check if group cached
@@ -277,53 +375,57 @@ class BuildCache:
                 return None
 
             group_cache = groups[group]
-            builds = group_cache['by_name'].get(name, [])
-            if not builds:
+            keys = group_cache['keys_by_name'].get(name)
+            if not keys:
                 self._increment_miss(cache_type)
                 self.logger.debug(f"{cache_type.display_name} cache MISS: No builds for name {name} in group {group}")
                 return None
 
-            # Filter builds by criteria
-            for build in builds:  # Already sorted newest first
-                # Apply filters
-                if outcome is not None and build.outcome != outcome:
-                    continue
-                if assembly is not None and build.assembly != assembly:
-                    continue
-                if el_target is not None and build.el_target != el_target:
-                    continue
+            # Take the entries matching the indexed filters; they are never modified once published
+            entries = [
+                group_cache['by_key'][key]
+                for key in keys
+                if (outcome is None or key[1] == outcome)
+                and (assembly is None or key[2] == assembly)
+                and (el_target is None or key[3] == el_target)
+                and (engine is None or key[4] == engine)
+            ]
+
+        # Pick the newest candidate across the matching entries, breaking ties by record id
+        best = None
+        best_rank = None
+        for neg_epochs, record_ids, key_builds in entries:
+            index = 0
+            if cb_neg_epoch is not None:
+                # First build that started strictly before the cut-off
+                index = bisect.bisect_right(neg_epochs, cb_neg_epoch)
+            # Remaining filters are not part of the key; they are rarely used so a short scan is fine
+            for i in range(index, len(key_builds)):
+                rank = (neg_epochs[i], record_ids[i])
+                if best_rank is not None and rank >= best_rank:
+                    break
+                build = key_builds[i]
                 if artifact_type is not None and build.artifact_type != artifact_type:
                     continue
-                if engine is not None and build.engine != engine:
-                    continue
                 if embargoed is not None and build.embargoed != embargoed:
                     continue
-                if completed_before is not None and build.start_time is not None:
-                    # Ensure completed_before is timezone-aware for comparison
-                    cb_time = (
-                        completed_before.astimezone(timezone.utc)
-                        if completed_before.tzinfo
-                        else completed_before.replace(tzinfo=timezone.utc)
-                    )
-                    build_time = (
-                        build.start_time.astimezone(timezone.utc)
-                        if build.start_time.tzinfo
-                        else build.start_time.replace(tzinfo=timezone.utc)
-                    )
-                    if build_time >= cb_time:
-                        continue
+                best, best_rank = build, rank
+                break
 
-                # Found matching build
+        if best is not None:
+            # Found matching build
+            with self._lock:
                 self._increment_hit(cache_type)
-                self.logger.debug(f"{cache_type.display_name} cache HIT: {name} in group {group} with filters")
-                return build
+            self.logger.debug(f"{cache_type.display_name} cache HIT: {name} in group {group} with filters")
+            return best
 
-            # No matching build found
+        # No matching build found
+        with self._lock:
             self._increment_miss(cache_type)
-            self.logger.debug(
-                f"{cache_type.display_name} cache MISS: {name} in group {group} with filters (have builds but none match)"
-            )
-            return None
+        self.logger.debug(
+            f"{cache_type.display_name} cache MISS: {name} in group {group} with filters (have builds but none match)"
+        )
+        return None
 
     def is_group_loaded(self, group: str, cache_type: CacheRecordsType = CacheRecordsType.SMALL_COLUMNS) -> bool:
         """
@@ -336,6 +438,175 @@ class BuildCache:
         with self._lock:
             return group in self.cache_groups[cache_type]
 
+    def snapshot_path(self, group: str, cache_type: CacheRecordsType, table_id: str) -> typing.Optional[Path]:
+        """
+        Return the snapshot file location for a group and cache type, or None if snapshots are disabled.
+
+        :param group: Group name
+        :param cache_type: Type of cache (SMALL_COLUMNS or ALL_COLUMNS)
+        :param table_id: BigQuery table the cached records come from
+        """
+        if not self.snapshot_dir:
+            return None
+        return self.snapshot_dir / f'{table_id}-{group}-{cache_type}.pickle.gz'
+
+    def save_snapshot(
+        self,
+        group: str,
+        record_cls: typing.Type[KonfluxRecord],
+        cache_type: CacheRecordsType = CacheRecordsType.SMALL_COLUMNS,
+        full_load_bytes: int = 0,
+        full_load_seconds: float = 0.0,
+    ):
+        """
+        Persist the cached builds of a group to disk.
+
+        Records are stored column by column (attribute name → list of values), which compresses much
+        better than per-record dicts. The file is written atomically so that concurrent jobs sharing
+        the same snapshot directory never read a partial snapshot.
+
+        :param group: Group name
+        :param record_cls: KonfluxRecord subclass of the cached records
+        :param cache_type: Type of cache to persist (SMALL_COLUMNS or ALL_COLUMNS)
+        :param full_load_bytes: Bytes processed by BigQuery to load the full cache window
+        :param full_load_seconds: Seconds spent loading the full cache window from BigQuery
+        """
+        path = self.snapshot_path(group, cache_type, record_cls.TABLE_ID)
+        if not path:
+            return
+
+        with self._lock:
+            group_cache = self.cache_groups[cache_type].get(group)
+            if group_cache is None:
+                return
+
+            builds = [build for builds in group_cache['by_name'].values() for build in builds]
+            columns = defaultdict(list)
+            for index, build in enumerate(builds):
+                for key, value in build.__dict__.items():
+                    column = columns[key]
+                    # Pad columns that were missing from earlier records
+                    column.extend([None] * (index - len(column)))
+                    column.append(value)
+            for column in columns.values():
+                column.extend([None] * (len(builds) - len(column)))
+
+            snapshot = {
+                'format': SNAPSHOT_FORMAT_VERSION,
+                'schema_level': SCHEMA_LEVEL,
+                'table_id': record_cls.TABLE_ID,
+                'record_cls': record_cls.__name__,
+                'group': group,
+                'cache_type': str(cache_type),
+                'newest': group_cache['newest'],
+                'full_load_bytes': full_load_bytes,
+                'full_load_seconds': full_load_seconds,
+                'size': len(builds),
+                'columns': dict(columns),
+            }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as f:
+                    pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Failed to save {cache_type} cache snapshot for group '{group}' to {path}: {e}")
+            return
+
+        with self._lock:
+            self.snapshot_metrics[cache_type].saves += 1
+        self.logger.info(f"{cache_type.display_name} cache snapshot saved for group '{group}': {len(builds)} builds")
+
+    def load_snapshot(
+        self,
+        group: str,
+        record_cls: typing.Type[KonfluxRecord],
+        cache_type: CacheRecordsType = CacheRecordsType.SMALL_COLUMNS,
+        not_before: typing.Optional[datetime] = None,
+    ) -> typing.Optional[CacheSnapshot]:
+        """
+        Load a previously saved snapshot of a group into the cache.
+
+        Snapshots written with a different SCHEMA_LEVEL, format version or record class are ignored.
+
+        :param group: Group name
+        :param record_cls: KonfluxRecord subclass of the cached records
+        :param cache_type: Type of cache to load (SMALL_COLUMNS or ALL_COLUMNS)
+        :param not_before: Drop builds that started before this time (i.e. fell out of the cache window)
+        :return: Information about the loaded snapshot, or None if no usable snapshot exists
+        """
+        path = self.snapshot_path(group, cache_type, record_cls.TABLE_ID)
+        if not path or not path.exists():
+            return None
+
+        try:
+            with gzip.open(path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable {cache_type} cache snapshot {path}: {e}")
+            return None
+
+        if (
+            snapshot.get('format') != SNAPSHOT_FORMAT_VERSION
+            or snapshot.get('schema_level') != SCHEMA_LEVEL
+            or snapshot.get('table_id') != record_cls.TABLE_ID
+            or snapshot.get('record_cls') != record_cls.__name__
+        ):
+            self.logger.info(f"Ignoring stale {cache_type} cache snapshot {path}")
+            return None
+
+        columns = snapshot['columns']
+        keys = list(columns.keys())
+        builds = []
+        for values in zip(*columns.values()):
+            build = record_cls.__new__(record_cls)
+            build.__dict__.update(zip(keys, values))
+            if not_before is not None and build.start_time is not None and build.start_time < not_before:
+                continue
+            builds.append(build)
+
+        if builds:
+            self.add_builds(builds, group, cache_type=cache_type)
+        else:
+            # Mark the group as loaded even if the whole snapshot fell out of the window
+            with self._lock:
+                self.get_group_cache(group, cache_type=cache_type)
+
+        with self._lock:
+            metrics = self.snapshot_metrics[cache_type]
+            metrics.loads += 1
+            metrics.records_loaded += len(builds)
+
+        self.logger.info(
+            f"{cache_type.display_name} cache snapshot loaded for group '{group}': {len(builds)} builds "
+            f"(newest: {snapshot['newest']})"
+        )
+        return CacheSnapshot(
+            newest=snapshot['newest'],
+            record_ids={build.record_id for build in builds},
+            full_load_bytes=snapshot['full_load_bytes'],
+            full_load_seconds=snapshot['full_load_seconds'],
+        )
+
+    def record_snapshot_savings(self, cache_type: CacheRecordsType, bytes_saved: int, seconds_saved: float):
+        """
+        Account for BigQuery bytes and wall-clock time saved by refreshing a snapshot instead of a full load.
+
+        :param cache_type: Type of cache the snapshot belongs to
+        :param bytes_saved: Bytes not processed by BigQuery compared to a full load
+        :param seconds_saved: Seconds saved compared to a full load
+        """
+        with self._lock:
+            metrics = self.snapshot_metrics[cache_type]
+            metrics.bytes_saved += max(bytes_saved, 0)
+            metrics.seconds_saved += max(seconds_saved, 0.0)
+
     def stats(self, group: typing.Optional[str] = None) -> dict:
         """
         Get cache statistics.
@@ -374,6 +645,7 @@ class BuildCache:
                     stats[f"{cache_type}_cache_misses"] = metrics.misses
                     stats[f"{cache_type}_hit_rate"] = f"{hit_rates[cache_type]:.1f}%"
 
+                self._add_snapshot_stats(stats)
                 return stats
             else:
                 # Aggregate stats across all groups
@@ -398,8 +670,23 @@ class BuildCache:
                         "hit_rate": f"{hit_rates[cache_type]:.1f}%",
                     }
 
+                self._add_snapshot_stats(stats)
                 return stats
 
+    def _add_snapshot_stats(self, stats: dict):
+        """Add snapshot metrics to a stats dict, if snapshots are enabled."""
+        if not self.snapshot_dir:
+            return
+        for cache_type in CacheRecordsType:
+            metrics = self.snapshot_metrics[cache_type]
+            stats[f"{cache_type}_snapshot"] = {
+                "loads": metrics.loads,
+                "saves": metrics.saves,
+                "records_loaded": metrics.records_loaded,
+                "bytes_saved": metrics.bytes_saved,
+                "seconds_saved": round(metrics.seconds_saved, 3),
+            }
+
     def clear(
         self,
         group: typing.Optional[str] = None,
@@ -432,6 +719,7 @@ class BuildCache:
                     self.cache_groups[ct].clear()
                     self.cache_metrics[ct].hits = 0
                     self.cache_metrics[ct].misses = 0
+                    self.snapshot_metrics[ct] = SnapshotMetrics()
 
                 type_desc = "both" if cache_type is None else cache_type.display_name
                 self.logger.info(f"Cache cleared for all groups ({type_desc})")
@@ -443,7 +731,7 @@ class KonfluxDb:
     _cache_lock = threading.RLock()
     _group_loading_events: typing.Dict[str, asyncio.Event] = {}  # Per-group events for coordinating lazy-load
 
-    def __init__(self, enable_cache: bool = True, cache_days: int = 30):
+    def __init__(self, enable_cache: bool = True, cache_days: int = 30, snapshot_dir: typing.Optional[str] = None):
         """
         Initialize KonfluxDb client.
 
@@ -453,6 +741,9 @@ class KonfluxDb:
         :param enable_cache: If True, enable the shared build cache. Default True.
         :param cache_days: Number of days of recent builds to cache per group. Default 30.
                           Only used when creating the cache for the first time.
+        :param snapshot_dir: Directory where cache snapshots are persisted across runs.
+                             Defaults to $KONFLUX_DB_CACHE_DIR; snapshots are disabled if neither is set.
+                             Only used when creating the cache for the first time.
         """
         self.logger = logging.getLogger(__name__)
         self.bq_client = bigquery.BigQueryClient()
@@ -461,7 +752,8 @@ class KonfluxDb:
         # Initialize shared cache on first use
         with KonfluxDb._cache_lock:
             if enable_cache and KonfluxDb._shared_cache is None:
-                KonfluxDb._shared_cache = BuildCache(cache_days=cache_days)
+                snapshot_dir = snapshot_dir or os.environ.get(SNAPSHOT_DIR_ENV_VAR)
+                KonfluxDb._shared_cache = BuildCache(cache_days=cache_days, snapshot_dir=snapshot_dir)
                 self.logger.debug(f"Initialized shared BuildCache with {cache_days} day window")
 
         # Reference the shared cache (or None if caching disabled)
@@ -542,9 +834,20 @@ class KonfluxDb:
 
             # Build query for last N days of builds in this group
             start_time = datetime.now(tz=timezone.utc) - timedelta(days=self.cache._cache_days)
+
+            # If a snapshot from a previous run is available, only fetch what is newer than it
+            snapshot = None
+            if self.cache.snapshot_dir:
+                snapshot = self.cache.load_snapshot(
+                    group, self.record_cls, cache_type=cache_type, not_before=start_time
+                )
+            query_start_time = start_time
+            if snapshot and snapshot.newest:
+                query_start_time = max(start_time, snapshot.newest - SNAPSHOT_REFRESH_OVERLAP)
+
             where_clauses = [
                 Column('outcome', String).in_(['success', 'failure']),
-                Column('start_time', DateTime) >= start_time,
+                Column('start_time', DateTime) >= query_start_time,
             ]
 
             # For builder_base_image group, match groups starting with rhel[0-9]+- or ending with -rhel[0-9]+
@@ -570,6 +873,7 @@ class KonfluxDb:
             ):
                 exclude_cols = LARGE_COLUMNS
 
+            load_start = time.monotonic()
             rows = await self.bq_client.select(
                 where_clauses=where_clauses,
                 order_by_clause=order_by_clause,
@@ -579,9 +883,41 @@ class KonfluxDb:
 
             # Load all rows into cache (thread-safe operation)
             builds = [self.from_result_row(row) for row in rows]
+            if snapshot:
+                # The refresh window overlaps with the snapshot; skip records that are already cached
+                builds = [build for build in builds if build.record_id not in snapshot.record_ids]
             self.cache.add_builds(builds, group, cache_type=cache_type)
-
-            self.logger.info(f"{cache_type.display_name} cache loaded for group '{group}': {len(builds)} builds")
+            load_seconds = time.monotonic() - load_start
+            bytes_processed = getattr(rows, 'total_bytes_processed', None)
+            bytes_processed = bytes_processed if isinstance(bytes_processed, int) else 0
+
+            if snapshot:
+                self.cache.record_snapshot_savings(
+                    cache_type,
+                    bytes_saved=snapshot.full_load_bytes - bytes_processed,
+                    seconds_saved=snapshot.full_load_seconds - load_seconds,
+                )
+                self.logger.info(
+                    f"{cache_type.display_name} cache refreshed from snapshot for group '{group}': "
+                    f"{len(builds)} new builds"
+                )
+                if builds:
+                    self.cache.save_snapshot(
+                        group,
+                        self.record_cls,
+                        cache_type=cache_type,
+                        full_load_bytes=snapshot.full_load_bytes,
+                        full_load_seconds=snapshot.full_load_seconds,
+                    )
+            else:
+                self.logger.info(f"{cache_type.display_name} cache loaded for group '{group}': {len(builds)} builds")
+                self.cache.save_snapshot(
+                    group,
+                    self.record_cls,
+                    cache_type=cache_type,
+                    full_load_bytes=bytes_processed,
+                    full_load_seconds=load_seconds,
+                )
 
         except Exception as e:
             self.logger.error(f"Failed to load {cache_type} cache for group '{group}': {e}")
@@ -861,11 +1197,17 @@ class KonfluxDb:
         exclude_large_columns: bool = False,
     ) -> typing.List[typing.Optional[KonfluxRecord]]:
         """
-        For a list of component names, run get_latest_build() in a concurrent pool executor.
+        For a list of component names, get the latest build of each.
+
+        Names are first looked up in the cache. Cache misses are resolved together through a batched
+        exponential window search, which issues one `name IN (...)` query per window for all pending
+        names instead of one window series per name.
 
         :param exclude_large_columns: If True, exclude installed_rpms and installed_packages columns from
                                       BigQuery queries to reduce query cost and latency. Uses small_columns cache.
                                       Default is False (include all columns, uses all_columns cache).
+        :return: Latest matching build (or None) for each name, in the same order as names
+        :raise: IOError if any build is not found and strict=True
         """
 
         # Normalize enum parameters - accept strings or enums
@@ -876,9 +1218,17 @@ class KonfluxDb:
         if engine is not None and not isinstance(engine, Engine):
             engine = Engine(engine)
 
-        return await asyncio.gather(
-            *[
-                self.get_latest_build(
+        # Only exclude LARGE_COLUMNS if the table actually has them (only builds table has them)
+        exclude_columns = None
+        if exclude_large_columns and self.record_cls == konflux_build_record.KonfluxBuildRecord:
+            exclude_columns = LARGE_COLUMNS
+        cache_type = CacheRecordsType.SMALL_COLUMNS if exclude_large_columns else CacheRecordsType.ALL_COLUMNS
+
+        results: typing.Dict[str, KonfluxRecord] = {}
+        if self.cache:
+            await self._ensure_group_cached(group, cache_type=cache_type)
+            for name in dict.fromkeys(names):
+                cached = self.cache.get_by_name(
                     name=name,
                     group=group,
                     outcome=outcome,
@@ -886,15 +1236,40 @@ class KonfluxDb:
                     el_target=el_target,
                     artifact_type=artifact_type,
                     engine=engine,
-                    completed_before=completed_before,
                     embargoed=embargoed,
-                    extra_patterns=extra_patterns or {},
-                    strict=strict,
-                    exclude_large_columns=exclude_large_columns,
+                    completed_before=completed_before,
+                    cache_type=cache_type,
                 )
-                for name in names
-            ]
-        )
+                if cached and self._matches_extra_patterns(cached, extra_patterns):
+                    results[name] = cached
+
+        missing = [name for name in dict.fromkeys(names) if name not in results]
+        if missing:
+            self.logger.debug(f"Querying BigQuery for {len(missing)} of {len(names)} names not found in cache")
+            found = await self._query_bigquery_exponential_batch(
+                names=missing,
+                group=group,
+                outcome=outcome,
+                assembly=assembly,
+                el_target=el_target,
+                artifact_type=artifact_type,
+                engine=engine,
+                completed_before=completed_before,
+                embargoed=embargoed,
+                extra_patterns=extra_patterns or {},
+                exclude_columns=exclude_columns,
+            )
+            if self.cache:
+                for record in found.values():
+                    if record.group:
+                        self.cache.add_builds([record], record.group, cache_type=cache_type)
+            results.update(found)
+
+        not_found = [name for name in names if name not in results]
+        if not_found and strict:
+            raise IOError(f"Build records not found for names={not_found}")
+
+        return [results.get(name) for name in names]
 
     async def get_latest_build(
         self,
@@ -1012,31 +1387,8 @@ class KonfluxDb:
                 completed_before=completed_before,
                 cache_type=cache_type,
             )
-            if cached:
-                # Verify extra_patterns if specified
-                if extra_patterns:
-                    for col_name, col_value in extra_patterns.items():
-                        build_value = getattr(cached, col_name, None)
-                        # Boolean columns need exact match
-                        if col_name in ('hermetic', 'embargoed'):
-                            # Convert string representation to boolean if needed
-                            if isinstance(col_value, str):
-                                expected_bool = col_value.lower() in ('true', '1', 'yes')
-                            else:
-                                expected_bool = bool(col_value)
-                            if build_value != expected_bool:
-                                self.logger.debug(f"Cached build doesn't match extra_pattern {col_name}={col_value}")
-                                break
-                        else:
-                            # String columns use substring matching
-                            if build_value is None or col_value not in str(build_value):
-                                self.logger.debug(f"Cached build doesn't match extra_pattern {col_name}={col_value}")
-                                break
-                    else:
-                        # All extra_patterns match
-                        return cached
-                else:
-                    return cached
+            if cached and self._matches_extra_patterns(cached, extra_patterns):
+                return cached
 
         # Cache miss or disabled → query BigQuery with exponential windows
         result = await self._query_bigquery_exponential(
@@ -1064,6 +1416,30 @@ class KonfluxDb:
 
         return result
 
+    def _matches_extra_patterns(self, build: KonfluxRecord, extra_patterns: typing.Optional[dict]) -> bool:
+        """
+        Check whether a cached build matches extra_patterns.
+        Boolean columns need an exact match, string columns use substring matching.
+        """
+        for col_name, col_value in (extra_patterns or {}).items():
+            build_value = getattr(build, col_name, None)
+            # Boolean columns need exact match
+            if col_name in ('hermetic', 'embargoed'):
+                # Convert string representation to boolean if needed
+                if isinstance(col_value, str):
+                    expected_bool = col_value.lower() in ('true', '1', 'yes')
+                else:
+                    expected_bool = bool(col_value)
+                if build_value != expected_bool:
+                    self.logger.debug(f"Cached build doesn't match extra_pattern {col_name}={col_value}")
+                    return False
+            else:
+                # String columns use substring matching
+                if build_value is None or col_value not in str(build_value):
+                    self.logger.debug(f"Cached build doesn't match extra_pattern {col_name}={col_value}")
+                    return False
+        return True
+
     async def _query_bigquery_exponential(
         self,
         name: typing.Optional[str] = None,
@@ -1113,7 +1489,87 @@ class KonfluxDb:
                                 this window size is reached, even if no result is found.
         :return: First matching build or None
         """
-        # Build base WHERE clauses
+        base_clauses = self._latest_build_base_clauses(
+            name=name,
+            nvr=nvr,
+            group=group,
+            outcome=outcome,
+            assembly=assembly,
+            el_target=el_target,
+            artifact_type=artifact_type,
+            engine=engine,
+            embargoed=embargoed,
+            extra_patterns=extra_patterns,
+        )
+
+        # Order by start_time descending (newest first)
+        order_by_clause = Column('start_time', quote=True).desc()
+
+        end_search, windows_to_search = self._exponential_search_windows(completed_before, max_window_days)
+
+        # Track the previous window's start time to avoid re-scanning
+        previous_start = end_search
+
+        for window_days in windows_to_search:
+            start_window = end_search - timedelta(days=window_days)
+
+            # Build time range WHERE clause
+            # Only scan the incremental new range [start_window, previous_start)
+            # This avoids re-scanning data from previous windows
+            where_clauses = base_clauses + [
+                Column('start_time', DateTime) >= start_window,
+                Column('start_time', DateTime) < previous_start,
+            ]
+
+            # Add completed_before filter if specified
+            if completed_before:
+                where_clauses.append(Column('start_time', DateTime) < completed_before)
+
+            try:
+                self.logger.debug(
+                    f"Querying BigQuery: window={window_days}d, range=[{start_window.date()}, {previous_start.date()})"
+                )
+
+                rows = await self.bq_client.select(
+                    where_clauses=where_clauses,
+                    order_by_clause=order_by_clause,
+                    limit=1,  # Only need first result
+                    exclude_columns=exclude_columns,
+                )
+
+                if rows.total_rows > 0:
+                    result = self.from_result_row(next(rows))
+                    self.logger.debug(f"Found build in {window_days}-day window: {result.nvr}")
+                    return result
+
+                # Update previous_start for next iteration to avoid re-scanning
+                previous_start = start_window
+
+            except Exception as e:
+                self.logger.error(f"Failed querying {window_days}-day window: {e}")
+                raise
+
+        # No results found in any window
+        max_searched = windows_to_search[-1] if windows_to_search else 0
+        self.logger.debug(f"No builds found in exponential search up to {max_searched} days")
+        return None
+
+    @staticmethod
+    def _latest_build_base_clauses(
+        name: typing.Optional[str] = None,
+        nvr: typing.Optional[str] = None,
+        group: typing.Optional[str] = None,
+        outcome: typing.Optional[KonfluxBuildOutcome] = None,
+        assembly: typing.Optional[str] = None,
+        el_target: typing.Optional[str] = None,
+        artifact_type: typing.Optional[ArtifactType] = None,
+        engine: typing.Optional[Engine] = None,
+        embargoed: typing.Optional[bool] = None,
+        extra_patterns: typing.Optional[dict] = None,
+    ) -> list:
+        """
+        Build the WHERE clauses shared by every window of a latest build search.
+        """
         base_clauses = []
 
         if name:
@@ -1154,9 +1610,18 @@ class KonfluxDb:
                 regexp_condition = func.REGEXP_CONTAINS(Column(col_name, String), col_value)
                 base_clauses.append(regexp_condition)
 
-        # Order by start_time descending (newest first)
-        order_by_clause = Column('start_time', quote=True).desc()
+        return base_clauses
 
+    @staticmethod
+    def _exponential_search_windows(
+        completed_before: typing.Optional[datetime] = None,
+        max_window_days: typing.Optional[int] = None,
+    ) -> typing.Tuple[datetime, typing.List[int]]:
+        """
+        Determine the end of the search range and the window sizes (in days) of an exponential search.
+
+        :return: (end_search, windows_to_search)
+        """
         # Determine search starting point
         # If completed_before is set, start searching from that point instead of now
         # (no valid results can exist after completed_before)
@@ -1176,52 +1641,87 @@ class KonfluxDb:
                 # If max_window_days is smaller than smallest window, use it directly
                 windows_to_search = [max_window_days]
 
-        # Track the previous window's start time to avoid re-scanning
+        return end_search, windows_to_search
+
+    async def _query_bigquery_exponential_batch(
+        self,
+        names: typing.List[str],
+        group: str,
+        outcome: typing.Optional[KonfluxBuildOutcome] = None,
+        assembly: typing.Optional[str] = None,
+        el_target: typing.Optional[str] = None,
+        artifact_type: typing.Optional[ArtifactType] = None,
+        engine: typing.Optional[Engine] = None,
+        completed_before: typing.Optional[datetime] = None,
+        embargoed: typing.Optional[bool] = None,
+        extra_patterns: typing.Optional[dict] = None,
+        exclude_columns: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Dict[str, KonfluxRecord]:
+        """
+        Batched counterpart of _query_bigquery_exponential for several component names.
+
+        Each window issues a single query with a `name IN (...)` filter and a QUALIFY ROW_NUMBER() window
+        function that keeps only the latest row per name. Names found in a window are dropped from the
+        pending set, so the whole batch costs at most len(EXPONENTIAL_SEARCH_WINDOWS) queries.
+
+        :return: Dict mapping each found component name to its latest build
+        """
+        base_clauses = self._latest_build_base_clauses(
+            group=group,
+            outcome=outcome,
+            assembly=assembly,
+            el_target=el_target,
+            artifact_type=artifact_type,
+            engine=engine,
+            embargoed=embargoed,
+            extra_patterns=extra_patterns,
+        )
+        order_by_clause = Column('start_time', quote=True).desc()
+        end_search, windows_to_search = self._exponential_search_windows(completed_before)
+
+        found: typing.Dict[str, KonfluxRecord] = {}
+        pending = list(dict.fromkeys(names))
         previous_start = end_search
 
         for window_days in windows_to_search:
+            if not pending:
+                break
             start_window = end_search - timedelta(days=window_days)
-
-            # Build time range WHERE clause
-            # Only scan the incremental new range [start_window, previous_start)
-            # This avoids re-scanning data from previous windows
             where_clauses = base_clauses + [
+                Column('name', String).in_(pending),
                 Column('start_time', DateTime) >= start_window,
                 Column('start_time', DateTime) < previous_start,
             ]
-
-            # Add completed_before filter if specified
             if completed_before:
                 where_clauses.append(Column('start_time', DateTime) < completed_before)
 
             try:
                 self.logger.debug(
-                    f"Querying BigQuery: window={window_days}d, range=[{start_window.date()}, {previous_start.date()})"
+                    f"Querying BigQuery for {len(pending)} names: window={window_days}d, "
+                    f"range=[{start_window.date()}, {previous_start.date()})"
                 )
-
                 rows = await self.bq_client.select(
                     where_clauses=where_clauses,
                     order_by_clause=order_by_clause,
-                    limit=1,  # Only need first result
                     exclude_columns=exclude_columns,
+                    latest_per='name',
                 )
-
-                if rows.total_rows > 0:
-                    result = self.from_result_row(next(rows))
-                    self.logger.debug(f"Found build in {window_days}-day window: {result.nvr}")
-                    return result
-
-                # Update previous_start for next iteration to avoid re-scanning
-                previous_start = start_window
-
             except Exception as e:
                 self.logger.error(f"Failed querying {window_days}-day window: {e}")
                 raise
 
-        # No results found in any window
-        max_searched = windows_to_search[-1] if windows_to_search else 0
-        self.logger.debug(f"No builds found in exponential search up to {max_searched} days")
-        return None
+            for row in rows:
+                record = self.from_result_row(row)
+                # QUALIFY returns at most one row per name; keep the first one just in case
+                found.setdefault(record.name, record)
+            pending = [name for name in pending if name not in found]
+            previous_start = start_window
+
+        if pending:
+            self.logger.debug(
+                f"No builds found in exponential search up to {windows_to_search[-1]} days for: {', '.join(pending)}"
+            )
+        return found
 
     def from_result_row(self, row: Row) -> KonfluxRecord:
         """
@@ -1,3 +1,9 @@
+import json
+import threading
+import typing
+import weakref
+
+
 class ModelException(Exception):
     def __init__(self, msg, result=None, **kwargs):
         super().__init__(msg)
@@ -153,3 +159,240 @@ class Model(dict):
                 v = v.primitive()
             d[k] = v
         return d
+
+
+def _non_serializable(o):
+    return f"<<non-serializable: {type(o).__qualname__}>>"
+
+
+def _intern_key(v):
+    """Returns a key which identifies v exactly, unlike == (which conflates True, 1 and 1.0)"""
+    if isinstance(v, (FrozenModel, FrozenListModel)):
+        # Interned nodes are structurally unique, so identity is sufficient. A node keeps its children alive,
+        # so their ids cannot be reused while a key referring to them is in the intern table.
+        return id(v)
+    if type(v) is str:
+        return v
+    try:
+        key = (type(v), v)
+        hash(key)
+        return key
+    except TypeError:
+        return ('id', id(v))
+
+
+# Structural key -> the single live node with that structure
+_interned: "weakref.WeakValueDictionary[tuple, FrozenModel | FrozenListModel]" = weakref.WeakValueDictionary()
+_interned_lock = threading.Lock()
+
+
+def _intern(cls, items):
+    if cls is FrozenModel:
+        key = (cls, tuple((_intern_key(k), _intern_key(v)) for k, v in items))
+    else:
+        key = (cls, tuple(_intern_key(v) for v in items))
+    with _interned_lock:
+        node = _interned.get(key)
+        if node is None:
+            node = cls._create(items)
+            _interned[key] = node
+    return node
+
+
+def freeze(value):
+    """
+    Returns an immutable, hash-consed equivalent of a Model, ListModel, dict or list (recursively).
+    Structurally identical subtrees are represented by the same object while any of them is alive,
+    so freezing similar configs (or the same config again) reuses existing nodes and their cached serializations.
+    Other values are returned as-is.
+    """
+    if isinstance(value, (FrozenModel, FrozenListModel)) or value is Missing:
+        return value
+    if isinstance(value, dict):
+        return _intern(FrozenModel, [(k, freeze(v)) for k, v in dict.items(value)])
+    if isinstance(value, list):
+        return _intern(FrozenListModel, [freeze(v) for v in list.__iter__(value)])
+    return value
+
+
+class FrozenListModel(ListModel):
+    """
+    An immutable ListModel. Create instances with freeze().
+    """
+
+    def __new__(cls, list_to_model=None):
+        return freeze(list(list_to_model or []))
+
+    def __init__(self, list_to_model=None):
+        pass
+
+    @classmethod
+    def _create(cls, items):
+        node = list.__new__(cls)
+        list.__init__(node, items)
+        object.__setattr__(node, '_frozen_json', None)
+        object.__setattr__(node, '_frozen_hash', None)
+        return node
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return freeze(list.__getitem__(self, index))
+        return list.__getitem__(self, index)
+
+    def __iter__(self):
+        return list.__iter__(self)
+
+    def _immutable(self, *args, **kwargs):
+        raise ModelException("Invalid attempt to modify a frozen model")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __hash__(self):
+        if self._frozen_hash is None:
+            object.__setattr__(self, '_frozen_hash', hash(tuple(self)))
+        return self._frozen_hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return freeze, (self.primitive(),)
+
+    def primitive(self):
+        """Returns a mutable copy as plain lists and dicts"""
+        return [e.primitive() if isinstance(e, (FrozenModel, FrozenListModel)) else e for e in list.__iter__(self)]
+
+    def canonical_json(self) -> str:
+        """
+        Returns json.dumps(self, sort_keys=True), rendering values json cannot serialize as "<<non-serializable: type>>".
+        The result is cached, as are those of all nested models, which are shared between configs.
+        """
+        if self._frozen_json is None:
+            object.__setattr__(self, '_frozen_json', '[' + ', '.join(_canonical_json(e) for e in self) + ']')
+        return self._frozen_json
+
+
+class FrozenModel(Model):
+    """
+    An immutable, structurally shared Model for read-only access to configs. Create instances with freeze().
+    Nested dicts and lists are frozen up front, so attribute access never allocates or writes back.
+    "Modifications" return a new model which shares every subtree that did not change.
+    """
+
+    def __new__(cls, dict_to_model=None):
+        return freeze(dict(dict_to_model or {}))
+
+    def __init__(self, dict_to_model=None):
+        pass
+
+    @classmethod
+    def _create(cls, items):
+        node = dict.__new__(cls)
+        dict.__init__(node, items)
+        object.__setattr__(node, '_frozen_json', None)
+        object.__setattr__(node, '_frozen_hash', None)
+        return node
+
+    def __getattr__(self, attr):
+        return dict.get(self, attr, Missing)
+
+    def __getitem__(self, key):
+        return dict.get(self, key, Missing)
+
+    def _immutable(self, *args, **kwargs):
+        raise ModelException("Invalid attempt to modify a frozen model")
+
+    __setattr__ = __delattr__ = __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __hash__(self):
+        if self._frozen_hash is None:
+            object.__setattr__(self, '_frozen_hash', hash(frozenset(dict.items(self))))
+        return self._frozen_hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return freeze, (self.primitive(),)
+
+    def primitive(self):
+        """Returns a mutable copy as plain dicts and lists"""
+        return {k: v.primitive() if isinstance(v, (FrozenModel, FrozenListModel)) else v for k, v in dict.items(self)}
+
+    def canonical_json(self) -> str:
+        """
+        Returns json.dumps(self, sort_keys=True), rendering values json cannot serialize as "<<non-serializable: type>>".
+        The result is cached, as are those of all nested models, which are shared between configs.
+        """
+        if self._frozen_json is None:
+            if all(type(k) is str for k in dict.keys(self)):
+                entries = (f'{json.dumps(k)}: {_canonical_json(dict.__getitem__(self, k))}' for k in sorted(self))
+                text = '{' + ', '.join(entries) + '}'
+            else:
+                # json converts non-string keys, which may change their order; leave that to json itself
+                text = json.dumps(self.primitive(), sort_keys=True, default=_non_serializable)
+            object.__setattr__(self, '_frozen_json', text)
+        return self._frozen_json
+
+    def _replace(self, changes: dict, removed=()):
+        items = [(k, changes.pop(k, v)) for k, v in dict.items(self) if k not in removed]
+        items.extend(changes.items())
+        return _intern(FrozenModel, items)
+
+    def set_in(self, path: typing.Sequence, value) -> "FrozenModel":
+        """
+        Returns a copy with the value at the given key path set, creating intermediate models as needed.
+        Only the models along the path are rebuilt.
+        """
+        key, *rest = path
+        if rest:
+            child = dict.get(self, key)
+            value = (child if isinstance(child, FrozenModel) else freeze({})).set_in(rest, value)
+        else:
+            value = freeze(value)
+        if key in self and dict.__getitem__(self, key) is value:
+            return self
+        return self._replace({key: value})
+
+    def delete_in(self, path: typing.Sequence) -> "FrozenModel":
+        """
+        Returns a copy without the value at the given key path (self if there is no such value).
+        Only the models along the path are rebuilt.
+        """
+        key, *rest = path
+        if key not in self:
+            return self
+        if not rest:
+            return self._replace({}, removed={key})
+        child = dict.__getitem__(self, key)
+        if not isinstance(child, FrozenModel):
+            return self
+        new_child = child.delete_in(rest)
+        return self if new_child is child else self._replace({key: new_child})
+
+    def deep_merged(self, other) -> "FrozenModel":
+        """
+        Returns the result of artcommonlib.util.deep_merge(self, other), sharing every subtree it leaves untouched.
+        """
+        changes = {}
+        for k, v in dict.items(freeze(other)):
+            current = dict.get(self, k)
+            if isinstance(current, FrozenModel) and isinstance(v, FrozenModel):
+                v = current.deep_merged(v)
+            if k not in self or current is not v:
+                changes[k] = v
+        return self._replace(changes) if changes else self
+
+
+def _canonical_json(v) -> str:
+    if isinstance(v, (FrozenModel, FrozenListModel)):
+        return v.canonical_json()
+    return json.dumps(v, sort_keys=True, default=_non_serializable)
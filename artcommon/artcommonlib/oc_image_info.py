@@ -20,13 +20,30 @@ For callers that don't expect the image to change during the process lifetime,
 ``__lru`` variants add an in-memory ``lru_cache`` / ``alru_cache`` on top::
 
     from artcommonlib.oc_image_info import oc_image_info__cached__lru, oc_image_info__cached_async__lru
+
+When Redis is not available, results can instead be cached in a local directory
+named by ``ART_OC_IMAGE_INFO_CACHE_DIR`` (or :func:`set_disk_cache_dir`).
+Expired entries are pruned from that directory once per process. Results for
+tag-based pullspecs are also stored under the digest the tag resolved to, named
+by that digest, so later lookups by digest are served from the cache.
+
+To inspect many images at once, deduplicating pullspecs and bounding concurrency::
+
+    results = await oc_image_info_many__cached_async(pullspecs, '--filter-by-os=amd64')
 """
 
+import asyncio
 import hashlib
+import json
 import logging
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from artcommonlib import exectools
 from async_lru import alru_cache
@@ -40,6 +57,25 @@ _CACHE_EXPIRY_SECONDS = 60 * 24 * 60 * 60
 # Bump to invalidate every cached entry at once.
 _CACHE_KEY_VERSION = "v1"
 
+# Environment variable naming the directory of the on-disk cache used when Redis is not available.
+DISK_CACHE_DIR_ENV_VAR = "ART_OC_IMAGE_INFO_CACHE_DIR"
+
+# Default number of concurrent ``oc image info`` processes for the batch API.
+DEFAULT_BATCH_CONCURRENCY = 16
+
+# Prefix of the names of the files in the on-disk cache, so that pruning leaves other files alone.
+_DISK_CACHE_FILE_PREFIX = "oc_image_info_"
+
+# Temporary files older than this (seconds) were left behind by interrupted writes.
+_DISK_CACHE_TMP_EXPIRY_SECONDS = 60 * 60
+
+_disk_cache_dir: Optional[Path] = None
+_pruned_disk_cache_dirs: set = set()
+_pruned_disk_cache_dirs_lock = threading.Lock()
+
+_cache_stats = {"redis_hits": 0, "disk_hits": 0, "misses": 0, "uncacheable": 0}
+_cache_stats_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -91,6 +127,43 @@ def _redis_available() -> bool:
     return bool(password)
 
 
+def set_disk_cache_dir(path: Optional[Union[str, Path]]) -> None:
+    """Cache results in *path* when Redis is not available. Overrides ``ART_OC_IMAGE_INFO_CACHE_DIR``;
+    pass None to fall back to the environment variable again.
+    """
+    global _disk_cache_dir
+    _disk_cache_dir = Path(path) if path else None
+
+
+def _get_disk_cache_dir() -> Optional[Path]:
+    if _disk_cache_dir:
+        return _disk_cache_dir
+    env_dir = os.environ.get(DISK_CACHE_DIR_ENV_VAR)
+    return Path(env_dir) if env_dir else None
+
+
+def _count(stat: str) -> None:
+    with _cache_stats_lock:
+        _cache_stats[stat] += 1
+
+
+def get_cache_stats() -> Dict[str, Union[int, float]]:
+    """Return counts of cache hits and misses for ``oc image info`` lookups made by this process."""
+    with _cache_stats_lock:
+        stats = dict(_cache_stats)
+    hits = stats["redis_hits"] + stats["disk_hits"]
+    lookups = hits + stats["misses"] + stats["uncacheable"]
+    stats["lookups"] = lookups
+    stats["hit_rate"] = hits / lookups if lookups else 0.0
+    return stats
+
+
+def reset_cache_stats() -> None:
+    with _cache_stats_lock:
+        for stat in _cache_stats:
+            _cache_stats[stat] = 0
+
+
 def _build_cmd(pullspec: str, options: Tuple[str, ...], registry_config: Optional[str]) -> list[str]:
     """Build the ``oc image info`` command list."""
     cmd: list[str] = ["oc", "image", "info", "-o", "json"]
@@ -101,14 +174,31 @@ def _build_cmd(pullspec: str, options: Tuple[str, ...], registry_config: Optiona
     return cmd
 
 
+def _cache_backend() -> Optional[str]:
+    """Return ``"redis"`` when Redis credentials are present, else ``"disk"`` when an
+    on-disk cache directory is configured, else None.
+    """
+    if _redis_available():
+        return "redis"
+    if _get_disk_cache_dir() is not None:
+        return "disk"
+    return None
+
+
 def _cache_context(pullspec: str, options: Tuple[str, ...]):
-    """Return ``(use_cache, cache_key)`` for the given request.
+    """Return ``(backend, cache_key)`` for the given request.
 
-    If caching is not applicable, *cache_key* is an empty string (never used).
+    If caching is not applicable, *backend* is None and *cache_key* is an
+    empty string (never used).
     """
-    use_cache = _is_cacheable(pullspec) and _redis_available()
-    cache_key = _make_cache_key(pullspec, options) if use_cache else ""
-    return use_cache, cache_key
+    if not _is_cacheable(pullspec):
+        _count("uncacheable")
+        return None, ""
+    backend = _cache_backend()
+    if not backend:
+        _count("misses")
+        return None, ""
+    return backend, _make_cache_key(pullspec, options)
 
 
 def _redis_get(cache_key: str, pullspec: str) -> Optional[str]:
@@ -136,6 +226,140 @@ def _redis_set(cache_key: str, value: str, pullspec: str) -> None:
         logger.debug("Redis cache write failed for %s", pullspec, exc_info=True)
 
 
+def _disk_get(cache_key: str, pullspec: str) -> Optional[str]:
+    """Try to read a cached value from the on-disk cache. Returns None on miss, expiry or error."""
+    path = _get_disk_cache_dir() / f"{cache_key.replace(':', '_')}.json"
+    try:
+        if time.time() - path.stat().st_mtime > _CACHE_EXPIRY_SECONDS:
+            return None
+        value = path.read_text()
+        logger.debug("Disk cache hit for oc image info: %s", pullspec)
+        return value
+    except FileNotFoundError:
+        return None
+    except OSError:
+        logger.debug("Disk cache read failed for %s", pullspec, exc_info=True)
+        return None
+
+
+def _disk_prune(cache_dir: Path) -> None:
+    """Remove expired entries and abandoned temporary files from the on-disk cache, once per process.
+    Entries are otherwise only expired when read, so the directory would grow without bound.
+    """
+    with _pruned_disk_cache_dirs_lock:
+        if cache_dir in _pruned_disk_cache_dirs:
+            return
+        _pruned_disk_cache_dirs.add(cache_dir)
+    now = time.time()
+    removed = 0
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith(_DISK_CACHE_FILE_PREFIX):
+                    continue
+                expiry = _DISK_CACHE_TMP_EXPIRY_SECONDS if entry.name.endswith(".tmp") else _CACHE_EXPIRY_SECONDS
+                try:
+                    if now - entry.stat().st_mtime > expiry:
+                        os.unlink(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass  # removed by a concurrent prune
+    except OSError:
+        logger.debug("Disk cache prune failed for %s", cache_dir, exc_info=True)
+    if removed:
+        logger.debug("Pruned %s expired entries from the oc image info disk cache", removed)
+
+
+def _disk_set(cache_key: str, value: str, pullspec: str) -> None:
+    """Atomically write a value to the on-disk cache. Errors are logged and swallowed."""
+    cache_dir = _get_disk_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _disk_prune(cache_dir)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=_DISK_CACHE_FILE_PREFIX, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(value)
+            os.replace(tmp_path, cache_dir / f"{cache_key.replace(':', '_')}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        logger.debug("Disk cache write failed for %s", pullspec, exc_info=True)
+
+
+def _cache_get(backend: str, cache_key: str, pullspec: str) -> Optional[str]:
+    """Read a cached value from the given backend, counting the hit or miss."""
+    if backend == "redis":
+        cached = _redis_get(cache_key, pullspec)
+    else:
+        cached = _disk_get(cache_key, pullspec)
+    _count(f"{backend}_hits" if cached is not None else "misses")
+    return cached
+
+
+def _cache_set(backend: str, cache_key: str, value: str, pullspec: str) -> None:
+    """Write a value to the given backend."""
+    if backend == "redis":
+        _redis_set(cache_key, value, pullspec)
+    else:
+        _disk_set(cache_key, value, pullspec)
+
+
+def _resolved_pullspec(pullspec: str, stdout: str) -> Optional[str]:
+    """Return the digest-pinned equivalent of a tag-based *pullspec*, given its ``oc image info`` output.
+
+    For a manifest list the list digest is used, which yields the same output for the same options
+    (e.g. ``--filter-by-os``) as the tag did.
+    """
+    try:
+        info = json.loads(stdout)
+    except ValueError:
+        return None
+    if isinstance(info, list):
+        info = info[0] if info else {}
+    if not isinstance(info, dict):
+        return None
+    digest = info.get("listDigest") or info.get("digest")
+    if not digest or not digest.startswith("sha256:"):
+        return None
+    repo = pullspec.split("@", 1)[0]
+    name_start = repo.rfind("/") + 1
+    tag_start = repo.rfind(":")
+    if tag_start >= name_start:
+        repo = repo[:tag_start]
+    return f"{repo}@{digest}"
+
+
+def _renamed_output(stdout: str, pullspec: str, resolved: str) -> str:
+    """Return ``oc image info`` output for *pullspec* as it would read for *resolved*, i.e. with the image
+    names replaced.
+    """
+    info = json.loads(stdout)
+    for entry in info if isinstance(info, list) else [info]:
+        if isinstance(entry, dict) and entry.get("name") == pullspec:
+            entry["name"] = resolved
+    return json.dumps(info, indent=2)
+
+
+def _store_resolved(pullspec: str, options: Tuple[str, ...], stdout: str) -> None:
+    """Cache the output of a tag-based lookup under the digest the tag resolved to."""
+    resolved = _resolved_pullspec(pullspec, stdout)
+    if not resolved:
+        return
+    backend = _cache_backend()
+    if backend:
+        _cache_set(backend, _make_cache_key(resolved, options), _renamed_output(stdout, pullspec, resolved), resolved)
+
+
+def _split_batch(pullspecs: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Deduplicate *pullspecs* into tag-based and digest-pinned lists, preserving order."""
+    unique = list(dict.fromkeys(pullspecs))
+    tagged = [p for p in unique if "@sha256:" not in p]
+    pinned = [p for p in unique if "@sha256:" in p]
+    return tagged, pinned
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -149,9 +373,10 @@ def oc_image_info__cached(
 ) -> str:
     """Run ``oc image info -o json [options] <pullspec>`` and return stdout.
 
-    When the pullspec contains ``@sha256:`` and Redis credentials are present,
-    the raw output is cached so that subsequent calls — even from different
-    processes — skip the registry round-trip.
+    When the pullspec contains ``@sha256:`` and Redis credentials are present
+    (or an on-disk cache directory is configured), the raw output is cached so
+    that subsequent calls — even from different processes — skip the registry
+    round-trip. Output for a tag is cached under the digest the tag resolved to.
 
     Retries up to 3 times (with a 10 s wait) before giving up.
 
@@ -164,10 +389,10 @@ def oc_image_info__cached(
     :returns: Raw JSON stdout from ``oc image info``.
     :raises ChildProcessError: If the command fails after all retry attempts.
     """
-    use_cache, cache_key = _cache_context(pullspec, options)
+    backend, cache_key = _cache_context(pullspec, options)
 
-    if use_cache:
-        cached = _redis_get(cache_key, pullspec)
+    if backend:
+        cached = _cache_get(backend, cache_key, pullspec)
         if cached is not None:
             return cached
 
@@ -175,8 +400,10 @@ def oc_image_info__cached(
     if rc != 0:
         raise ChildProcessError(f"oc image info failed (rc={rc}): {stderr}")
 
-    if use_cache:
-        _redis_set(cache_key, stdout, pullspec)
+    if backend:
+        _cache_set(backend, cache_key, stdout, pullspec)
+    elif "@sha256:" not in pullspec:
+        _store_resolved(pullspec, options, stdout)
 
     return stdout
 
@@ -209,10 +436,10 @@ async def oc_image_info__cached_async(
     Uses synchronous Redis calls (which are extremely fast for simple
     GET/SET operations) to keep a single code path for cache logic.
     """
-    use_cache, cache_key = _cache_context(pullspec, options)
+    backend, cache_key = _cache_context(pullspec, options)
 
-    if use_cache:
-        cached = _redis_get(cache_key, pullspec)
+    if backend:
+        cached = _cache_get(backend, cache_key, pullspec)
         if cached is not None:
             return cached
 
@@ -223,8 +450,10 @@ async def oc_image_info__cached_async(
     if rc != 0:
         raise ChildProcessError(f"oc image info failed (rc={rc}): {stderr}")
 
-    if use_cache:
-        _redis_set(cache_key, stdout, pullspec)
+    if backend:
+        _cache_set(backend, cache_key, stdout, pullspec)
+    elif "@sha256:" not in pullspec:
+        _store_resolved(pullspec, options, stdout)
 
     return stdout
 
@@ -244,3 +473,52 @@ async def oc_image_info__cached_async__lru(
     doozer run).
     """
     return await oc_image_info__cached_async(pullspec, *options, registry_config=registry_config)
+
+
+async def oc_image_info_many__cached_async(
+    pullspecs: Iterable[str],
+    *options: str,
+    registry_config: Optional[str] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> Dict[str, Union[str, BaseException]]:
+    """Run ``oc image info`` for many pullspecs with at most *concurrency* processes at once.
+
+    Duplicate pullspecs are looked up once. Tag-based pullspecs are looked up first, so that
+    digest-pinned pullspecs of the same images can be served from what the tags resolved to.
+
+    :returns: Map of each pullspec to its raw JSON stdout, or to the exception its lookup raised.
+    """
+    tagged, pinned = _split_batch(pullspecs)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _lookup(pullspec: str) -> str:
+        async with semaphore:
+            return await oc_image_info__cached_async__lru(pullspec, *options, registry_config=registry_config)
+
+    results: Dict[str, Union[str, BaseException]] = {}
+    for phase in (tagged, pinned):
+        outputs = await asyncio.gather(*(_lookup(p) for p in phase), return_exceptions=True)
+        results.update(zip(phase, outputs))
+    return results
+
+
+def oc_image_info_many__cached(
+    pullspecs: Iterable[str],
+    *options: str,
+    registry_config: Optional[str] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> Dict[str, Union[str, BaseException]]:
+    """Sync variant of :func:`oc_image_info_many__cached_async`, using a pool of threads."""
+    tagged, pinned = _split_batch(pullspecs)
+
+    def _lookup(pullspec: str) -> Union[str, BaseException]:
+        try:
+            return oc_image_info__cached__lru(pullspec, *options, registry_config=registry_config)
+        except Exception as e:
+            return e
+
+    results: Dict[str, Union[str, BaseException]] = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for phase in (tagged, pinned):
+            results.update(zip(phase, executor.map(_lookup, phase)))
+    return results
@@ -26,8 +26,11 @@ from artcommonlib.constants import (
 from artcommonlib.exectools import cmd_gather_async, limit_concurrency
 from artcommonlib.model import ListModel, Missing
 from artcommonlib.oc_image_info import (
+    DEFAULT_BATCH_CONCURRENCY,
     oc_image_info__cached__lru,
     oc_image_info__cached_async__lru,
+    oc_image_info_many__cached,
+    oc_image_info_many__cached_async,
 )
 from artcommonlib.release_util import isolate_el_version_in_release
 from ruamel.yaml import YAML
@@ -1167,6 +1170,50 @@ def oc_image_info(
     return json.loads(out)
 
 
+def _parse_oc_image_info_results(
+    results: Dict[str, Union[str, BaseException]],
+    strict: bool,
+) -> Dict[str, Union[Dict, List[Dict], None]]:
+    """Parse the raw results of a batch lookup, applying the same error handling as oc_image_info."""
+    parsed = {}
+    for pullspec, out in results.items():
+        if isinstance(out, ChildProcessError):
+            err_msg = str(out)
+            if not strict and 'manifest unknown' in err_msg.lower():
+                parsed[pullspec] = None
+                continue
+            raise IOError(err_msg) from out
+        if isinstance(out, BaseException):
+            raise out
+        parsed[pullspec] = json.loads(out)
+    return parsed
+
+
+def oc_image_info_many(
+    pullspecs: Iterable[str],
+    *options,
+    registry_config: Optional[str] = None,
+    strict: bool = True,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> Dict[str, Union[Dict, List[Dict], None]]:
+    """
+    Returns the parsed JSON output of `oc image info` for each of the specified pullspecs.
+
+    Duplicate pullspecs are looked up once, and at most `concurrency` lookups run at a time.
+    Caching is the same as for oc_image_info.
+
+    :param pullspecs: Image pullspecs
+    :param options: Extra oc image info flags applied to every lookup (e.g., '--filter-by-os=amd64')
+    :param registry_config: Path to registry auth config file
+    :param strict: If True, raise IOError on errors. If False, map pullspecs with "manifest unknown" errors to None.
+    :param concurrency: Maximum number of concurrent lookups
+    :return: Map of pullspec to parsed JSON output (dict or list), or None if strict=False and the image doesn't exist
+    :raises IOError: If any lookup fails and strict=True
+    """
+    results = oc_image_info_many__cached(pullspecs, *options, registry_config=registry_config, concurrency=concurrency)
+    return _parse_oc_image_info_results(results, strict)
+
+
 def oc_image_info_for_arch(
     pullspec: str,
     go_arch: str = 'amd64',
@@ -1241,6 +1288,30 @@ async def oc_image_info_async(
     return json.loads(out)
 
 
+async def oc_image_info_many_async(
+    pullspecs: Iterable[str],
+    *options,
+    registry_config: Optional[str] = None,
+    strict: bool = True,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> Dict[str, Union[Dict, List[Dict], None]]:
+    """
+    Async version of oc_image_info_many.
+
+    :param pullspecs: Image pullspecs
+    :param options: Extra oc image info flags applied to every lookup (e.g., '--filter-by-os=amd64')
+    :param registry_config: Path to registry auth config file
+    :param strict: If True, raise IOError on errors. If False, map pullspecs with "manifest unknown" errors to None.
+    :param concurrency: Maximum number of concurrent lookups
+    :return: Map of pullspec to parsed JSON output (dict or list), or None if strict=False and the image doesn't exist
+    :raises IOError: If any lookup fails and strict=True
+    """
+    results = await oc_image_info_many__cached_async(
+        pullspecs, *options, registry_config=registry_config, concurrency=concurrency
+    )
+    return _parse_oc_image_info_results(results, strict)
+
+
 async def oc_image_info_for_arch_async(
     pullspec: str,
     go_arch: str = 'amd64',
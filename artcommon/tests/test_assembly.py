@@ -1,8 +1,11 @@
+import copy
 from datetime import datetime, timezone
 from unittest import TestCase
 
 import yaml
 from artcommonlib.assembly import (
+    AssemblyMemberOverrides,
+    _merge_into,
     _merger,
     assembly_basis_event,
     assembly_config_struct,
@@ -532,6 +535,50 @@ releases:
         except Exception as e:
             self.fail(f'Expected ValueError on assembly infinite recursion but got: {type(e)}: {e}')
 
+    def test_assembly_member_overrides(self):
+        index = AssemblyMemberOverrides.get(self.releases_config, 'ART_6', 'rpm')
+        self.assertIs(AssemblyMemberOverrides.get(self.releases_config, 'ART_6', 'rpm'), index)
+        self.assertIsNot(AssemblyMemberOverrides.get(self.releases_config, 'ART_6', 'image'), index)
+
+        # The ART_2 override applies before the ART_6 wildcard; other members only get the wildcard
+        self.assertEqual(
+            [o['content']['source']['git']['branch']['target'] for o in index.overrides_for('openshift-kuryr')],
+            ['2_hash', 'customer_6'],
+        )
+        self.assertEqual(len(index.overrides_for('other')), 1)
+
+        # Members must not share state with each other or with the index
+        meta_config = Model({'name': 'other', 'content': {'source': {'git': {'branch': {'target': 'main'}}}}})
+        config = assembly_metadata_config(self.releases_config, 'ART_6', 'rpm', 'other', meta_config)
+        self.assertEqual(config.content.source.git.branch.target, 'customer_6')
+        config.content.source.git.branch.target = 'mutated'
+        self.assertEqual(meta_config.content.source.git.branch.target, 'main')
+        config = assembly_metadata_config(self.releases_config, 'ART_6', 'rpm', 'another', Model({}))
+        self.assertEqual(config.content.source.git.branch.target, 'customer_6')
+
+        # Assemblies added to releases_config in place are seen once the indexes are invalidated
+        self.releases_config.releases['ART_NEW'] = {
+            'assembly': {
+                'basis': {'assembly': 'ART_6'},
+                'members': {'rpms': [{'distgit_key': 'other', 'metadata': {'content': {'mode': 'new'}}}]},
+            }
+        }
+        AssemblyMemberOverrides.invalidate(self.releases_config)
+        self.assertIsNot(AssemblyMemberOverrides.get(self.releases_config, 'ART_6', 'rpm'), index)
+        config = assembly_metadata_config(self.releases_config, 'ART_NEW', 'rpm', 'other', meta_config)
+        self.assertEqual(config.content.mode, 'new')
+        self.assertEqual(config.content.source.git.branch.target, 'customer_6')
+
+    def test_merge_into(self):
+        cases = [
+            ({'a': [3, 1], 'b': {'c!': {'x': 1}, 'd?': 2, 'e-': None}}, {'a': [2], 'b': {'c': {'y': 2}, 'e': 1}}),
+            ({'k': 'v', 'l': [{'x': 1}]}, {'k': {'nested': True}, 'l': [{'x': 1}, {'y': 2}]}),
+            ({'d?': 'new'}, {'d': 'old'}),
+        ]
+        for a, b in cases:
+            expected = _merger(a, b)
+            self.assertEqual(_merge_into(a, copy.deepcopy(b)), expected)
+
     def test_assembly_excluded_components_no_assembly(self):
         self.assertEqual(assembly_excluded_components(self.releases_config, None, 'image'), set())
         self.assertEqual(assembly_excluded_components(self.releases_config, '', 'image'), set())
@@ -76,6 +76,20 @@ class TestSelect(TestBigQuery):
         await self.client.select(order_by_clause=order_by_clause)
         query_mock.assert_called_once_with('SELECT * FROM `builds` ORDER BY `start_time` ASC')
 
+    @patch('artcommonlib.bigquery.BigQueryClient.query_async')
+    async def test_latest_per(self, query_mock):
+        where_clauses = [Column('name', String).in_(['ironic', 'ose-installer-artifacts'])]
+        order_by_clause = Column('start_time', quote=True).desc()
+        await self.client.select(where_clauses=where_clauses, order_by_clause=order_by_clause, latest_per='name')
+        query_mock.assert_called_once_with(
+            "SELECT * FROM `builds` WHERE name IN ('ironic', 'ose-installer-artifacts') "
+            "QUALIFY ROW_NUMBER() OVER (PARTITION BY `name` ORDER BY `start_time` DESC) = 1 "
+            "ORDER BY `start_time` DESC"
+        )
+
+        with self.assertRaises(AssertionError):
+            await self.client.select(order_by_clause=order_by_clause, latest_per='name')
+
     @patch('artcommonlib.bigquery.BigQueryClient.query_async')
     async def test_limit(self, query_mock):
         await self.client.select(limit=None)
@@ -0,0 +1,62 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from artcommonlib import gitdata
+from artcommonlib.gitdata import GitData
+
+
+class TestGitDataLoadData(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.data_dir = Path(self.tmp.name, 'data')
+        self.cache_dir = Path(self.tmp.name, 'cache')
+        images = self.data_dir / 'images'
+        images.mkdir(parents=True)
+        (images / 'foo.yml').write_text('name: foo\nversion: "{MAJOR}.{MINOR}"\n')
+        (images / 'bar.yaml').write_text('name: bar\nmode: disabled\n')
+        (images / 'README.md').write_text('not data')
+
+    def _gitdata(self, cache_dir=None):
+        data = GitData(parse_cache_dir=cache_dir)
+        data.data_dir = str(self.data_dir)
+        return data
+
+    def test_load_data(self):
+        result = self._gitdata().load_data(
+            path='images',
+            replace_vars={'MAJOR': 4, 'MINOR': 18},
+            filter_funcs=lambda name, data: data.get('mode') != 'disabled',
+        )
+        self.assertEqual(list(result), ['foo'])
+        self.assertEqual(result['foo'].data, {'name': 'foo', 'version': '4.18'})
+        self.assertEqual(result['foo'].path, str(self.data_dir / 'images' / 'foo.yml'))
+
+    def test_load_data_parse_error(self):
+        (self.data_dir / 'images' / 'bad.yml').write_text('key: [unterminated\n')
+        with self.assertRaisesRegex(ValueError, 'error parsing file .*bad.yml'):
+            self._gitdata().load_data(path='images')
+
+    def test_load_data_cache(self):
+        data = self._gitdata(self.cache_dir)
+        first = data.load_data(path='images', replace_vars={'MAJOR': 4, 'MINOR': 18})
+        self.assertEqual(len(list(self.cache_dir.rglob('*.pickle'))), 2)
+
+        # Warm loads are served from the cache without parsing anything
+        with patch.object(gitdata, 'parse_yaml', side_effect=AssertionError('should not parse')):
+            second = self._gitdata(self.cache_dir).load_data(path='images', replace_vars={'MAJOR': 4, 'MINOR': 18})
+        self.assertEqual({k: v.data for k, v in second.items()}, {k: v.data for k, v in first.items()})
+        self.assertIsNot(second['foo'].data, first['foo'].data)
+
+        # Different substitution variables or file content get their own entries
+        other = data.load_data(path='images', key='foo', replace_vars={'MAJOR': 4, 'MINOR': 19})
+        self.assertEqual(other.data['version'], '4.19')
+        (self.data_dir / 'images' / 'bar.yaml').write_text('name: bar\nmode: enabled\n')
+        self.assertEqual(data.load_data(path='images', key='bar').data['mode'], 'enabled')
+        self.assertEqual(len(list(self.cache_dir.rglob('*.pickle'))), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import asyncio
+import tempfile
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import MagicMock, patch
 
@@ -12,7 +14,7 @@ from artcommonlib.konflux.konflux_build_record import (
     KonfluxBundleBuildRecord,
     KonfluxFbcBuildRecord,
 )
-from artcommonlib.konflux.konflux_db import CacheRecordsType, KonfluxDb
+from artcommonlib.konflux.konflux_db import SNAPSHOT_REFRESH_OVERLAP, BuildCache, CacheRecordsType, KonfluxDb
 from google.cloud.bigquery import SchemaField
 
 
@@ -20,8 +22,10 @@ class TestKonfluxDB(IsolatedAsyncioTestCase):
     @patch('os.environ', {'GOOGLE_APPLICATION_CREDENTIALS': ''})
     @patch('artcommonlib.bigquery.bigquery.Client')
     def setUp(self, _):
-        # Clear the shared cache before each test to ensure test isolation
+        # Clear the shared cache before each test to ensure test isolation; drop the instance as well,
+        # since some tests replace its methods or point it at a temporary snapshot directory
         KonfluxDb.clear_shared_cache()
+        KonfluxDb._shared_cache = None
 
         self.db = KonfluxDb()
         self.db.bind(KonfluxBuildRecord)
@@ -552,8 +556,8 @@ class TestKonfluxDB(IsolatedAsyncioTestCase):
         from_row_mock.side_effect = builds
 
         mock_response = MagicMock()
-        mock_response.total_rows = 1
-        mock_response.__iter__ = MagicMock(return_value=iter([MagicMock()]))
+        mock_response.total_rows = 2
+        mock_response.__iter__ = MagicMock(return_value=iter([MagicMock(), MagicMock()]))
         select_mock.return_value = mock_response
 
         results = await self.db.get_latest_builds(
@@ -561,10 +565,70 @@ class TestKonfluxDB(IsolatedAsyncioTestCase):
         )
 
         self.assertEqual(len(results), 2)
-        self.assertIn('ironic', [r.name for r in results if r])
-        self.assertIn('ose-installer-artifacts', [r.name for r in results if r])
-        # _ensure_group_cached should be called once per component
-        self.assertEqual(ensure_cached_mock.call_count, 2)
+        self.assertEqual([r.name for r in results], ['ironic', 'ose-installer-artifacts'])
+        # The group cache is loaded once, and both cache misses are resolved by a single batched query
+        ensure_cached_mock.assert_called_once()
+        select_mock.assert_called_once()
+        self.assertEqual(select_mock.call_args.kwargs['latest_per'], 'name')
+
+    @patch('artcommonlib.konflux.konflux_db.KonfluxDb._ensure_group_cached')
+    @patch('artcommonlib.bigquery.BigQueryClient.select')
+    async def test_get_latest_builds_batches_cache_misses(self, select_mock, ensure_cached_mock):
+        """Test that cache misses are resolved with one query per window for all pending names"""
+        ensure_cached_mock.return_value = None
+        group = 'openshift-4.18'
+        now = datetime.now(tz=timezone.utc)
+
+        def _build(name, days_ago):
+            return KonfluxBuildRecord(
+                name=name,
+                version='1.0.0',
+                release='1.el9',
+                group=group,
+                assembly='stream',
+                start_time=now - timedelta(days=days_ago),
+            )
+
+        cached_build = _build('cached', 1)
+        self.db.cache.add_builds([cached_build], group, cache_type=CacheRecordsType.ALL_COLUMNS)
+        recent_build = _build('recent', 2)
+        older_build = _build('older', 10)
+
+        def _response(builds):
+            response = MagicMock()
+            response.__iter__ = MagicMock(return_value=iter(builds))
+            return response
+
+        # 7-day window finds 'recent', 14-day window finds 'older', 'missing' is never found
+        select_mock.side_effect = [_response([recent_build]), _response([older_build])] + [
+            _response([]) for _ in range(5)
+        ]
+
+        with patch.object(self.db, 'from_result_row', side_effect=lambda b: b):
+            results = await self.db.get_latest_builds(
+                names=['recent', 'cached', 'older', 'missing', 'recent'], group=group
+            )
+
+        self.assertEqual(results, [recent_build, cached_build, older_build, None, recent_build])
+        self.assertEqual(select_mock.call_count, 7)
+        pending_names = [
+            next(c.right.value for c in call.kwargs['where_clauses'] if getattr(c.left, 'name', None) == 'name')
+            for call in select_mock.call_args_list
+        ]
+        self.assertEqual(pending_names[0], ['recent', 'older', 'missing'])
+        self.assertEqual(pending_names[1], ['older', 'missing'])
+        self.assertEqual(pending_names[2], ['missing'])
+
+        # Found builds were added to the cache
+        self.assertEqual(
+            self.db.cache.get_by_name('older', group, cache_type=CacheRecordsType.ALL_COLUMNS), older_build
+        )
+
+        select_mock.reset_mock()
+        select_mock.side_effect = [_response([]) for _ in range(7)]
+        with patch.object(self.db, 'from_result_row', side_effect=lambda b: b):
+            with self.assertRaises(IOError):
+                await self.db.get_latest_builds(names=['missing'], group=group, strict=True)
 
     @patch('artcommonlib.konflux.konflux_db.KonfluxDb._ensure_group_cached')
     @patch('artcommonlib.konflux.konflux_db.datetime')
@@ -872,3 +936,146 @@ class TestKonfluxDB(IsolatedAsyncioTestCase):
             )
             # BigQuery should have been called since cache had wrong outcome
             select_mock.assert_called_once()
+
+    def test_cache_snapshot_round_trip(self):
+        """Test that a saved snapshot restores the cached builds and drops builds outside the window"""
+        group = 'openshift-4.18'
+        now = datetime.now(tz=timezone.utc)
+        recent_build = KonfluxBuildRecord(
+            name='test-build', version='1.0.0', release='2.el8', group=group, start_time=now - timedelta(days=1)
+        )
+        old_build = KonfluxBuildRecord(
+            name='test-build', version='1.0.0', release='1.el8', group=group, start_time=now - timedelta(days=40)
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = self.db.cache
+            cache.snapshot_dir = Path(tmpdir)
+            cache.add_builds([recent_build, old_build], group)
+            cache.save_snapshot(group, KonfluxBuildRecord, full_load_bytes=1000, full_load_seconds=5.0)
+            cache.clear()
+
+            snapshot = cache.load_snapshot(group, KonfluxBuildRecord, not_before=now - timedelta(days=30))
+            self.assertEqual(snapshot.newest, recent_build.start_time)
+            self.assertEqual(snapshot.record_ids, {recent_build.record_id})
+            self.assertEqual(snapshot.full_load_bytes, 1000)
+            self.assertEqual(cache.get_by_nvr(recent_build.nvr, group).record_id, recent_build.record_id)
+            self.assertIsNone(cache.get_by_nvr(old_build.nvr, group))
+
+            # Snapshots from a different table are not loaded
+            cache.clear()
+            self.assertIsNone(cache.load_snapshot(group, KonfluxBundleBuildRecord))
+            self.assertFalse(cache.is_group_loaded(group))
+
+            # Snapshots stamped with another schema level are discarded
+            with patch('artcommonlib.konflux.konflux_db.SCHEMA_LEVEL', 2):
+                self.assertIsNone(cache.load_snapshot(group, KonfluxBuildRecord))
+
+    @patch('artcommonlib.bigquery.BigQueryClient.select')
+    async def test_ensure_group_cached_refreshes_snapshot(self, select_mock):
+        """Test that a cached group snapshot is refreshed with builds newer than its watermark only"""
+        group = 'openshift-4.18'
+        now = datetime.now(tz=timezone.utc)
+        first_build = KonfluxBuildRecord(
+            name='test-build', version='1.0.0', release='1.el8', group=group, start_time=now - timedelta(days=2)
+        )
+        second_build = KonfluxBuildRecord(
+            name='test-build', version='1.0.0', release='2.el8', group=group, start_time=now - timedelta(hours=1)
+        )
+
+        def _response(builds, total_bytes_processed):
+            response = MagicMock()
+            response.__iter__ = MagicMock(return_value=iter(builds))
+            response.total_bytes_processed = total_bytes_processed
+            return response
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.object(self.db, 'from_result_row', side_effect=lambda b: b):
+            self.db.cache.snapshot_dir = Path(tmpdir)
+
+            # First load: full window, snapshot written
+            select_mock.return_value = _response([first_build], 1000)
+            await self.db._ensure_group_cached(group, cache_type=CacheRecordsType.SMALL_COLUMNS)
+            self.assertTrue(self.db.cache.snapshot_path(group, CacheRecordsType.SMALL_COLUMNS, 'builds').exists())
+
+            # Second process: snapshot loaded, only newer builds fetched (including an overlapping duplicate)
+            self.db.cache.clear(group)
+            select_mock.reset_mock()
+            select_mock.return_value = _response([second_build, first_build], 100)
+            await self.db._ensure_group_cached(group, cache_type=CacheRecordsType.SMALL_COLUMNS)
+
+            where_clauses = select_mock.call_args.kwargs['where_clauses']
+            self.assertEqual(where_clauses[1].right.value, first_build.start_time - SNAPSHOT_REFRESH_OVERLAP)
+            self.assertEqual(self.db.cache.get_group_cache(group)['total_builds'], 2)
+            self.assertEqual(self.db.cache.get_by_name('test-build', group).nvr, second_build.nvr)
+
+            stats = self.db.cache_stats()
+            self.assertEqual(stats['small_columns_snapshot']['loads'], 1)
+            self.assertEqual(stats['small_columns_snapshot']['saves'], 2)
+            self.assertEqual(stats['small_columns_snapshot']['bytes_saved'], 900)
+
+    def test_cache_get_by_name_indexed_filters(self):
+        """Test that get_by_name picks the newest build across composite keys and honors completed_before"""
+        cache = self.db.cache
+        group = 'openshift-4.18'
+        base = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+        def _build(release, hours, **kwargs):
+            return KonfluxBuildRecord(
+                name='test-build',
+                version='1.0.0',
+                release=release,
+                group=group,
+                start_time=base + timedelta(hours=hours),
+                **kwargs,
+            )
+
+        el8_success = _build('1.el8', 0, el_target='el8', assembly='stream')
+        el9_success = _build('2.el9', 1, el_target='el9', assembly='stream')
+        el9_failure = _build('3.el9', 2, el_target='el9', assembly='stream', outcome=KonfluxBuildOutcome.FAILURE)
+        el9_embargoed = _build('4.el9', 3, el_target='el9', assembly='stream', embargoed=True)
+        cache.add_builds([el8_success, el9_failure, el9_embargoed, el9_success], group)
+
+        self.assertEqual(cache.get_by_name('test-build', group).nvr, el9_embargoed.nvr)
+        self.assertEqual(
+            cache.get_by_name('test-build', group, outcome=KonfluxBuildOutcome.FAILURE).nvr, el9_failure.nvr
+        )
+        self.assertEqual(cache.get_by_name('test-build', group, el_target='el8').nvr, el8_success.nvr)
+        self.assertEqual(cache.get_by_name('test-build', group, embargoed=False).nvr, el9_failure.nvr)
+        self.assertEqual(
+            cache.get_by_name('test-build', group, outcome='success', embargoed=False).nvr, el9_success.nvr
+        )
+        self.assertIsNone(cache.get_by_name('test-build', group, assembly='4.18.1'))
+
+        # completed_before excludes builds started at or after the cut-off; naive datetimes are treated as UTC
+        self.assertEqual(
+            cache.get_by_name('test-build', group, completed_before=base + timedelta(hours=2)).nvr, el9_success.nvr
+        )
+        self.assertEqual(
+            cache.get_by_name('test-build', group, completed_before=datetime(2024, 1, 1, 11, 0, 0)).nvr,
+            el8_success.nvr,
+        )
+        self.assertIsNone(cache.get_by_name('test-build', group, completed_before=base))
+
+    def test_cache_get_by_name_tie_break(self):
+        """Test that builds started at the same time are chosen by record id, whatever order they were added in"""
+        group = 'openshift-4.18'
+        start_time = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+        def _build(release, record_id, **kwargs):
+            build = KonfluxBuildRecord(
+                name='test-build', version='1.0.0', release=release, group=group, start_time=start_time, **kwargs
+            )
+            build.record_id = record_id
+            return build
+
+        builds = [
+            _build('1.el9', 'record-c', el_target='el9'),
+            _build('2.el8', 'record-a', el_target='el8'),
+            _build('3.el9', 'record-b', el_target='el9'),
+        ]
+        for order in (builds, builds[::-1]):
+            cache = BuildCache()
+            cache.add_builds(order[:1], group)
+            cache.add_builds(order[1:], group)
+            self.assertEqual(cache.get_by_name('test-build', group).nvr, 'test-build-1.0.0-2.el8')
+            self.assertEqual(cache.get_by_name('test-build', group, el_target='el9').nvr, 'test-build-1.0.0-3.el9')
@@ -0,0 +1,91 @@
+import copy
+import json
+import pathlib
+import pickle
+import unittest
+
+from artcommonlib.model import FrozenListModel, FrozenModel, ListModel, Missing, Model, ModelException, freeze
+from artcommonlib.util import deep_merge
+
+
+class TestFrozenModel(unittest.TestCase):
+    def setUp(self):
+        self.raw = {
+            'name': 'foo',
+            'owners': ['a@example.com', 'b@example.com'],
+            'content': {'source': {'git': {'url': 'x', 'branch': {'target': 'main'}}}},
+            'enabled': True,
+            'count': 1,
+        }
+
+    def test_read_access(self):
+        frozen = freeze(Model(self.raw))
+        self.assertIsInstance(frozen, Model)
+        self.assertIsInstance(frozen.owners, ListModel)
+        self.assertEqual(frozen, self.raw)
+        self.assertEqual(frozen.content.source.git.branch.target, 'main')
+        self.assertIs(frozen.missing.deeper, Missing)
+        self.assertIs(frozen['missing'], Missing)
+        self.assertEqual(frozen.owners[1], 'b@example.com')
+        self.assertIsInstance(frozen.owners[:1], FrozenListModel)
+        self.assertEqual(frozen.primitive(), self.raw)
+        self.assertNotIsInstance(frozen.primitive()['content'], FrozenModel)
+        self.assertEqual(Model(frozen).primitive(), self.raw)
+        self.assertIs(FrozenModel(self.raw), frozen)
+
+    def test_immutable(self):
+        frozen = freeze(self.raw)
+        with self.assertRaises(ModelException):
+            frozen.name = 'bar'
+        with self.assertRaises(ModelException):
+            frozen.content.update({'x': 1})
+        with self.assertRaises(ModelException):
+            frozen.owners.append('c@example.com')
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        self.assertIs(pickle.loads(pickle.dumps(frozen)), frozen)
+
+    def test_hash_consing(self):
+        frozen = freeze(self.raw)
+        other = freeze({'name': 'bar', 'content': copy.deepcopy(self.raw['content'])})
+        self.assertIs(other.content, frozen.content)
+        self.assertEqual(hash(freeze(copy.deepcopy(self.raw))), hash(frozen))
+        # Equal but differently typed values are not conflated
+        self.assertIsNot(freeze({'enabled': 1}), freeze({'enabled': True}))
+        self.assertIs(type(freeze({'enabled': True}).enabled), bool)
+
+    def test_canonical_json(self):
+        raw = dict(self.raw, path=pathlib.Path('/a'), nested=[{'z': 1.0, 'a': None}, [], {}], unicode='é')
+
+        def default(o):
+            return f"<<non-serializable: {type(o).__qualname__}>>"
+
+        self.assertEqual(freeze(raw).canonical_json(), json.dumps(raw, sort_keys=True, default=default))
+        raw = {10: 'ten', 2: 'two'}
+        self.assertEqual(freeze(raw).canonical_json(), json.dumps(raw, sort_keys=True))
+
+    def test_copy_on_write(self):
+        frozen = freeze(self.raw)
+
+        changed = frozen.set_in(['content', 'source', 'git', 'url'], 'y')
+        self.assertEqual(changed.content.source.git.url, 'y')
+        self.assertEqual(frozen.content.source.git.url, 'x')
+        self.assertIs(changed.owners, frozen.owners)
+        self.assertIs(changed.content.source.git.branch, frozen.content.source.git.branch)
+        self.assertIs(frozen.set_in(['name'], 'foo'), frozen)
+        self.assertEqual(frozen.set_in(['new', 'key'], {'a': [1]}).new.key.a, [1])
+
+        removed = frozen.delete_in(['content', 'source', 'git'])
+        self.assertEqual(removed.content.source, {})
+        self.assertIs(removed.owners, frozen.owners)
+        self.assertIs(frozen.delete_in(['content', 'missing', 'key']), frozen)
+        self.assertIs(frozen.delete_in(['name', 'key']), frozen)
+
+        overlay = {'content': {'source': {'git': {'url': 'z'}}}, 'owners': ['c@example.com']}
+        merged = frozen.deep_merged(overlay)
+        self.assertEqual(merged, deep_merge(self.raw, overlay))
+        self.assertIs(merged.content.source.git.branch, frozen.content.source.git.branch)
+        self.assertIs(frozen.deep_merged({'name': 'foo'}), frozen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from artcommonlib import oc_image_info, util
+from tenacity import wait_none
+
+REPO = "quay.io/org/repo"
+DIGEST = "sha256:" + "a" * 64
+LIST_DIGEST = "sha256:" + "b" * 64
+IMAGE_INFO = json.dumps({"digest": DIGEST, "listDigest": LIST_DIGEST, "config": {}})
+
+
+class TestOcImageInfoCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        oc_image_info.set_disk_cache_dir(self.tmp_dir.name)
+        oc_image_info.reset_cache_stats()
+        oc_image_info.oc_image_info__cached__lru.cache_clear()
+        oc_image_info.oc_image_info__cached_async__lru.cache_clear()
+        env = patch.dict("os.environ", {"REDIS_SERVER_PASSWORD": ""})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        oc_image_info.set_disk_cache_dir(None)
+        self.tmp_dir.cleanup()
+
+    def test_resolved_pullspec(self):
+        self.assertEqual(
+            oc_image_info._resolved_pullspec(f"{REPO}:latest", IMAGE_INFO),
+            f"{REPO}@{LIST_DIGEST}",
+        )
+        self.assertEqual(
+            oc_image_info._resolved_pullspec("localhost:5000/repo:v1", json.dumps([{"digest": DIGEST}])),
+            f"localhost:5000/repo@{DIGEST}",
+        )
+        self.assertEqual(
+            oc_image_info._resolved_pullspec("localhost:5000/repo", json.dumps({"digest": DIGEST})),
+            f"localhost:5000/repo@{DIGEST}",
+        )
+        self.assertIsNone(oc_image_info._resolved_pullspec(f"{REPO}:latest", "not json"))
+
+    @patch("artcommonlib.exectools.cmd_gather")
+    def test_disk_cache_without_redis(self, cmd_gather):
+        cmd_gather.return_value = (0, IMAGE_INFO, "")
+        pullspec = f"{REPO}@{DIGEST}"
+        self.assertEqual(oc_image_info.oc_image_info__cached(pullspec, "--filter-by-os=amd64"), IMAGE_INFO)
+        self.assertEqual(oc_image_info.oc_image_info__cached(pullspec, "--filter-by-os=amd64"), IMAGE_INFO)
+        self.assertEqual(cmd_gather.call_count, 1)
+        # Options are part of the key
+        oc_image_info.oc_image_info__cached(pullspec, "--show-multiarch")
+        self.assertEqual(cmd_gather.call_count, 2)
+
+        stats = oc_image_info.get_cache_stats()
+        self.assertEqual(stats["disk_hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 3)
+
+    @patch("artcommonlib.exectools.cmd_gather")
+    def test_tag_lookup_seeds_digest_cache(self, cmd_gather):
+        cmd_gather.return_value = (0, json.dumps(dict(json.loads(IMAGE_INFO), name=f"{REPO}:latest")), "")
+        oc_image_info.oc_image_info__cached(f"{REPO}:latest", "--filter-by-os=amd64")
+        # The digest entry is named by the digest, as if it had been looked up by it
+        self.assertEqual(
+            json.loads(oc_image_info.oc_image_info__cached(f"{REPO}@{LIST_DIGEST}", "--filter-by-os=amd64")),
+            dict(json.loads(IMAGE_INFO), name=f"{REPO}@{LIST_DIGEST}"),
+        )
+        self.assertEqual(cmd_gather.call_count, 1)
+        self.assertEqual(oc_image_info.get_cache_stats()["uncacheable"], 1)
+
+    @patch("artcommonlib.exectools.cmd_gather")
+    def test_disk_cache_pruned(self, cmd_gather):
+        cmd_gather.return_value = (0, IMAGE_INFO, "")
+        cache_dir = Path(self.tmp_dir.name)
+        expired = time.time() - oc_image_info._CACHE_EXPIRY_SECONDS - 1
+        for name in ("oc_image_info_v1_old.json", "oc_image_info_abandoned.tmp", "unrelated.json"):
+            cache_dir.joinpath(name).write_text("{}")
+            os.utime(cache_dir.joinpath(name), (expired, expired))
+        cache_dir.joinpath("oc_image_info_v1_fresh.json").write_text("{}")
+
+        oc_image_info.oc_image_info__cached(f"{REPO}@{DIGEST}")
+        # Expired entries are removed on the first write; other files in the directory are left alone
+        self.assertFalse(cache_dir.joinpath("oc_image_info_v1_old.json").exists())
+        self.assertFalse(cache_dir.joinpath("oc_image_info_abandoned.tmp").exists())
+        self.assertTrue(cache_dir.joinpath("oc_image_info_v1_fresh.json").exists())
+        self.assertTrue(cache_dir.joinpath("unrelated.json").exists())
+        self.assertEqual(len(list(cache_dir.glob("oc_image_info_v1_*.json"))), 2)
+
+    @patch.object(oc_image_info.oc_image_info__cached_async.retry, "wait", wait_none())
+    @patch("artcommonlib.exectools.cmd_gather_async", new_callable=AsyncMock)
+    async def test_oc_image_info_many_async(self, cmd_gather_async):
+        def _gather(cmd, check):
+            if cmd[-1].endswith(":missing"):
+                return 1, "", "error: manifest unknown"
+            return 0, IMAGE_INFO, ""
+
+        cmd_gather_async.side_effect = _gather
+        pullspecs = [f"{REPO}:latest", f"{REPO}:latest", f"{REPO}@{LIST_DIGEST}", f"{REPO}:missing"]
+        results = await util.oc_image_info_many_async(pullspecs, "--filter-by-os=amd64", strict=False)
+
+        self.assertEqual(set(results), set(pullspecs))
+        self.assertEqual(results[f"{REPO}:latest"]["digest"], DIGEST)
+        self.assertEqual(results[f"{REPO}@{LIST_DIGEST}"]["digest"], DIGEST)
+        self.assertIsNone(results[f"{REPO}:missing"])
+        # The tag is looked up once and the digest is served from what it resolved to;
+        # the missing image is retried before giving up
+        looked_up = [call.args[0][-1] for call in cmd_gather_async.call_args_list]
+        self.assertEqual(sorted(looked_up), [f"{REPO}:latest"] + [f"{REPO}:missing"] * 3)
+
+        with self.assertRaises(IOError):
+            await util.oc_image_info_many_async([f"{REPO}:missing"], "--filter-by-os=amd64")
+
+    @patch("artcommonlib.exectools.cmd_gather")
+    def test_oc_image_info_many(self, cmd_gather):
+        cmd_gather.return_value = (0, IMAGE_INFO, "")
+        results = util.oc_image_info_many([f"{REPO}@{DIGEST}", f"{REPO}@{DIGEST}"], "--show-multiarch")
+        self.assertEqual(results, {f"{REPO}@{DIGEST}": json.loads(IMAGE_INFO)})
+        self.assertEqual(cmd_gather.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
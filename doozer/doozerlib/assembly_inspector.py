@@ -581,6 +581,19 @@ class AssemblyInspector:
         member_rpm_names = {meta.rpm_name for meta in self.runtime.rpm_map.values()}
         with self.runtime.pooled_koji_client_session() as koji_api:
             builder = PlashetBuilder(koji_api, logger=self.runtime.logger)
+            tags = [tag for tag in tag_pv_map.keys() if tag not in cache]
+            el_versions = {artutil.isolate_el_version_in_brew_tag(tag) for tag in tags} - {None}
+            builder.prefetch(
+                [builder.tag_listing(tag, True, self.runtime.assembly, self.runtime.brew_event) for tag in tags],
+                builder.plan(
+                    el_versions,
+                    self.runtime.assembly,
+                    self.runtime.get_releases_config(),
+                    self.runtime.group_config,
+                    self.runtime.rpm_map,
+                    pinned_by_is=False,
+                ),
+            )
             for tag in tag_pv_map.keys():
                 if tag in cache:
                     continue
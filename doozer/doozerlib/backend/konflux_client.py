@@ -1449,6 +1449,7 @@ class KonfluxClient:
             namespace=namespace,
             cfg=self._config,
             watch_labels=watch_labels,
+            use_watch=True,
         )
 
         # Use the watcher to wait for the PipelineRun to complete
@@ -280,17 +280,47 @@ class KonfluxFbcImporter:
     ) -> List[Dict] | None:
         blobs = await retry(reraise=True, stop=stop_after_attempt(3), wait=wait_fixed(5))(opm.render)(
             index_image,
+            output_format="json",
             auth=self.auth,
             migrate_level=migrate_level,
             strict=strict,
         )
         return blobs
 
-    def _filter_catalog_blobs(self, blobs: List[Dict], allowed_package_names: Set[str]):
+    @alru_cache
+    async def _resolve_index_image(self, index_image: str, strict: bool = True) -> str:
+        """Pin an index image pullspec to the digest of its manifest list,
+        so that all packages imported in this run come from the same render of the same index.
+        """
+        if "@sha256:" in index_image or not self.auth or not self.auth.path:
+            return index_image  # already pinned, or oc can't use the opm credentials
+        try:
+            info = await util.oc_image_info_for_arch_async(index_image, registry_config=self.auth.path)
+        except ChildProcessError:
+            if strict:
+                raise
+            return index_image  # let opm render tell whether the image exists
+        digest = info.get("listDigest") or info["digest"]
+        repo, _, tag = index_image.rpartition(":")
+        if not repo or "/" in tag:  # no tag, but a registry port
+            repo = index_image
+        return f"{repo}@{digest}"
+
+    @alru_cache
+    async def _get_catalog_index(
+        self, index_image: str, migrate_level: str = "none", strict: bool = True
+    ) -> Dict[str, List[Dict[str, Any]]] | None:
+        """Render an index image once and index its catalog blobs by package name."""
+        blobs = await self._render_index_image(index_image, migrate_level=migrate_level, strict=strict)
+        if blobs is None:
+            return None
+        return self._filter_catalog_blobs(blobs, None)
+
+    def _filter_catalog_blobs(self, blobs: List[Dict], allowed_package_names: Optional[Set[str]]):
         """Filter catalog blobs by package names.
 
         :param blobs: List of catalog blobs.
-        :param allowed_package_names: Set of allowed package names.
+        :param allowed_package_names: Set of allowed package names. If None, all packages are allowed.
         :return: Dict of filtered catalog blobs.
         """
         filtered: Dict[str, List[Dict[str, Any]]] = {}  # key is package name, value is blobs
@@ -304,7 +334,7 @@ class KonfluxFbcImporter:
                     package_name = blob["package"]
             if not package_name:
                 raise IOError(f"Couldn't determine package name for unknown schema: {schema}")
-            if package_name not in allowed_package_names:
+            if allowed_package_names is not None and package_name not in allowed_package_names:
                 continue  # filtered out; skipping
             if package_name not in filtered:
                 filtered[package_name] = []
@@ -314,13 +344,11 @@ class KonfluxFbcImporter:
     async def _get_catalog_blobs_from_index_image(
         self, index_image: str, package_name: str, migrate_level: str = "none", strict: bool = True
     ) -> list[dict[str, Any]] | None:
-        blobs = await self._render_index_image(index_image, migrate_level=migrate_level, strict=strict)
-        if blobs is None:
-            return None
-        filtered_blobs = self._filter_catalog_blobs(blobs, {package_name})
-        if package_name not in filtered_blobs:
+        index_image = await self._resolve_index_image(index_image, strict=strict)
+        catalog_index = await self._get_catalog_index(index_image, migrate_level=migrate_level, strict=strict)
+        if catalog_index is None:
             return None
-        return filtered_blobs[package_name]
+        return catalog_index.get(package_name)
 
     async def _get_package_name(self, metadata: ImageMetadata) -> str:
         """Get OLM package name of the given OLM operator
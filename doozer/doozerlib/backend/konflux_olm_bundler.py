@@ -25,7 +25,7 @@ from artcommonlib.konflux.konflux_db import Engine, KonfluxDb
 from artcommonlib.model import Model
 from artcommonlib.util import sync_to_quay
 from dockerfile_parse import DockerfileParser
-from doozerlib import constants, util
+from doozerlib import constants
 from doozerlib.backend.build_repo import BuildRepo
 from doozerlib.backend.konflux_client import KonfluxClient
 from doozerlib.backend.pipelinerun_utils import PipelineRunInfo
@@ -385,7 +385,6 @@ class KonfluxOlmBundleRebaser:
         pattern = KonfluxOlmBundleRebaser._get_image_reference_pattern(old_registry)
         matches = pattern.finditer(content)
         art_references = {}  # map of image pullspec to (namespace, image_short_name, image_tag)
-        image_info_tasks = []
         for match in matches:
             pullspec = match.group(0)
             namespace, image_short_name = match.group(1).rsplit('/', maxsplit=1)
@@ -393,29 +392,22 @@ class KonfluxOlmBundleRebaser:
             art_references[pullspec] = (namespace, image_short_name, image_tag)
 
         # Get image infos for ART-built images
+        build_pullspecs = {}  # map of image pullspec to the pullspec of its build
+        registry_config = os.getenv("QUAY_AUTH_FILE") if engine is Engine.KONFLUX else None
         for pullspec, (namespace, image_short_name, image_tag) in art_references.items():
             if engine is Engine.KONFLUX:
-                build_pullspec = f"{self.image_repo}:{image_short_name}-{image_tag}"
-                image_info_tasks.append(
-                    asyncio.create_task(
-                        util.oc_image_info_for_arch_async(
-                            build_pullspec,
-                            registry_config=os.getenv("QUAY_AUTH_FILE"),
-                        )
-                    )
-                )
+                build_pullspecs[pullspec] = f"{self.image_repo}:{image_short_name}-{image_tag}"
             elif engine is Engine.BREW:
-                build_pullspec = (
+                build_pullspecs[pullspec] = (
                     f"{constants.REGISTRY_PROXY_BASE_URL}/rh-osbs/{namespace}-{image_short_name}:{image_tag}"
                 )
-                image_info_tasks.append(
-                    asyncio.create_task(
-                        util.oc_image_info_for_arch_async(
-                            build_pullspec,
-                        )
-                    )
-                )
-        image_infos = await asyncio.gather(*image_info_tasks)
+        # A CSV often references the same image many times; look up each build once
+        build_image_infos = await artlib_util.oc_image_info_many_async(
+            build_pullspecs.values(),
+            '--filter-by-os=amd64',
+            registry_config=registry_config,
+        )
+        image_infos = [build_image_infos[build_pullspecs[pullspec]] for pullspec in art_references]
 
         # Replace ART-built image references in the content
         csv_namespace = self._group_config.get('csv_namespace', 'openshift')
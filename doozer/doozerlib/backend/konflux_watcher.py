@@ -9,6 +9,7 @@ import traceback
 from typing import Dict, List, Optional, Tuple
 
 from dateutil import parser
+from kubernetes import watch
 from kubernetes.client import ApiClient, Configuration, CoreV1Api
 from kubernetes.dynamic import DynamicClient
 
@@ -25,6 +26,11 @@ class KonfluxWatcher:
     This class uses a singleton pattern per namespace+config_file combination to efficiently
     poll multiple PipelineRuns from the same doozer invocation using a single daemon thread.
 
+    In watch mode (use_watch=True), the thread lists PipelineRuns once and then follows a watch
+    stream from the listed resourceVersion, so waiters are notified as soon as a PipelineRun changes.
+    The watch is resumed from bookmarks, and PipelineRuns are listed again if the resourceVersion
+    has expired (410 Gone).
+
     The watcher automatically removes PipelineRuns from the cache if they disappear from the
     cluster before reaching a terminal state. This prevents callers from waiting indefinitely
     on a PLR that will never update.
@@ -39,12 +45,20 @@ class KonfluxWatcher:
     # Maximum time for a pod to stay pending before cancelling the PipelineRun
     DEFAULT_POD_PENDING_TIMEOUT = datetime.timedelta(hours=2)
 
+    # In watch mode, the number of seconds after which the API server ends each watch request.
+    # The watch is then resumed from the last resourceVersion seen.
+    WATCH_TIMEOUT_SECONDS = 60
+    # Pods do not generate PipelineRun events; in watch mode, the pods of PipelineRuns still running are
+    # refreshed (and timeouts checked) at this interval. Pods are always refreshed upon termination.
+    WATCH_POD_REFRESH_INTERVAL = datetime.timedelta(minutes=2)
+
     def __init__(
         self,
         namespace: str,
         cfg: Configuration,
         event_loop: asyncio.AbstractEventLoop,
         watch_labels: Optional[Dict[str, str]] = None,
+        use_watch: bool = False,
     ):
         """
         Initialize a KonfluxWatcher.
@@ -53,6 +67,7 @@ class KonfluxWatcher:
         :param cfg: Kubernetes Configuration object
         :param event_loop: The asyncio event loop (required)
         :param watch_labels: Optional dict of labels to filter PipelineRuns. If None, watches all PipelineRuns in namespace.
+        :param use_watch: If True, follow a watch stream instead of listing PipelineRuns every minute.
         """
         if not event_loop:
             raise ValueError("event_loop is required")
@@ -81,17 +96,24 @@ class KonfluxWatcher:
 
         # Daemon thread
         self._stop_event = threading.Event()
-        self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True, name=f"KonfluxWatcher-{namespace}")
+        self.use_watch = use_watch
+        self._poll_thread = threading.Thread(
+            target=self._watch_loop if use_watch else self._poll_loop,
+            daemon=True,
+            name=f"KonfluxWatcher-{namespace}",
+        )
         self._poll_thread.start()
 
         label_desc = f"labels={watch_labels}" if watch_labels else "all PipelineRuns"
-        self._logger.info(f"Started KonfluxWatcher polling for namespace={namespace}, {label_desc}")
+        mode_desc = "watching" if use_watch else "polling"
+        self._logger.info(f"Started KonfluxWatcher {mode_desc} for namespace={namespace}, {label_desc}")
 
     @staticmethod
     async def get_shared_watcher(
         namespace: str,
         cfg: Configuration,
         watch_labels: Optional[Dict[str, str]] = None,
+        use_watch: bool = False,
     ) -> "KonfluxWatcher":
         """
         Get or create a shared KonfluxWatcher instance.
@@ -99,6 +121,7 @@ class KonfluxWatcher:
         :param namespace: The Kubernetes namespace
         :param cfg: Kubernetes Configuration object
         :param watch_labels: Optional dict of labels to filter PipelineRuns. If None, watches all PipelineRuns in namespace.
+        :param use_watch: If True, a newly created watcher follows a watch stream instead of polling.
         :return: A shared KonfluxWatcher instance
         """
         # Get the current event loop
@@ -118,7 +141,7 @@ class KonfluxWatcher:
 
         with KonfluxWatcher._instances_lock:
             if key not in KonfluxWatcher._instances:
-                KonfluxWatcher._instances[key] = KonfluxWatcher(namespace, cfg, loop, watch_labels)
+                KonfluxWatcher._instances[key] = KonfluxWatcher(namespace, cfg, loop, watch_labels, use_watch)
             return KonfluxWatcher._instances[key]
 
     def _poll_loop(self):
@@ -150,109 +173,235 @@ class KonfluxWatcher:
     def _poll_pipelineruns(self):
         """Poll PipelineRuns with optional label filtering."""
         try:
-            # Get the API for PipelineRun
-            api = self.dyn_client.resources.get(api_version="tekton.dev/v1", kind="PipelineRun")
-            pod_api = self.dyn_client.resources.get(api_version="v1", kind="Pod")
-
-            # Build label selector from watch_labels dict
-            label_selector = None
-            if self._watch_labels:
-                label_selector = ",".join([f"{k}={v}" for k, v in self._watch_labels.items()])
-
-            # List all PipelineRuns with the label selector
-            list_params = {
-                "namespace": self.namespace,
-                "_request_timeout": self.request_timeout,
-            }
-            if label_selector:
-                list_params["label_selector"] = label_selector
+            self._list_pipelineruns()
+        except Exception as e:
+            if not self._stop_event.is_set():
+                self._logger.error(f"Error polling PipelineRuns: {e}")
+                traceback.print_exc()
 
-            pipelineruns = api.get(**list_params)
+    def _get_label_selector(self) -> Optional[str]:
+        """Build label selector from watch_labels dict."""
+        if not self._watch_labels:
+            return None
+        return ",".join([f"{k}={v}" for k, v in self._watch_labels.items()])
 
-            # Track which PLRs we've seen in this poll
-            seen_plrs = set()
+    def _list_pipelineruns(self) -> Optional[str]:
+        """
+        List PipelineRuns (and their pods) into the cache and notify waiters.
 
-            for plr_instance in pipelineruns.items:
-                pipelinerun_name = plr_instance.metadata.name
-                seen_plrs.add(pipelinerun_name)
-                pipelinerun_dict = plr_instance.to_dict()
+        :return: The resourceVersion of the list, from which a watch can be started
+        """
+        # Get the API for PipelineRun
+        api = self.dyn_client.resources.get(api_version="tekton.dev/v1", kind="PipelineRun")
+        pod_api = self.dyn_client.resources.get(api_version="v1", kind="Pod")
 
-                # Update cache
-                with self._cache_lock:
-                    self._pipelinerun_cache[pipelinerun_name] = pipelinerun_dict
+        # List all PipelineRuns with the label selector
+        list_params = {
+            "namespace": self.namespace,
+            "_request_timeout": self.request_timeout,
+        }
+        label_selector = self._get_label_selector()
+        if label_selector:
+            list_params["label_selector"] = label_selector
 
-                    # Initialize pod cache for this PLR if needed
-                    if pipelinerun_name not in self._pod_cache:
-                        self._pod_cache[pipelinerun_name] = {}
+        pipelineruns = api.get(**list_params)
 
-                    # Fetch associated pods
-                    try:
-                        pods = pod_api.get(
-                            namespace=self.namespace,
-                            label_selector=f"tekton.dev/pipelineRun={pipelinerun_name}",
-                            _request_timeout=self.request_timeout,
-                        )
+        # Track which PLRs we've seen in this poll
+        seen_plrs = set()
 
-                        for pod_instance in pods.items:
-                            # Create temporary PodInfo to use its parsing capabilities
-                            temp_pod_info = PodInfo(pod_instance)
-                            pod_name = temp_pod_info.name
-                            if pod_name:
-                                pod_dict = temp_pod_info.to_dict()
-                                container_logs = {}
-
-                                # Only fetch logs for pods that are not in a successful/pending/running state.
-                                # We only collect container logs for containers which failed.
-                                if temp_pod_info.phase not in ["Succeeded", "Pending", "Running"]:
-                                    # Check all containers (init and regular) for failures
-                                    for container in temp_pod_info.get_all_containers():
-                                        if container.is_failed:
-                                            # Fetch logs for failed containers
-                                            try:
-                                                log_content = self.corev1_client.read_namespaced_pod_log(
-                                                    name=pod_name,
-                                                    namespace=self.namespace,
-                                                    container=container.name,
-                                                    _request_timeout=self.request_timeout,
-                                                )
-                                                container_logs[container.name] = log_content
-                                                self._logger.debug(
-                                                    f"Fetched logs for pod {pod_name} container {container.name}"
-                                                )
-                                            except Exception as log_err:
-                                                self._logger.warning(
-                                                    f"Failed to fetch logs for pod {pod_name} container {container.name}: {log_err}"
-                                                )
-
-                                # Store/update pod info
-                                if pod_name not in self._pod_cache[pipelinerun_name]:
-                                    self._pod_cache[pipelinerun_name][pod_name] = (pod_dict, container_logs)
-                                else:
-                                    # Update with latest snapshot (pod may have progressed)
-                                    # Merge logs - keep any previously fetched logs
-                                    existing_dict, existing_logs = self._pod_cache[pipelinerun_name][pod_name]
-                                    merged_logs = {**existing_logs, **container_logs}
-                                    self._pod_cache[pipelinerun_name][pod_name] = (pod_dict, merged_logs)
+        for plr_instance in pipelineruns.items:
+            pipelinerun_name = plr_instance.metadata.name
+            seen_plrs.add(pipelinerun_name)
+            pipelinerun_dict = plr_instance.to_dict()
 
-                    except Exception as e:
-                        self._logger.warning(f"Error fetching pods for PipelineRun {pipelinerun_name}: {e}")
+            # Update cache
+            with self._cache_lock:
+                self._pipelinerun_cache[pipelinerun_name] = pipelinerun_dict
+                self._refresh_pods(pipelinerun_name, pod_api)
 
-                # Check for timeouts and cancel if needed
-                self._cancel_if_timed_out(pipelinerun_name, pipelinerun_dict, api)
+            # Check for timeouts and cancel if needed
+            self._cancel_if_timed_out(pipelinerun_name, pipelinerun_dict, api)
 
-                # Log PLR status with pod information
-                self._log_pipelinerun_status(pipelinerun_name, pipelinerun_dict)
+            # Log PLR status with pod information
+            self._log_pipelinerun_status(pipelinerun_name, pipelinerun_dict)
 
-            # Clean up PLRs that disappeared before reaching terminal state
-            self._cleanup_disappeared_pipelineruns(seen_plrs)
+        # Clean up PLRs that disappeared before reaching terminal state
+        self._cleanup_disappeared_pipelineruns(seen_plrs)
 
-            # Notify any waiters
-            self._notify_waiters()
+        # Notify any waiters
+        self._notify_waiters()
 
-        except Exception as e:
-            if not self._stop_event.is_set():
-                self._logger.error(f"Error polling PipelineRuns: {e}")
+        return pipelineruns.metadata.resourceVersion
+
+    def _refresh_pods(self, pipelinerun_name: str, pod_api):
+        """Fetch the pods of a PipelineRun into the pod cache, along with logs of failed containers."""
+        with self._cache_lock:
+            # Initialize pod cache for this PLR if needed
+            if pipelinerun_name not in self._pod_cache:
+                self._pod_cache[pipelinerun_name] = {}
+
+            # Fetch associated pods
+            try:
+                pods = pod_api.get(
+                    namespace=self.namespace,
+                    label_selector=f"tekton.dev/pipelineRun={pipelinerun_name}",
+                    _request_timeout=self.request_timeout,
+                )
+
+                for pod_instance in pods.items:
+                    # Create temporary PodInfo to use its parsing capabilities
+                    temp_pod_info = PodInfo(pod_instance)
+                    pod_name = temp_pod_info.name
+                    if pod_name:
+                        pod_dict = temp_pod_info.to_dict()
+                        container_logs = {}
+
+                        # Only fetch logs for pods that are not in a successful/pending/running state.
+                        # We only collect container logs for containers which failed.
+                        if temp_pod_info.phase not in ["Succeeded", "Pending", "Running"]:
+                            # Check all containers (init and regular) for failures
+                            for container in temp_pod_info.get_all_containers():
+                                if container.is_failed:
+                                    # Fetch logs for failed containers
+                                    try:
+                                        log_content = self.corev1_client.read_namespaced_pod_log(
+                                            name=pod_name,
+                                            namespace=self.namespace,
+                                            container=container.name,
+                                            _request_timeout=self.request_timeout,
+                                        )
+                                        container_logs[container.name] = log_content
+                                        self._logger.debug(
+                                            f"Fetched logs for pod {pod_name} container {container.name}"
+                                        )
+                                    except Exception as log_err:
+                                        self._logger.warning(
+                                            f"Failed to fetch logs for pod {pod_name} container {container.name}: {log_err}"
+                                        )
+
+                        # Store/update pod info
+                        if pod_name not in self._pod_cache[pipelinerun_name]:
+                            self._pod_cache[pipelinerun_name][pod_name] = (pod_dict, container_logs)
+                        else:
+                            # Update with latest snapshot (pod may have progressed)
+                            # Merge logs - keep any previously fetched logs
+                            existing_dict, existing_logs = self._pod_cache[pipelinerun_name][pod_name]
+                            merged_logs = {**existing_logs, **container_logs}
+                            self._pod_cache[pipelinerun_name][pod_name] = (pod_dict, merged_logs)
+
+            except Exception as e:
+                self._logger.warning(f"Error fetching pods for PipelineRun {pipelinerun_name}: {e}")
+
+    def _watch_loop(self):
+        """Main loop of watch mode that runs in a daemon thread."""
+        resource_version = None
+        next_pod_refresh = 0.0
+        while not self._stop_event.is_set():
+            try:
+                if resource_version is None:
+                    # (Re)establish the full state, then watch for changes from there
+                    resource_version = self._list_pipelineruns()
+                    next_pod_refresh = time.monotonic() + self.WATCH_POD_REFRESH_INTERVAL.total_seconds()
+
+                resource_version = self._watch_pipelineruns(resource_version)
+
+                if time.monotonic() >= next_pod_refresh:
+                    self._refresh_running_pipelineruns()
+                    next_pod_refresh = time.monotonic() + self.WATCH_POD_REFRESH_INTERVAL.total_seconds()
+
+            except Exception as e:
+                status = getattr(e, "status", None)
+                if status == 410:
+                    # The resourceVersion we were watching from has been compacted away
+                    self._logger.info(f"Watch on namespace={self.namespace} expired; listing PipelineRuns again")
+                    resource_version = None
+                    continue
+                if status in (403, 405):
+                    self._logger.warning(f"Cannot watch PipelineRuns ({e}); falling back to polling")
+                    self._poll_loop()
+                    return
+                if self._stop_event.is_set():
+                    return
+                self._logger.error(f"Error in watch loop: {e}")
                 traceback.print_exc()
+                resource_version = None
+                # Wait before retrying on error
+                self._stop_event.wait(10)
+
+    def _watch_pipelineruns(self, resource_version: Optional[str]) -> Optional[str]:
+        """
+        Follow the PipelineRun watch stream from resource_version until the server ends the request.
+
+        :return: The resourceVersion to resume watching from
+        """
+        api = self.dyn_client.resources.get(api_version="tekton.dev/v1", kind="PipelineRun")
+        pod_api = self.dyn_client.resources.get(api_version="v1", kind="Pod")
+
+        stream_params = {
+            "namespace": self.namespace,
+            "resource_version": resource_version,
+            "timeout_seconds": self.WATCH_TIMEOUT_SECONDS,
+            "serialize": False,
+            "query_params": [("allowWatchBookmarks", "true")],
+            "_request_timeout": self.WATCH_TIMEOUT_SECONDS + 30,
+        }
+        label_selector = self._get_label_selector()
+        if label_selector:
+            stream_params["label_selector"] = label_selector
+
+        watcher = watch.Watch()
+        for event in watcher.stream(api.get, **stream_params):
+            if self._stop_event.is_set():
+                watcher.stop()
+                break
+
+            pipelinerun_dict = event["raw_object"]
+            metadata = pipelinerun_dict.get("metadata", {})
+            resource_version = metadata.get("resourceVersion") or resource_version
+            if event["type"] == "BOOKMARK":
+                continue
+
+            pipelinerun_name = metadata["name"]
+            if event["type"] == "DELETED":
+                self._cleanup_disappeared_pipelinerun(pipelinerun_name)
+            else:
+                self._observe_pipelinerun(pipelinerun_name, pipelinerun_dict, api, pod_api)
+            self._notify_waiters()
+
+        return resource_version
+
+    def _observe_pipelinerun(self, pipelinerun_name: str, pipelinerun_dict: Dict, api, pod_api):
+        """Record a PipelineRun received from the watch stream."""
+        with self._cache_lock:
+            previous_dict = self._pipelinerun_cache.get(pipelinerun_name)
+        became_terminal = PipelineRunInfo(pipelinerun_dict, {}).is_terminal() and not (
+            previous_dict and PipelineRunInfo(previous_dict, {}).is_terminal()
+        )
+        if became_terminal or pipelinerun_name not in self._pod_cache:
+            # Capture the final state of the pods (and logs of failed containers) before waiters can observe it
+            self._refresh_pods(pipelinerun_name, pod_api)
+        with self._cache_lock:
+            self._pipelinerun_cache[pipelinerun_name] = pipelinerun_dict
+
+        self._cancel_if_timed_out(pipelinerun_name, pipelinerun_dict, api)
+        self._log_pipelinerun_status(pipelinerun_name, pipelinerun_dict)
+
+    def _refresh_running_pipelineruns(self):
+        """Refresh the pods of PipelineRuns which have not terminated, and check them for timeouts."""
+        api = self.dyn_client.resources.get(api_version="tekton.dev/v1", kind="PipelineRun")
+        pod_api = self.dyn_client.resources.get(api_version="v1", kind="Pod")
+        with self._cache_lock:
+            running = {
+                name: pipelinerun_dict
+                for name, pipelinerun_dict in self._pipelinerun_cache.items()
+                if not PipelineRunInfo(pipelinerun_dict, {}).is_terminal()
+            }
+        for pipelinerun_name, pipelinerun_dict in running.items():
+            self._refresh_pods(pipelinerun_name, pod_api)
+            self._cancel_if_timed_out(pipelinerun_name, pipelinerun_dict, api)
+            self._log_pipelinerun_status(pipelinerun_name, pipelinerun_dict)
+        if running:
+            self._notify_waiters()
 
     def _log_pipelinerun_status(self, pipelinerun_name: str, pipelinerun_dict: Dict):
         """Log the status of a PipelineRun and its pods."""
@@ -357,19 +506,25 @@ class KonfluxWatcher:
             cached_plr_names = list(self._pipelinerun_cache.keys())
             for plr_name in cached_plr_names:
                 if plr_name not in seen_plrs:
-                    # PLR wasn't seen in this poll - check if it's non-terminal
-                    pipelinerun_dict = self._pipelinerun_cache[plr_name]
-                    info = PipelineRunInfo(pipelinerun_dict, {})
-                    if not info.is_terminal():
-                        # Non-terminal PLR has disappeared - remove from cache
-                        self._logger.error(
-                            f"PipelineRun {plr_name} disappeared before reaching terminal state. "
-                            f"Last known status: {info.find_condition('Succeeded')}"
-                        )
-                        del self._pipelinerun_cache[plr_name]
-                        # Also clean up pod cache for this PLR
-                        if plr_name in self._pod_cache:
-                            del self._pod_cache[plr_name]
+                    self._cleanup_disappeared_pipelinerun(plr_name)
+
+    def _cleanup_disappeared_pipelinerun(self, plr_name: str):
+        """Remove a PipelineRun that has disappeared from the cluster, unless it had reached a terminal state."""
+        with self._cache_lock:
+            pipelinerun_dict = self._pipelinerun_cache.get(plr_name)
+            if pipelinerun_dict is None:
+                return
+            info = PipelineRunInfo(pipelinerun_dict, {})
+            if not info.is_terminal():
+                # Non-terminal PLR has disappeared - remove from cache
+                self._logger.error(
+                    f"PipelineRun {plr_name} disappeared before reaching terminal state. "
+                    f"Last known status: {info.find_condition('Succeeded')}"
+                )
+                del self._pipelinerun_cache[plr_name]
+                # Also clean up pod cache for this PLR
+                if plr_name in self._pod_cache:
+                    del self._pod_cache[plr_name]
 
     def _notify_waiters(self):
         """Notify all async waiters about cache updates."""
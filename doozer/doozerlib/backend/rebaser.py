@@ -33,6 +33,7 @@ from doozerlib.repos import Repos
 from doozerlib.runtime import Runtime
 from doozerlib.source_modifications import SourceModifierFactory
 from doozerlib.source_resolver import SourceResolution, SourceResolver
+from doozerlib.tree_copy import copy_tree
 from opentelemetry import trace
 from tenacity import retry, stop_after_attempt, wait_fixed
 
@@ -583,17 +584,25 @@ class KonfluxRebaser:
 
     @retry(reraise=True, stop=stop_after_attempt(3), wait=wait_fixed(5))
     @start_as_current_span_async(TRACER, "rebase.recursive_overwrite")
-    async def _recursive_overwrite(self, src, dest, ignore=set()):
+    async def _recursive_overwrite(self, src, dest, ignore=set(), delete=False, protect=()):
         """
-        Use rsync to copy one file tree to a new location
+        Copy one file tree to a new location, leaving files whose content is already in place untouched.
+        With delete=True, entries of dest that are not in src (except top-level names in protect) are removed.
         """
 
         self._logger.info('Copying files from %s to %s', src, dest)
-        exclude = ' --exclude .git '
-        for i in ignore:
-            exclude += ' --exclude="{}" '.format(i)
-        cmd = 'rsync -av {} {}/ {}/'.format(exclude, src, dest)
-        await exectools.cmd_assert_async(cmd, suppress_output=True)
+        stats = await exectools.to_thread(
+            copy_tree, str(src), str(dest), ignore={'.git', *ignore}, delete=delete, protect=protect
+        )
+        self._logger.info(
+            'Copied %s files (%s bytes), skipped %s unchanged files (%s bytes) and removed %s entries in %s',
+            stats.copied_files,
+            stats.copied_bytes,
+            stats.skipped_files,
+            stats.skipped_bytes,
+            stats.removed,
+            dest,
+        )
 
     @start_as_current_span_async(TRACER, "rebase.merge_source")
     async def _merge_source(self, metadata: ImageMetadata, source: SourceResolution, source_dir: Path, dest_dir: Path):
@@ -621,18 +630,8 @@ class KonfluxRebaser:
         # ignore_list.extend(self._runtime.group_config.get('dist_git_ignore', []))
         # ignore_list.extend(metadata.config.get('dist_git_ignore', []))
 
-        for ent in dest_dir.iterdir():
-            if ent.name in ignore_list:
-                continue
-
-            # Otherwise, clean up the entry
-            if ent.is_file() or ent.is_symlink():
-                ent.unlink()
-            else:
-                await exectools.to_thread(shutil.rmtree, str(ent.resolve()))
-
         # Copy all files and overwrite where necessary
-        await self._recursive_overwrite(source_dir, dest_dir)
+        await self._recursive_overwrite(source_dir, dest_dir, delete=True, protect=ignore_list)
 
         df_path = dest_dir.joinpath('Dockerfile')
 
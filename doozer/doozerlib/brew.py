@@ -8,6 +8,7 @@ import json
 import threading
 import time
 import traceback
+from contextlib import contextmanager
 from datetime import datetime
 from multiprocessing import Lock
 from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
@@ -18,14 +19,18 @@ import koji_cli.lib
 import requests
 from artcommonlib import exectools, logutil
 from artcommonlib.model import Missing
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
 
 from doozerlib import constants
 
+from .koji_cache import DEFAULT_MAX_BYTES, KojiResultCache
 from .util import total_size
 
 logger = logutil.get_logger(__name__)
 
+# Maximum number of calls sent to koji in a single multiCall by KojiWrapper.batch
+MULTICALL_CHUNK_SIZE = 500
+
 # ============================================================================
 # Brew/Koji service interaction functions
 # ============================================================================
@@ -204,6 +209,16 @@ async def watch_tasks_async(
     return errors
 
 
+def _multicall(session: koji.ClientSession, strict: bool = True):
+    """
+    Returns a context manager collecting koji calls into multiCalls. KojiWrapper sessions get
+    a chunked, cache aware KojiWrapper.batch; other sessions fall back to koji's multicall.
+    """
+    if isinstance(session, KojiWrapper):
+        return session.batch(strict=strict)
+    return session.multicall(strict=strict)
+
+
 def get_build_objects(ids_or_nvrs, session):
     """Get information of multiple Koji/Brew builds
 
@@ -214,7 +229,7 @@ def get_build_objects(ids_or_nvrs, session):
     logger.debug("Fetching build info for {} from Koji/Brew...".format(ids_or_nvrs))
     # Use Koji multicall interface to boost performance. See https://pagure.io/koji/pull-request/957
     tasks = []
-    with session.multicall(strict=True) as m:
+    with _multicall(session) as m:
         for b in ids_or_nvrs:
             tasks.append(m.getBuild(b))
     return [task.result for task in tasks]
@@ -235,7 +250,7 @@ def get_latest_builds(
     :return: a list of lists of Koji/Brew build dicts
     """
     tasks = []
-    with session.multicall(strict=True) as m:
+    with _multicall(session) as m:
         for tag, component_name in tag_component_tuples:
             if not tag:
                 tasks.append(None)
@@ -264,7 +279,7 @@ def get_tagged_builds(
     :return: a list of lists of Koji/Brew build dicts
     """
     tasks = []
-    with session.multicall(strict=True) as m:
+    with _multicall(session) as m:
         for tag, component_name in tag_component_tuples:
             if not tag:
                 tasks.append(None)
@@ -273,6 +288,25 @@ def get_tagged_builds(
     return [task.result if task else None for task in tasks]
 
 
+def list_tagged_builds(
+    tag_listings: Iterable[Tuple[str, bool, bool, Optional[int]]],
+    build_type: Optional[str],
+    session: koji.ClientSession,
+) -> List[List[Dict]]:
+    """List the builds in multiple tags in a single multicall
+
+    :param tag_listings: List of (tag, latest, inherit, event) tuples, as passed to listTagged
+    :param build_type: if given, only retrieve specified build type (rpm, image)
+    :param session: instance of Brew session
+    :return: a list of lists of Koji/Brew build dicts
+    """
+    tasks = []
+    with _multicall(session) as m:
+        for tag, latest, inherit, event in tag_listings:
+            tasks.append(m.listTagged(tag, latest=latest, inherit=inherit, event=event, type=build_type))
+    return [task.result for task in tasks]
+
+
 def list_archives_by_builds(
     build_ids: List[int], build_type: str, session: koji.ClientSession
 ) -> List[Optional[List[Dict]]]:
@@ -283,7 +317,7 @@ def list_archives_by_builds(
     :return: a list of Koji/Brew archive lists (augmented with "rpms" entries for RPM lists)
     """
     tasks = []
-    with session.multicall(strict=True) as m:
+    with _multicall(session) as m:
         for build_id in build_ids:
             if not build_id:
                 tasks.append(None)
@@ -308,7 +342,7 @@ def get_builds_tags(build_nvrs, session=None):
     :return: a list of Koji/Brew tag lists
     """
     tasks = []
-    with session.multicall(strict=True) as m:
+    with _multicall(session) as m:
         for nvr in build_nvrs:
             tasks.append(m.listTags(build=nvr))
     return [task.result for task in tasks]
@@ -320,7 +354,7 @@ def list_image_rpms(image_ids: List[int], session: koji.ClientSession) -> List[O
     :param session: instance of Brew session
     :return: a list of Koji/Brew RPM lists
     """
-    with session.multicall(strict=True) as m:
+    with _multicall(session) as m:
         tasks = [m.listRPMs(imageID=image_id) for image_id in image_ids]
     return [task.result for task in tasks]
 
@@ -331,7 +365,7 @@ def list_build_rpms(build_ids: List[int], session: koji.ClientSession) -> List[O
     :param session: instance of Brew session
     :return: a list of Koji/Brew RPM lists
     """
-    with session.multicall(strict=True) as m:
+    with _multicall(session) as m:
         tasks = [m.listBuildRPMs(build) for build in build_ids]
     return [task.result for task in tasks]
 
@@ -341,6 +375,58 @@ latest_tag_change_events = {}
 cache_lock = Lock()
 
 
+def prefetch_tag_change_events(koji_client, tags: Iterable, inherit=True):
+    """
+    Looks up the latest tagging event of several tags at once (two batched koji round trips in total
+    rather than two calls per tag) and records them for has_tag_changed_since_build.
+    :param koji_client: A koji ClientSession.
+    :param tags: Tag names or tag ids which should be assessed.
+    :param inherit: If True, uses tag inheritance.
+    """
+    with cache_lock:
+        tags = [tag for tag in set(tags) if tag not in latest_tag_change_events]
+    if not tags:
+        return
+
+    # Note: There is an API 'tagHistory' that can do this, but (1) it is supposed to be
+    # deprecated and (2) it does not allow event=# to constrain its search (required
+    # to support --brew-event). So we use a combination of listTagged and queryHistory.
+
+    # The listTagged API will do much of this work for us. The reason is that it will report updates to
+    # a tag newest->oldest: https://pagure.io/koji/blob/fedf3ee9f9238ed74c34d51c5458a834732b3346/f/hub/kojihub.py#_1351
+    # In other words, listTagged('rhaos-4.7-rhel-8-build', latest=True, inherit=True)[0] describes a bulid that was
+    # most recently tagged into this tag (or inherited tags).
+    with _multicall(koji_client) as m:
+        tagged_calls = [m.listTagged(tag, latest=True, inherit=inherit) for tag in tags]
+
+    # We now have the builds that were tagged, but not WHEN they were tagged. They could have been built
+    # a long time ago, and recently tagged into the tag we care about. To figure this out, we
+    # need to query the tag_listing table.
+    history_calls = {}
+    with _multicall(koji_client) as m:
+        for tag, tagged_call in zip(tags, tagged_calls):
+            last_tagged_builds = tagged_call.result
+            if last_tagged_builds:
+                last_tagged_build = last_tagged_builds[0]
+                found_in_tag_name = last_tagged_build['tag_name']  # If using inheritance, this can differ from tag
+                # Example result of full queryHistory: https://gist.github.com/jupierce/943b845c07defe784522fd9fd76f4ab0
+                history_calls[tag] = m.queryHistory(
+                    table='tag_listing', tag=found_in_tag_name, build=last_tagged_build['build_id']
+                )
+
+    change_events = {}
+    for tag in tags:
+        latest_tag_change_event = {}
+        if tag in history_calls:
+            tag_listing = history_calls[tag].result['tag_listing']
+            tag_listing.sort(key=lambda event: event['create_event'])
+            latest_tag_change_event = tag_listing[-1]
+        change_events[tag] = latest_tag_change_event
+
+    with cache_lock:
+        latest_tag_change_events.update(change_events)
+
+
 def has_tag_changed_since_build(runtime, koji_client, build, tag, inherit=True) -> Dict:
     """
     :param runtime:  The doozer runtime
@@ -354,37 +440,9 @@ def has_tag_changed_since_build(runtime, koji_client, build, tag, inherit=True)
     build_nvr = build['nvr']
     build_event_id = build['creation_event_id']
 
+    prefetch_tag_change_events(koji_client, [tag], inherit=inherit)
     with cache_lock:
-        latest_tag_change_event = latest_tag_change_events.get(tag, None)
-
-    if latest_tag_change_event is None:
-        latest_tag_change_event = {}
-
-        # Note: There is an API 'tagHistory' that can do this, but (1) it is supposed to be
-        # deprecated and (2) it does not allow event=# to constrain its search (required
-        # to support --brew-event). So we use a combination of listTagged and queryHistory.
-
-        # The listTagged API will do much of this work for us. The reason is that it will report updates to
-        # a tag newest->oldest: https://pagure.io/koji/blob/fedf3ee9f9238ed74c34d51c5458a834732b3346/f/hub/kojihub.py#_1351
-        # In other words, listTagged('rhaos-4.7-rhel-8-build', latest=True, inherit=True)[0] describes a bulid that was
-        # most recently tagged into this tag (or inherited tags).
-        last_tagged_builds = koji_client.listTagged(tag, latest=True, inherit=inherit)
-        if last_tagged_builds:
-            last_tagged_build = last_tagged_builds[0]
-            # We now have the build that was tagged, but not WHEN it was tagged. It could have been built
-            # a long time ago, and recently tagged into the tag we care about. To figure this out, we
-            # need to query the tag_listing table.
-
-            found_in_tag_name = last_tagged_build['tag_name']  # If using inheritance, this can differ from tag
-            # Example result of full queryHistory: https://gist.github.com/jupierce/943b845c07defe784522fd9fd76f4ab0
-            tag_listing = koji_client.queryHistory(
-                table='tag_listing', tag=found_in_tag_name, build=last_tagged_build['build_id']
-            )['tag_listing']
-            tag_listing.sort(key=lambda event: event['create_event'])
-            latest_tag_change_event = tag_listing[-1]
-
-        with cache_lock:
-            latest_tag_change_events[tag] = latest_tag_change_event
+        latest_tag_change_event = latest_tag_change_events[tag]
 
     if latest_tag_change_event and latest_tag_change_event['create_event'] > build_event_id:
         runtime.logger.debug(
@@ -428,6 +486,44 @@ class KojiWrapperMetaReturn(object):
         self.cache_hit = cache_hit
 
 
+class KojiBatchCall(koji.VirtualCall):
+    """
+    A call queued on a KojiCallBatch. Like koji's VirtualCall, .result is available once the batch has executed.
+    """
+
+    def __init__(self, method, args, kwargs):
+        super().__init__(method, args, kwargs)
+        self.cache_hit = False
+
+
+class KojiCallBatch(object):
+    """
+    Collects koji calls (e.g. batch.getBuild(nvr)) to be executed together by KojiWrapper.batch.
+    """
+
+    def __init__(self, session: 'KojiWrapper', strict: bool, chunk_size: int):
+        self._session = session
+        self._strict = strict
+        self._chunk_size = chunk_size
+        self._calls: List[KojiBatchCall] = []
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def queue_call(*args, **kwargs):
+            call = KojiBatchCall(name, args, kwargs)
+            self._calls.append(call)
+            return call
+
+        return queue_call
+
+    def call_all(self) -> List[KojiBatchCall]:
+        calls, self._calls = self._calls, []
+        self._session.execute_batch(calls, strict=self._strict, chunk_size=self._chunk_size)
+        return calls
+
+
 class KojiWrapper(koji.ClientSession):
     """
     Using KojiWrapper adds the following to the normal ClientSession:
@@ -437,6 +533,8 @@ class KojiWrapper(koji.ClientSession):
           and results will be logged (the positional argument will not be passed to the koji server).
         - If opts.cached is True, the result will be cached and an identical invocation (also with caching=True)
           will return the cached value.
+    - batch() collects calls into chunked multiCalls which, unlike koji's multicall(), honor the result caches
+      per call.
     """
 
     """
@@ -453,6 +551,10 @@ class KojiWrapper(koji.ClientSession):
     # from the server. This cache is shared among all instances of the wrapper.
     _koji_wrapper_result_cache = {}
 
+    # Optional store, shared among all instances, which keeps the results of event-pinned read calls
+    # across invocations. See enable_persistent_cache.
+    _koji_wrapper_persistent_cache: Optional[KojiResultCache] = None
+
     # A list of methods which support receiving an event kwarg. See --brew-event CLI argument.
     methods_with_event = set(
         [
@@ -575,6 +677,29 @@ class KojiWrapper(koji.ClientSession):
         ]
     )
 
+    # Read-only safe_methods whose results are fully determined by their arguments, and can
+    # therefore be persisted across invocations once --brew-event is set.
+    persistable_safe_methods = set(
+        [
+            'getArchive',
+            'getArchiveType',
+            'getBuild',
+            'getBuildType',
+            'getEvent',
+            'getImageArchive',
+            'getImageBuild',
+            'getMavenArchive',
+            'getMavenBuild',
+            'getPackage',
+            'getPackageID',
+            'getRPM',
+            'getRPMHeaders',
+            'listArchives',
+            'listBuildRPMs',
+            'listRPMs',
+        ]
+    )
+
     def __init__(self, koji_session_args, brew_event=None, force_instance_caching=False):
         """
         See class description on what this wrapper provides.
@@ -604,6 +729,32 @@ class KojiWrapper(koji.ClientSession):
         with cls._koji_wrapper_lock:
             return total_size(cls._koji_wrapper_result_cache)
 
+    @classmethod
+    def enable_persistent_cache(cls, path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> KojiResultCache:
+        """
+        Persist the results of koji calls which cannot change for a pinned brew event (see
+        is_persistable_call) in a sqlite database at path, shared by all instances and across invocations.
+        """
+        with cls._koji_wrapper_lock:
+            if cls._koji_wrapper_persistent_cache:
+                cls._koji_wrapper_persistent_cache.close()
+            cls._koji_wrapper_persistent_cache = KojiResultCache(path, max_bytes=max_bytes)
+            return cls._koji_wrapper_persistent_cache
+
+    @classmethod
+    def disable_persistent_cache(cls):
+        with cls._koji_wrapper_lock:
+            if cls._koji_wrapper_persistent_cache:
+                cls._koji_wrapper_persistent_cache.close()
+            cls._koji_wrapper_persistent_cache = None
+
+    @classmethod
+    def get_persistent_cache_stats(cls) -> Optional[Dict]:
+        with cls._koji_wrapper_lock:
+            if not cls._koji_wrapper_persistent_cache:
+                return None
+            return cls._koji_wrapper_persistent_cache.stats()
+
     @classmethod
     def get_next_call_id(cls):
         with cls._koji_wrapper_lock:
@@ -635,6 +786,144 @@ class KojiWrapper(koji.ClientSession):
             cache_bucket = self._get_cache_bucket_unsafe()
             return cache_bucket.get(api_repr, return_on_miss)
 
+    def is_persistable_call(self, method_name, args) -> bool:
+        """
+        Whether the (already modified) invocation returns the same result every time, and may therefore be
+        stored in the persistent cache. This requires a brew event to be pinned: methods_with_event are
+        then constrained to that event, and persistable_safe_methods are immutable lookups by id.
+        """
+        if not self.___brew_event:
+            return False
+        if method_name == 'multiCall':
+            return all(self.is_persistable_call(call_dict['methodName'], ()) for call_dict in args[0])
+        if method_name in KojiWrapper.methods_with_event:
+            # Ignore the few methods with event that modify the server (e.g. newRepo)
+            return method_name.startswith(('get', 'list'))
+        return method_name in KojiWrapper.persistable_safe_methods
+
+    @staticmethod
+    def is_persistable_result(method_name, args, result) -> bool:
+        """
+        Whether a result of a persistable call may be stored. Missing entities may be created later and
+        builds may still change state, so only results describing settled data are kept.
+        """
+        if method_name == 'multiCall':
+            for call_dict, entry in zip(args[0], result):
+                if not isinstance(entry, list):  # A fault
+                    return False
+                if not KojiWrapper.is_persistable_result(call_dict['methodName'], (), entry[0]):
+                    return False
+            return True
+        if result is None:
+            return False
+        if method_name == 'getBuild':
+            return result.get('state') == koji.BUILD_STATES['COMPLETE']
+        return True
+
+    @staticmethod
+    def _get_caching_key(method_name, args, kwargs) -> str:
+        # We need a reproducible immutable key from a dict with nested dicts. json.dumps
+        # and sorting keys is a deterministic way of achieving this.
+        return json.dumps(
+            {
+                'method_name': method_name,
+                'args': args,
+                'kwargs': kwargs,
+            },
+            sort_keys=True,
+        )
+
+    def _get_persistent_caching_key(self, caching_key) -> str:
+        # Safe methods are not constrained by the event, so the event is part of the key
+        # to scope their results to it.
+        return json.dumps(
+            {
+                'hub': self.baseurl,
+                'event': self.___brew_event,
+                'call': caching_key,
+            },
+            sort_keys=True,
+        )
+
+    @contextmanager
+    def batch(self, strict: bool = True, chunk_size: int = MULTICALL_CHUNK_SIZE):
+        """
+        Like koji's multicall(), collects the calls made on the yielded KojiCallBatch and executes them when
+        the context exits; each call returns a KojiBatchCall whose .result is available afterwards.
+        Unlike multicall(), each call is individually constrained to --brew-event, looked up in and stored into
+        the result caches, and the remaining calls are sent in multiCalls of at most chunk_size calls.
+        :param strict: If True, raise the first fault encountered instead of only storing it in its call.
+        :param chunk_size: Maximum number of calls per multiCall round trip.
+        """
+        batch = KojiCallBatch(self, strict=strict, chunk_size=chunk_size)
+        yield batch
+        batch.call_all()
+
+    @retry(
+        reraise=True,
+        stop=stop_after_attempt(4),
+        wait=wait_fixed(5),
+        retry=retry_if_exception_type(requests.exceptions.ConnectionError),
+    )
+    def _call_multicall_chunk(self, formatted_calls: List[Dict]) -> List:
+        return super()._callMethod('multiCall', (formatted_calls,), {})
+
+    def execute_batch(self, calls: List[KojiBatchCall], strict: bool = True, chunk_size: int = MULTICALL_CHUNK_SIZE):
+        """
+        Executes queued calls, setting the result of each; see batch().
+        """
+        persistent_cache = KojiWrapper._koji_wrapper_persistent_cache
+        pending = []  # (call, kw_opts, caching_key, persistent_caching_key) of calls that must go to koji
+        for call in calls:
+            kw_opts = KojiWrapperOpts(caching=(KojiWrapper.force_global_caching or self.force_instance_caching))
+            args = self.modify_koji_call_params(call.method, call.args, kw_opts)
+            kwargs = self.modify_koji_call_kwargs(call.method, dict(call.kwargs), kw_opts)
+            call.args, call.kwargs = args, kwargs
+
+            caching_key = None
+            persistent_caching_key = None
+            use_persistent_caching = persistent_cache is not None and self.is_persistable_call(call.method, args)
+            if kw_opts.caching or use_persistent_caching:
+                caching_key = self._get_caching_key(call.method, args, kwargs)
+            result = Missing
+            if kw_opts.caching:
+                result = self._get_cache_result(caching_key, Missing)
+            if use_persistent_caching:
+                persistent_caching_key = self._get_persistent_caching_key(caching_key)
+                if result is Missing:
+                    result = persistent_cache.get(persistent_caching_key, Missing)
+                    if result is not Missing and kw_opts.caching:
+                        self._cache_result(caching_key, result)
+
+            if result is not Missing:
+                call.cache_hit = True
+                call._result = [KojiWrapperMetaReturn(result, cache_hit=True) if kw_opts.return_metadata else result]
+            else:
+                pending.append((call, kw_opts, caching_key, persistent_caching_key))
+
+        for i in range(0, len(pending), chunk_size):
+            chunk = pending[i : i + chunk_size]
+            my_id = KojiWrapper.get_next_call_id()
+            chunk_logger = next((kw_opts.logger for _, kw_opts, _, _ in chunk if kw_opts.logger), None)
+            if chunk_logger:
+                chunk_logger.info(f'koji-api-call-{my_id}: multiCall of {len(chunk)} batched calls')
+            entries = self._call_multicall_chunk([call.format() for call, _, _, _ in chunk])
+            for (call, kw_opts, caching_key, persistent_caching_key), entry in zip(chunk, entries):
+                if not isinstance(entry, list):  # A fault; raised when .result is accessed
+                    call._result = entry
+                    continue
+                result = entry[0]
+                if kw_opts.caching:
+                    self._cache_result(caching_key, result)
+                if persistent_caching_key and self.is_persistable_result(call.method, call.args, result):
+                    persistent_cache.put(persistent_caching_key, result)
+                call._result = [KojiWrapperMetaReturn(result, cache_hit=False) if kw_opts.return_metadata else result]
+
+        if strict:
+            for call in calls:
+                if isinstance(call._result, dict):
+                    call.result  # raises the fault
+
     def modify_koji_call_kwargs(self, method_name, kwargs, kw_opts: KojiWrapperOpts):
         """
         For a given koji api method, modify kwargs by inserting an event key if appropriate
@@ -760,6 +1049,8 @@ class KojiWrapper(koji.ClientSession):
         logger = aggregate_kw_opts.logger
         return_metadata = aggregate_kw_opts.return_metadata
         use_caching = aggregate_kw_opts.caching
+        persistent_cache = KojiWrapper._koji_wrapper_persistent_cache
+        use_persistent_caching = persistent_cache is not None and self.is_persistable_call(name, args)
 
         retries = 4
         while retries > 0:
@@ -788,27 +1079,31 @@ class KojiWrapper(koji.ClientSession):
                     return ret
 
                 caching_key = None
+                persistent_caching_key = None
+                if use_caching or use_persistent_caching:
+                    caching_key = self._get_caching_key(name, args, kwargs)
                 if use_caching:
-                    # We need a reproducible immutable key from a dict with nested dicts. json.dumps
-                    # and sorting keys is a deterministic way of achieving this.
-                    caching_key = json.dumps(
-                        {
-                            'method_name': name,
-                            'args': args,
-                            'kwargs': kwargs,
-                        },
-                        sort_keys=True,
-                    )
                     result = self._get_cache_result(caching_key, Missing)
                     if result is not Missing:
                         if logger:
                             logger.info(f'CACHE HIT: koji-api-call-{my_id}: {name} returned={result}')
                         return package_result(result, True)
+                if use_persistent_caching:
+                    persistent_caching_key = self._get_persistent_caching_key(caching_key)
+                    result = persistent_cache.get(persistent_caching_key, Missing)
+                    if result is not Missing:
+                        if use_caching:
+                            self._cache_result(caching_key, result)
+                        if logger:
+                            logger.info(f'PERSISTENT CACHE HIT: koji-api-call-{my_id}: {name} returned={result}')
+                        return package_result(result, True)
 
                 result = super()._callMethod(name, args, kwargs=kwargs, retry=retry)
 
                 if use_caching:
                     self._cache_result(caching_key, result)
+                if use_persistent_caching and self.is_persistable_result(name, args, result):
+                    persistent_cache.put(persistent_caching_key, result)
 
                 if logger:
                     logger.info(f'koji-api-call-{my_id}: {name} returned={result}')
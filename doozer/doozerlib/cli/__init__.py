@@ -201,7 +201,7 @@ def print_version(ctx, param, value):
     metavar="DIR",
     required=False,
     default=None,
-    help="A directory in which reference git repos can be stored for caching purposes",
+    help="A directory in which reference git repos, parsed yum repodata, koji API results and image metadata can be stored for caching purposes",
 )
 @click.option(
     "--datastore",
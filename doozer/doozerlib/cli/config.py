@@ -638,11 +638,7 @@ async def config_find_package_repo(runtime, packages, arch, as_yaml, all_version
             for package in packages:
                 # Search for the package in this repo's repodata
                 runtime.logger.info(f'Searching for {package} in repo {repo_name}...')
-                matching_rpms = [
-                    rpm
-                    for rpm in repodata.primary_rpms
-                    if rpm.name == package and (rpm.arch == arch or rpm.arch == 'noarch')
-                ]
+                matching_rpms = repodata.get_rpms_by_name(package, arch)
 
                 if matching_rpms:
                     if all_versions:
@@ -650,11 +646,7 @@ async def config_find_package_repo(runtime, packages, arch, as_yaml, all_version
                         rpm_list = [rpm.to_dict() for rpm in matching_rpms]
                     else:
                         # Find the latest version
-                        latest_rpm = matching_rpms[0]
-                        for rpm in matching_rpms[1:]:
-                            if rpm.compare(latest_rpm) > 0:
-                                latest_rpm = rpm
-                        rpm_list = [latest_rpm.to_dict()]
+                        rpm_list = [repodata.get_latest_rpm(package, arch).to_dict()]
 
                     # Add repo_url to each RPM dict
                     for rpm_dict in rpm_list:
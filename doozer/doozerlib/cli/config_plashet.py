@@ -5,9 +5,10 @@ import re
 import ssl
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import click
 import koji
@@ -23,9 +24,8 @@ from artcommonlib.rpm_utils import _rpmvercmp, compare_nvr, parse_nvr
 from artcommonlib.util import isolate_el_version_in_brew_tag
 from elliottlib import errata
 from requests_kerberos import HTTPKerberosAuth
-from tenacity import retry, retry_if_exception_type, stop_after_delay, wait_fixed
 
-from doozerlib.brew import get_builds_tags
+from doozerlib.brew import get_build_objects, get_builds_tags, list_build_rpms
 from doozerlib.cli import cli
 from doozerlib.exceptions import DoozerFatalError
 from doozerlib.plashet import PlashetBuilder
@@ -201,7 +201,227 @@ def update_advisory_builds(config, errata_session, advisory_id, nvres, nvr_produ
             raise IOError(f'Unable to add nvrs to advisory {advisory_id}: {to_add}')
 
 
-def _assemble_repo(config: SimpleNamespace, nvres: List[str], koji_api: koji.ClientSession = None):
+# Signed RPMs may still be landing in the brewroot; how long to wait for them, and how often to look
+SIGNED_RPMS_WAIT_SECONDS = 600
+SIGNED_RPMS_POLL_SECONDS = 30
+
+# Maximum number of concurrent brewroot directory scans
+SCAN_CONCURRENCY = 16
+
+
+class _RepoEntry(NamedTuple):
+    """A brewroot arch directory to be included in a plashet arch repo."""
+
+    nvre: str
+    arch: str  # the arch of the directory; may be noarch
+    link_name: str
+    brewroot_arch_path: str
+    expected_rpm_filenames: Optional[set]  # None if the directory does not need to be waited upon
+
+
+def _fetch_expected_rpms(
+    config: SimpleNamespace, nvres: List[str], koji_api: koji.ClientSession
+) -> Dict[str, Dict[str, set]]:
+    """
+    Queries Koji (in batches) for the RPMs each build is expected to provide.
+    :return: nvr -> {arch -> set of filenames}
+    """
+    nvrs = [strip_epoch(nvre) for nvre in nvres if parse_nvr(nvre)["name"] not in config.exclude_package]
+    builds = get_build_objects(nvrs, koji_api)
+    missing = [nvr for nvr, build in zip(nvrs, builds) if not build]
+    if missing:
+        raise IOError(f'Unable to find builds in Koji: {missing}')
+
+    expected_rpms_by_nvr: Dict[str, Dict[str, set]] = {}
+    for nvr, rpms in zip(nvrs, list_build_rpms([build["id"] for build in builds], koji_api)):
+        by_arch: Dict[str, set] = {}
+        for rpm in rpms:
+            filename = os.path.basename(koji.pathinfo.rpm(rpm))
+            by_arch.setdefault(rpm["arch"], set()).add(filename)
+        expected_rpms_by_nvr[nvr] = by_arch
+    return expected_rpms_by_nvr
+
+
+def _scan_arch(
+    config: SimpleNamespace,
+    nvres: List[str],
+    arch_name: str,
+    signing_mode: str,
+    links_dir: str,
+    expected_rpms_by_nvr: Dict[str, Dict[str, set]],
+) -> List[_RepoEntry]:
+    """
+    Finds the brewroot directories providing RPMs for the arch repo and links them into links_dir.
+    :return: The entries of the arch repo, in nvres order
+    """
+    entries = []
+    signed = signing_mode == 'signed'
+    for nvre in nvres:
+        nvr = strip_epoch(nvre)
+        package_name = parse_nvr(nvre)["name"]
+
+        if package_name in config.exclude_package:
+            logger.info(f'Skipping repo addition for excluded package: {nvre}')
+            continue
+
+        base_path = get_brewroot_base_path(config, nvre)
+        if base_path is None:
+            continue
+
+        # Include noarch in each arch specific repo.
+        found = False
+        for a in [arch_name, 'noarch']:
+            if signed:
+                signing_keys = getattr(config, 'signing_keys', KNOWN_SIGNING_KEYS)
+                resolved = resolve_signed_arch_path(base_path, a, nvre, signing_keys)
+                if resolved is None:
+                    logger.debug(f'No signed {a} arch directory for {nvre}')
+                    continue
+                brewroot_arch_path = str(resolved)
+                signing_key = resolved.parent.name
+            else:
+                brewroot_arch_path = os.path.join(base_path, a)
+                signing_key = None
+
+            if not os.path.isdir(brewroot_arch_path):
+                logger.debug(f'No {a} arch directory for {nvre}')
+                continue
+
+            logger.info(f'Found {"signed" if signed else "unsigned"} {a} arch directory for {nvre}')
+            link_name = '{nvr}__{arch}'.format(
+                nvr=nvr,
+                arch=a,
+            )
+            if signed:
+                link_name += f'__{signing_key}'
+
+            os.symlink(brewroot_arch_path, os.path.join(links_dir, link_name))
+
+            expected_rpm_filenames = None
+            if signed and nvr in expected_rpms_by_nvr:
+                expected_rpm_filenames = expected_rpms_by_nvr[nvr].get(a, set())
+            entries.append(_RepoEntry(nvre, a, link_name, brewroot_arch_path, expected_rpm_filenames))
+            found = True
+
+        if not found:
+            logger.warning(
+                f"Unable to find any {arch_name} rpms for {nvre} in {base_path}; "
+                "this may be ok if the package doesn't support the arch and "
+                "it is not required for that arch"
+            )
+    return entries
+
+
+def _list_rpms(entry: _RepoEntry) -> List[str]:
+    """
+    Lists the RPMs in a brewroot arch directory.
+    :raises IOError: if the directory is empty, or is missing some of the expected RPMs
+    """
+    rpms = os.listdir(entry.brewroot_arch_path)
+    if not rpms:
+        raise IOError(f'Did not find any rpms in {entry.brewroot_arch_path}')
+    if entry.expected_rpm_filenames:
+        missing = entry.expected_rpm_filenames - set(rpms)
+        if missing:
+            raise IOError(
+                f'Signed {entry.arch} directory for {entry.nvre} is incomplete; '
+                f'missing {len(missing)} RPM(s): {sorted(missing)}'
+            )
+    return rpms
+
+
+def _list_all_rpms(entries: List[_RepoEntry], executor: ThreadPoolExecutor) -> Dict[str, List[str]]:
+    """
+    Lists the RPMs of all entries. Signed directories which are still incomplete are polled together in
+    a single loop until they are complete or SIGNED_RPMS_WAIT_SECONDS elapse.
+    :return: brewroot_arch_path -> RPM filenames
+    :raises IOError: if a directory is empty, or a signed directory is still incomplete after waiting
+    """
+
+    def _try_list(entry: _RepoEntry):
+        try:
+            return _list_rpms(entry)
+        except IOError as e:
+            return e
+
+    # The same brewroot directory (e.g. noarch) is usually part of every arch repo; list it once
+    pending = list({entry.brewroot_arch_path: entry for entry in entries}.values())
+    rpms_by_path: Dict[str, List[str]] = {}
+    deadline = time.monotonic() + SIGNED_RPMS_WAIT_SECONDS
+    while True:
+        errors = []
+        still_pending = []
+        for entry, result in zip(pending, executor.map(_try_list, pending)):
+            if not isinstance(result, IOError):
+                rpms_by_path[entry.brewroot_arch_path] = result
+            elif entry.expected_rpm_filenames is None:
+                raise result  # only signed directories are waited upon
+            else:
+                errors.append(result)
+                still_pending.append(entry)
+        if not still_pending:
+            return rpms_by_path
+        if time.monotonic() >= deadline:
+            for e in errors:
+                logger.error(str(e))
+            raise errors[0]
+        logger.info(
+            f'Waiting for signed RPMs to become available in {len(still_pending)} directories, '
+            f'retrying in {SIGNED_RPMS_POLL_SECONDS}s...'
+        )
+        time.sleep(SIGNED_RPMS_POLL_SECONDS)
+        pending = still_pending
+
+
+def _arch_repo_path(plashet_dir: str, arch_name: str, repo_subdir: Optional[str]) -> str:
+    """Returns the directory of the yum repo for arch_name in a plashet."""
+    arch_repo_path = os.path.join(plashet_dir, arch_name)
+    if repo_subdir:
+        arch_repo_path += '/' + repo_subdir.strip('/')  # strip / from start and end
+    return arch_repo_path
+
+
+def _createrepo_cmd(
+    config: SimpleNamespace, arch_name: str, rpm_list: List[str], cache_dir: Optional[str]
+) -> Tuple[List[str], int]:
+    """
+    Builds the createrepo_c command for an arch repo. If the plashet is built incrementally from a previous
+    plashet, createrepo_c reuses the metadata of the packages the previous arch repo already contained
+    (matched by location, size and mtime) rather than reading their headers again.
+    :return: The command, and the number of rpm_list entries the previous arch repo already contained
+    """
+    cmd = ['createrepo_c', '--no-database', '-i', 'rpm_list']
+    if cache_dir:
+        # Checksums of package files read by any previous run
+        cmd.append(f'--cachedir={cache_dir}')
+
+    rpm_overlap = 0
+    if config.incremental_from:
+        previous_arch_path = _arch_repo_path(config.incremental_from, arch_name, config.repo_subdir)
+        if os.path.isfile(os.path.join(previous_arch_path, 'repodata', 'repomd.xml')):
+            cmd.extend(['--update', f'--update-md-path={previous_arch_path}'])
+            try:
+                with open(os.path.join(previous_arch_path, 'rpm_list')) as f:
+                    previous_rpm_list = set(f.read().splitlines())
+                rpm_overlap = sum(1 for rpm_path in rpm_list if rpm_path in previous_rpm_list)
+            except OSError as e:
+                logger.warning(f'Unable to read rpm_list of previous plashet {previous_arch_path}: {e}')
+        else:
+            logger.warning(
+                f'No {arch_name} repodata in previous plashet {config.incremental_from}; building from scratch'
+            )
+    cmd.append('.')
+    return cmd, rpm_overlap
+
+
+def _assemble_repo(
+    config: SimpleNamespace,
+    nvres: List[str],
+    koji_api: koji.ClientSession = None,
+    timings: Optional[Dict[str, float]] = None,
+    createrepo_cache_dir: Optional[str] = None,
+    createrepo_stats: Optional[Dict[str, Dict[str, int]]] = None,
+):
     """
     This method is intended to be wrapped by assemble_repo.
     Assembles one or more architecture specific repos in the
@@ -213,127 +433,80 @@ def _assemble_repo(config: SimpleNamespace, nvres: List[str], koji_api: koji.Cli
         in signed mode, the expected RPMs for each build are queried from Koji
         and compared against the contents of the signed directory to ensure
         completeness.
+    :param timings: optional dict in which the duration (in seconds) of each phase
+        is recorded as the phase completes.
+    :param createrepo_cache_dir: optional directory in which createrepo_c caches package checksums.
+    :param createrepo_stats: optional dict in which, for each arch, the number of packages in the repo
+        ('total') and how many of them the previous plashet's rpm_list already contained ('rpm_overlap')
+        are recorded. The overlap is an upper bound on what createrepo_c can reuse: it also requires
+        the package file's size and mtime to be unchanged.
     :return: n/a
     An exception will be thrown if no RPMs can be found matching an nvr.
     """
-
-    @retry(
-        retry=retry_if_exception_type(IOError),
-        stop=stop_after_delay(600),
-        wait=wait_fixed(30),
-        reraise=True,
-        before_sleep=lambda retry_state: logger.info('Waiting for signed RPMs to become available, retrying in 30s...'),
-    )
-    def _wait_for_signed_rpms(brewroot_arch_path: str, expected_rpm_filenames: set, nvre: str, arch: str) -> List[str]:
-        rpms = os.listdir(brewroot_arch_path)
-        if not rpms:
-            raise IOError(f'Did not find any rpms in {brewroot_arch_path}')
-        if expected_rpm_filenames:
-            missing = expected_rpm_filenames - set(rpms)
-            if missing:
-                raise IOError(
-                    f'Signed {arch} directory for {nvre} is incomplete; '
-                    f'missing {len(missing)} RPM(s): {sorted(missing)}'
-                )
-        return rpms
+    if timings is None:
+        timings = {}
+    if createrepo_stats is None:
+        createrepo_stats = {}
 
     # Pre-fetch expected RPMs per build for completeness validation when signing
+    start = time.monotonic()
     expected_rpms_by_nvr: Dict[str, Dict[str, set]] = {}  # nvr -> {arch -> set of filenames}
     if koji_api and any(mode == 'signed' for _, mode in config.arch):
-        for nvre in nvres:
-            nvr = strip_epoch(nvre)
-            nvre_obj = parse_nvr(nvre)
-            if nvre_obj["name"] in config.exclude_package:
-                continue
-            build = koji_api.getBuild(nvr, strict=True)
-            rpms = koji_api.listRPMs(buildID=build["id"])
-            by_arch: Dict[str, set] = {}
-            for rpm in rpms:
-                arch = rpm["arch"]
-                filename = os.path.basename(koji.pathinfo.rpm(rpm))
-                by_arch.setdefault(arch, set()).add(filename)
-            expected_rpms_by_nvr[nvr] = by_arch
-
-    for arch_name, signing_mode in config.arch:
-        # These directories shouldn't exist yet. They will be created during assemble.
-        dest_arch_path = os.path.join(config.dest_dir, arch_name)
-        if config.repo_subdir:
-            dest_arch_path += '/' + config.repo_subdir.strip('/')  # strip / from start and end
-        links_dir = os.path.join(dest_arch_path, 'Packages')
-        rpm_list_path = os.path.join(dest_arch_path, 'rpm_list')
-        mkdirs(links_dir)
-
-        # Each arch will have its own yum repo & thus needs its own rpm_list
-        with open(rpm_list_path, mode='w+') as rl:
-            for nvre in nvres:
-                nvr = strip_epoch(nvre)
-                matched_count = 0
-
-                nvre_obj = parse_nvr(nvre)
-                package_name = nvre_obj["name"]
-
-                if package_name in config.exclude_package:
-                    logger.info(f'Skipping repo addition for excluded package: {nvre}')
-                    continue
-
-                signed = signing_mode == 'signed'
-                base_path = get_brewroot_base_path(config, nvre)
-                if base_path is None:
-                    continue
-
-                # Include noarch in each arch specific repo.
-                include_arches = [arch_name, 'noarch']
-                for a in include_arches:
-                    if signed:
-                        signing_keys = getattr(config, 'signing_keys', KNOWN_SIGNING_KEYS)
-                        resolved = resolve_signed_arch_path(base_path, a, nvre, signing_keys)
-                        if resolved is None:
-                            logger.debug(f'No signed {a} arch directory for {nvre}')
-                            continue
-                        brewroot_arch_path = str(resolved)
-                        signing_key = resolved.parent.name
-                    else:
-                        brewroot_arch_path = os.path.join(base_path, a)
-                        signing_key = None
-
-                    if not os.path.isdir(brewroot_arch_path):
-                        logger.debug(f'No {a} arch directory for {nvre}')
-                        continue
+        expected_rpms_by_nvr = _fetch_expected_rpms(config, nvres, koji_api)
+    timings['koji_metadata'] = time.monotonic() - start
 
-                    logger.info(f'Found {"signed" if signed else "unsigned"} {a} arch directory for {nvre}')
-                    link_name = '{nvr}__{arch}'.format(
-                        nvr=nvr,
-                        arch=a,
-                    )
-                    if signed:
-                        link_name += f'__{signing_key}'
-
-                    package_link_path = os.path.join(links_dir, link_name)
-                    os.symlink(brewroot_arch_path, package_link_path)
-
-                    if signed and nvr in expected_rpms_by_nvr:
-                        expected_rpm_filenames = expected_rpms_by_nvr[nvr].get(a, set())
-                        rpms = _wait_for_signed_rpms(brewroot_arch_path, expected_rpm_filenames, nvre, a)
-                    else:
-                        rpms = os.listdir(package_link_path)
-                        if not rpms:
-                            raise IOError(f'Did not find any rpms in {brewroot_arch_path}')
-
-                    for r in rpms:
-                        rpm_path = os.path.join('Packages', link_name, r)
-                        rl.write(rpm_path + '\n')
-                        matched_count += 1
+    dest_arch_paths = {}
+    for arch_name, _ in config.arch:
+        # These directories shouldn't exist yet. They will be created during assemble.
+        dest_arch_path = _arch_repo_path(config.dest_dir, arch_name, config.repo_subdir)
+        mkdirs(os.path.join(dest_arch_path, 'Packages'))
+        dest_arch_paths[arch_name] = dest_arch_path
+
+    with ThreadPoolExecutor(max_workers=SCAN_CONCURRENCY) as executor:
+        start = time.monotonic()
+        scans = {
+            arch_name: executor.submit(
+                _scan_arch,
+                config,
+                nvres,
+                arch_name,
+                signing_mode,
+                os.path.join(dest_arch_paths[arch_name], 'Packages'),
+                expected_rpms_by_nvr,
+            )
+            for arch_name, signing_mode in config.arch
+        }
+        entries_by_arch = {arch_name: scan.result() for arch_name, scan in scans.items()}
+        timings['scan'] = time.monotonic() - start
+
+        start = time.monotonic()
+        rpms_by_path = _list_all_rpms(list(itertools.chain.from_iterable(entries_by_arch.values())), executor)
+        timings['list_rpms'] = time.monotonic() - start
+
+        def _create_repo(arch_name: str):
+            dest_arch_path = dest_arch_paths[arch_name]
+            # Each arch will have its own yum repo & thus needs its own rpm_list
+            rpm_list = [
+                os.path.join('Packages', entry.link_name, r)
+                for entry in entries_by_arch[arch_name]
+                for r in rpms_by_path[entry.brewroot_arch_path]
+            ]
+            with open(os.path.join(dest_arch_path, 'rpm_list'), mode='w+') as rl:
+                rl.writelines(rpm_path + '\n' for rpm_path in rpm_list)
+            cmd, rpm_overlap = _createrepo_cmd(config, arch_name, rpm_list, createrepo_cache_dir)
+            createrepo_stats[arch_name] = {'rpm_overlap': rpm_overlap, 'total': len(rpm_list)}
+            exectools.cmd_assert(cmd, cwd=dest_arch_path)
+            logger.info(
+                f'Successfully created repo at {dest_arch_path}; {rpm_overlap}/{len(rpm_list)} RPMs were in the previous plashet'
+            )
 
-                if not matched_count:
-                    path = base_path or "unknown path"
-                    logger.warning(
-                        f"Unable to find any {arch_name} rpms for {nvre} in {path}; "
-                        "this may be ok if the package doesn't support the arch and "
-                        "it is not required for that arch"
-                    )
+        start = time.monotonic()
+        list(executor.map(_create_repo, dest_arch_paths))
+        timings['createrepo'] = time.monotonic() - start
 
-        exectools.cmd_assert('createrepo_c --no-database -i rpm_list .', cwd=dest_arch_path)
-        logger.info(f'Successfully created repo at {dest_arch_path}')
+    logger.info(
+        'Plashet assembly phase timings: ' + ', '.join(f'{phase}={seconds:.1f}s' for phase, seconds in timings.items())
+    )
 
 
 def assemble_repo(config, nvres, event_info=None, extra_data: Dict = None):
@@ -355,15 +528,27 @@ def assemble_repo(config, nvres, event_info=None, extra_data: Dict = None):
 
     with open(os.path.join(config.dest_dir, 'plashet.yml'), mode='w+', encoding='utf-8') as y:
         success = False
+        timings: Dict[str, float] = {}
+        createrepo_stats: Dict[str, Dict[str, int]] = {}
         try:
-            _assemble_repo(config, nvres, koji_api=koji_proxy)
+            _assemble_repo(
+                config,
+                nvres,
+                koji_api=koji_proxy,
+                timings=timings,
+                createrepo_cache_dir=runtime.createrepo_cache_dir,
+                createrepo_stats=createrepo_stats,
+            )
             success = True
         finally:
+            start = time.monotonic()
+            sorted_nvrs = [strip_epoch(nvre) for nvre in sorted(nvres)]
+            builds = get_build_objects(sorted_nvrs, koji_proxy)
+            with koji_proxy.batch() as m:
+                history_calls = [m.queryHistory(table='tag_listing', build=build['id']) for build in builds]
             packages = list()
-            for nvre in sorted(nvres):
-                nvr = strip_epoch(nvre)
-                build = koji_proxy.getBuild(nvr)
-                tag_listing = koji_proxy.queryHistory(table='tag_listing', build=build['id'])['tag_listing']
+            for build, history_call in zip(builds, history_calls):
+                tag_listing = history_call.result['tag_listing']
                 latest_tag = {}
                 if tag_listing:
                     tag_listing.sort(key=lambda event: event['create_event'])
@@ -381,6 +566,7 @@ def assemble_repo(config, nvres, event_info=None, extra_data: Dict = None):
                     'latest_tag': latest_tag,
                 }
                 packages.append(package)
+            timings['record_packages'] = time.monotonic() - start
 
             plashet_info = {
                 'assemble': {
@@ -388,9 +574,20 @@ def assemble_repo(config, nvres, event_info=None, extra_data: Dict = None):
                     'concerns': plashet_concerns,
                     'brew_event': event_info or koji_proxy.getLastEvent(),
                     'packages': packages,
+                    'phase_timings': {phase: round(seconds, 3) for phase, seconds in timings.items()},
                 },
-                'extra': extra_data or {},
+                'extra': dict(extra_data or {}),
             }
+            if createrepo_stats:
+                rpm_overlap = sum(stats['rpm_overlap'] for stats in createrepo_stats.values())
+                total = sum(stats['total'] for stats in createrepo_stats.values())
+                plashet_info['extra']['createrepo_cache'] = {
+                    'incremental_from': config.incremental_from,
+                    'rpm_overlap': rpm_overlap,
+                    'total': total,
+                    'rpm_overlap_ratio': round(rpm_overlap / total, 4) if total else 0.0,
+                    'arches': createrepo_stats,
+                }
             yaml.dump(plashet_info, y, default_flow_style=False)
 
 
@@ -607,13 +804,20 @@ def setup_logging(dest_dir: str):
     help='For each arch to include in the plashet. Each arch will be a repo beneath the plashet dir.',
 )
 @click.option('--brew-root', metavar='PATH', default='/mnt/redhat/brewroot', help='Filesystem location of brew root')
+@click.option(
+    '--incremental-from',
+    metavar='PATH',
+    required=False,
+    default=None,
+    help='A previous plashet with the same arches and repo subdir; createrepo_c reuses its metadata for unchanged RPMs.',
+)
 @click.option(
     '-x', '--exclude-package', metavar='NAME', multiple=True, default=[], help='Exclude one or more package names'
 )
 @click.option(
     '-i', '--include-package', metavar='NAME', multiple=True, default=[], help='Only include specified packages'
 )
-def config_plashet(ctx, base_dir, brew_root, name, signing_key_id, **kwargs):
+def config_plashet(ctx, base_dir, brew_root, name, signing_key_id, incremental_from, **kwargs):
     """
     Creates a directory containing one or more arch specific yum repositories by using local
     symlinks to a brewroot filesystem location. This avoids network transfer time.
@@ -685,6 +889,7 @@ def config_plashet(ctx, base_dir, brew_root, name, signing_key_id, **kwargs):
         dest_dir=dest_dir,
         signing_key_id=effective_key,
         signing_keys=(effective_key,) if signing_key_id else KNOWN_SIGNING_KEYS,
+        incremental_from=os.path.realpath(incremental_from) if incremental_from else None,
         runtime=runtime,
         **kwargs,
     )
@@ -796,11 +1001,28 @@ def from_tags(
     if runtime.group and runtime.group.startswith('openshift-'):
         target_openshift_version = runtime.get_major_minor_fields()
 
+    # Fetch every tag listing and build info the tags below need up front, so that koji round trips
+    # don't grow with the number of tags and pinned builds.
+    # If an assembly has a basis event, it will only query for artifacts from the "stream" assembly.
+    tag_assembly = 'stream' if runtime.assembly_basis_event else assembly
+    tag_listings = [(ebt, False, False, event) for ebt in embargoed_brew_tag]
+    for tag, _ in brew_tag:
+        tag_listings.append(builder.tag_listing(tag, inherit, tag_assembly, event))
+        if tag.endswith(('-candidate', '-hotfix')):
+            tag_listings.append((tag[: tag.rfind('-')], True, True, event))
+    el_versions = {isolate_el_version_in_brew_tag(tag) for tag, _ in brew_tag} - {None}
+    builder.prefetch(
+        tag_listings,
+        builder.plan(
+            el_versions, runtime.assembly, runtime.get_releases_config(), runtime.group_config, runtime.rpm_map
+        ),
+    )
+
     # Gather up all nvrs tagged in the embargoed brew tags into a set.
     embargoed_tag_nvrs = set()
     embargoed_tag_nvrs.update(embargoed_nvr)
     for ebt in embargoed_brew_tag:
-        for build in koji_proxy.listTagged(ebt, latest=False, inherit=False, event=event, type='rpm'):
+        for build in builder.list_tagged(ebt, latest=False, inherit=False, event=event):
             embargoed_tag_nvrs.add(to_nvre(build))
     logger.info('Will treat the following nvrs as potentially embargoed: {}'.format(embargoed_tag_nvrs))
 
@@ -823,7 +1045,7 @@ def from_tags(
             b'{"error":"Unable to add build \'cri-o-1.16.6-2.rhaos4.3.git4936f44.el7\' which is older than cri-o-1.16.6-16.dev.rhaos4.3.git4936f44.el7"}'
             """
             released_tag = tag[: tag.rfind('-')]
-            for build in koji_proxy.listTagged(released_tag, latest=True, inherit=True, event=event, type='rpm'):
+            for build in builder.list_tagged(released_tag, latest=True, inherit=True, event=event):
                 package_name = build['package_name']
                 released_package_nvre_obj[package_name] = parse_nvr(to_nvre(build))
 
@@ -1132,6 +1354,18 @@ def for_assembly(
     event_info = koji_proxy.getEvent(event)
     errata_session = requests.session()
     builder = PlashetBuilder(koji_proxy, logger=logger)
+    # Fetch the build infos of every pinned NVR below in a single round trip
+    builder.prefetch(
+        ids_or_nvrs=builder.plan(
+            [el_version],
+            runtime.assembly,
+            runtime.get_releases_config(),
+            runtime.group_config,
+            runtime.rpm_map,
+            image_metas=[runtime.image_map[image]] if image in runtime.image_map else [],
+            rhcos=rhcos,
+        )
+    )
 
     desired_nvres = set()  # The final set of rpm build NVREs that will be included in the plashet repo
     nvr_product_version = {}  # Maps nvr to product_version for signing
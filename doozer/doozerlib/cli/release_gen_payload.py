@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import sys
+import time
 import traceback
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -19,7 +20,14 @@ import openshift_client as oc
 import yaml
 from artcommonlib import exectools, rhcos
 from artcommonlib.arch_util import brew_arch_for_go_arch, go_arch_for_brew_arch, go_suffix_for_arch
-from artcommonlib.assembly import AssemblyIssue, AssemblyIssueCode, AssemblyTypes, assembly_basis, assembly_basis_event
+from artcommonlib.assembly import (
+    AssemblyIssue,
+    AssemblyIssueCode,
+    AssemblyMemberOverrides,
+    AssemblyTypes,
+    assembly_basis,
+    assembly_basis_event,
+)
 from artcommonlib.constants import (
     COREOS_RHEL10_STREAMS,
 )
@@ -63,6 +71,12 @@ from doozerlib.util import (
 TRACER = trace.get_tracer(__name__)
 logger = logging.getLogger(__name__)
 
+# Number of images mirrored by each 'oc image mirror' invocation
+MIRROR_CHUNK_SIZE = 50
+
+# Number of destination manifests looked up concurrently before mirroring
+MIRROR_CHECK_CONCURRENCY = 32
+
 
 async def check_multi_nightly_exists_for_model(model_nightly_name: str) -> bool:
     """
@@ -179,6 +193,20 @@ class RepositoryType(Enum):
     is_flag=True,
     help="Allow embargoed builds to sync publicly in named assemblies",
 )
+@click.option(
+    "--mirror-concurrency",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of image mirroring chunks in flight at once.",
+)
+@click.option(
+    "--mirror-registry-concurrency",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of image mirroring chunks in flight at once against any single destination registry.",
+)
 @click.option(
     "--multi-model",
     metavar="SPEC",
@@ -206,6 +234,8 @@ async def release_gen_payload(
     apply_multi_arch: bool,
     moist_run: bool,
     embargo_permit_ack: bool,
+    mirror_concurrency: int,
+    mirror_registry_concurrency: int,
     multi_model: str,
 ):
     """
@@ -298,6 +328,8 @@ read and propagate/expose this annotation in its display of the release image.
         moist_run,
         embargo_permit_ack,
         multi_model,
+        mirror_concurrency,
+        mirror_registry_concurrency,
     ).run()
 
 
@@ -455,6 +487,8 @@ class GenPayloadCli:
         moist_run: bool = False,
         embargo_permit_ack: bool = False,
         multi_model: str = None,
+        mirror_concurrency: int = 8,
+        mirror_registry_concurrency: int = 4,
     ):
         self.runtime = runtime
         self.package_rpm_finder = PackageRpmFinder(runtime)
@@ -494,6 +528,10 @@ class GenPayloadCli:
         # Track mismatched siblings.
         # This will be used to prevent syncing out mismatched siblings for development releases per ART-13996
         self.mismatched_siblings = []
+        # Bounds on concurrent 'oc image mirror' chunks, shared by all arches and privacy modes
+        self.mirror_semaphore = asyncio.Semaphore(mirror_concurrency)
+        self.mirror_registry_concurrency = mirror_registry_concurrency
+        self.mirror_registry_semaphores: Dict[str, asyncio.Semaphore] = {}
 
     @start_as_current_span_async(TRACER, "releases:gen-payload")
     async def run(self):
@@ -663,6 +701,7 @@ class GenPayloadCli:
 
         # Update runtime's releases_config with the new assembly
         rt.releases_config.releases[multi_model_assembly_name] = assembly_def['releases'][multi_model_assembly_name]
+        AssemblyMemberOverrides.invalidate(rt.releases_config)
 
         # Update runtime to use this assembly
         rt.assembly = multi_model_assembly_name
@@ -1460,7 +1499,11 @@ class GenPayloadCli:
                     payload_entry.build_record_inspector.get_build_pullspec()
                 )
 
-        @exectools.limit_concurrency(500)
+        if self.apply or self.apply_multi_arch:
+            mirror_src_for_dest = await self.drop_already_mirrored(mirror_src_for_dest)
+
+        registry_config = os.getenv("QUAY_AUTH_FILE") if self.runtime.build_system == 'konflux' else None
+
         @retry(reraise=True, stop=stop_after_attempt(10), wait=wait_fixed(60))
         async def _mirror(file_path: Path, dest_src_pullspecs: List[Tuple[str, str]]):
             # Save the default SRC=DEST input to a file for syncing by 'oc image mirror'
@@ -1469,26 +1512,116 @@ class GenPayloadCli:
                     await out_file.write(f"{src_pullspec}={dest_pullspec}\n")
 
             if self.apply or self.apply_multi_arch:
-                self.logger.info(f"Mirroring images from {str(src_dest_path)}")
+                self.logger.info(f"Mirroring images from {str(file_path)}")
                 cmd = [
                     'oc',
                     'image',
                     'mirror',
                     '--keep-manifest-list',
                     '--continue-on-error',
-                    f'--filename={str(src_dest_path)}',
+                    f'--filename={str(file_path)}',
                 ]
-                if self.runtime.build_system == 'konflux':
-                    cmd.append(f'--registry-config={os.getenv("QUAY_AUTH_FILE")}')
+                if registry_config:
+                    cmd.append(f'--registry-config={registry_config}')
                 await asyncio.wait_for(exectools.cmd_assert_async(cmd), timeout=7200)
 
-        # Mirror the images in chunks to avoid erroring out due to possible registry issues
-        image_chunk_size = 50
-        i = 0
-        for pullspec_pair_chunk in chunk(list(mirror_src_for_dest.items()), image_chunk_size):
-            src_dest_path = self.output_path.joinpath(f"src_dest.{arch}-{'private' if private else 'public'}-{i}.txt")
-            await _mirror(src_dest_path, pullspec_pair_chunk)
-            i += 1
+        async def _mirror_chunk(index: int, registry: str, dest_src_pullspecs: List[Tuple[str, str]]):
+            src_dest_path = self.output_path.joinpath(
+                f"src_dest.{arch}-{'private' if private else 'public'}-{index}.txt"
+            )
+            if registry not in self.mirror_registry_semaphores:
+                self.mirror_registry_semaphores[registry] = asyncio.Semaphore(self.mirror_registry_concurrency)
+            # Wait for the registry's slot before taking a global one, so that chunks queued on a saturated
+            # registry don't hold global slots that chunks for other registries could use
+            async with self.mirror_registry_semaphores[registry], self.mirror_semaphore:
+                start = time.monotonic()
+                await _mirror(src_dest_path, dest_src_pullspecs)
+                self.logger.info(
+                    "Mirrored chunk %s (%s images to %s) in %.1fs",
+                    src_dest_path.name,
+                    len(dest_src_pullspecs),
+                    registry,
+                    time.monotonic() - start,
+                )
+
+        # Mirror the images in chunks to avoid erroring out due to possible registry issues.
+        # Each chunk targets a single registry so that it can be rate limited per registry.
+        pullspecs_by_registry: Dict[str, List[Tuple[str, str]]] = {}
+        for dest_pullspec, src_pullspec in mirror_src_for_dest.items():
+            registry = dest_pullspec.split('/', 1)[0]
+            pullspecs_by_registry.setdefault(registry, []).append((dest_pullspec, src_pullspec))
+
+        chunks = [
+            (registry, pullspec_pair_chunk)
+            for registry, pullspec_pairs in pullspecs_by_registry.items()
+            for pullspec_pair_chunk in chunk(pullspec_pairs, MIRROR_CHUNK_SIZE)
+        ]
+        start = time.monotonic()
+        await asyncio.gather(
+            *(
+                _mirror_chunk(index, registry, pullspec_pair_chunk)
+                for index, (registry, pullspec_pair_chunk) in enumerate(chunks)
+            )
+        )
+        self.logger.info(
+            "Mirrored %s %s images for %s in %s chunks in %.1fs",
+            len(mirror_src_for_dest),
+            'private' if private else 'public',
+            arch,
+            len(chunks),
+            time.monotonic() - start,
+        )
+
+    async def drop_already_mirrored(self, mirror_src_for_dest: Dict[str, str]) -> Dict[str, str]:
+        """
+        Destinations are tagged after the digest they hold (see PayloadGenerator.get_mirroring_destination).
+        Look up all such destinations concurrently and drop the ones which already hold that digest,
+        since mirroring them again would be a no-op.
+        :param mirror_src_for_dest: Map of destination pullspec -> source pullspec
+        :return: The entries of mirror_src_for_dest which still need mirroring
+        """
+        registry_config = os.getenv("QUAY_AUTH_FILE") if self.runtime.build_system == 'konflux' else None
+        semaphore = asyncio.Semaphore(MIRROR_CHECK_CONCURRENCY)
+
+        async def _is_mirrored(dest_pullspec: str) -> bool:
+            expected_digest = PayloadGenerator.get_mirroring_destination_digest(dest_pullspec)
+            if not expected_digest:
+                return False
+            cmd = ['oc', 'image', 'info', '--show-multiarch', '-o', 'json', dest_pullspec]
+            if registry_config:
+                cmd.append(f'--registry-config={registry_config}')
+            async with semaphore:
+                rc, out, _ = await exectools.cmd_gather_async(cmd, check=False)
+            if rc != 0:
+                return False  # Most likely absent; either way, mirror it
+            try:
+                image_info = json.loads(out)
+            except ValueError:
+                self.logger.warning("Unreadable image info for %s; it will be mirrored", dest_pullspec)
+                return False
+            if isinstance(image_info, dict):
+                image_info = [image_info]
+            if not isinstance(image_info, list):
+                return False
+            return any(
+                isinstance(entry, dict) and expected_digest in (entry.get('digest'), entry.get('listDigest'))
+                for entry in image_info
+            )
+
+        start = time.monotonic()
+        mirrored = await asyncio.gather(*(_is_mirrored(dest_pullspec) for dest_pullspec in mirror_src_for_dest))
+        remaining = {
+            dest_pullspec: src_pullspec
+            for (dest_pullspec, src_pullspec), is_mirrored in zip(mirror_src_for_dest.items(), mirrored)
+            if not is_mirrored
+        }
+        self.logger.info(
+            "%s of %s destinations already hold their digest and will not be mirrored again (checked in %.1fs)",
+            len(mirror_src_for_dest) - len(remaining),
+            len(mirror_src_for_dest),
+            time.monotonic() - start,
+        )
+        return remaining
 
     async def generate_specific_payload_imagestreams(
         self,
@@ -2533,6 +2666,18 @@ class PayloadGenerator:
         tag = sha256.replace(":", "-")  # sha256:abcdef -> sha256-abcdef
         return f"{dest_repo}:{tag}"
 
+    @staticmethod
+    def get_mirroring_destination_digest(dest_pullspec: str) -> Optional[str]:
+        """
+        The inverse of get_mirroring_destination.
+        :param dest_pullspec: A pullspec, e.g. "quay.io/org/repo:sha256-6084e70110ef....70676c8ca8ee5bd5e891e74"
+        :return: The digest named by the tag (e.g. "sha256:6084e70110ef...."), or None if the tag does not name one.
+        """
+        _, _, tag = dest_pullspec.rpartition(":")
+        if "/" in tag or not tag.startswith("sha256-"):
+            return None
+        return tag.replace("-", ":", 1)
+
     def find_payload_entries(
         self, assembly_inspector: AssemblyInspector, arch: str, dest_repo: str, registry_config: str = None
     ) -> (Dict[str, PayloadEntry], List[AssemblyIssue]):
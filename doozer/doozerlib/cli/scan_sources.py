@@ -290,12 +290,28 @@ class ConfigScanSources:
         # Determine if the current upstream source commit hash has a downstream build associated with it.
         # Result is a list of tuples, where each tuple contains an rpm or image metadata
         # and a change tuple (changed: bool, message: str).
+        SourceResolver.prefetch_remote_branches(
+            meta.config.content.source.git for meta in self.all_metas if "git" in meta.config.content.source
+        )
         upstream_changes: List[Tuple[Metadata, RebuildHint]] = exectools.parallel_exec(
             lambda image_meta, _: (image_meta, image_meta.needs_rebuild()),
             self.all_metas,
             n_threads=20,
         ).get()
 
+        # Look up the latest changes to all buildroot tags in a couple of batched koji round trips
+        brew.prefetch_tag_change_events(
+            koji_api,
+            [
+                meta.build_root_tag()
+                for meta, rebuild_hint in upstream_changes
+                if meta.meta_type == 'rpm'
+                and not rebuild_hint.rebuild
+                and (meta.enabled or meta.mode == "disabled" and self.runtime.load_disabled)
+            ],
+            inherit=True,
+        )
+
         for meta, rebuild_hint in upstream_changes:
             dgk = meta.distgit_key
             if not (meta.enabled or meta.mode == "disabled" and self.runtime.load_disabled):
@@ -244,6 +244,12 @@ class ConfigScanSources:
             # Get current task bundle SHAs from GitHub
             self.current_task_bundles = await self.get_current_task_bundle_shas()
 
+        # List the branches of every upstream repo once, instead of once per image and branch
+        await asyncio.to_thread(
+            SourceResolver.prefetch_remote_branches,
+            [meta.config.content.source.git for meta in self.all_image_metas if "git" in meta.config.content.source],
+        )
+
         # Build an image dependency tree to scan across levels of inheritance. This should save us some time,
         # as when an image is found in need for a rebuild, we can also mark its children or operators without checking
         self.image_tree = self.generate_dependency_tree(self.runtime.image_tree)
@@ -3,16 +3,16 @@ import hashlib
 import json
 import pathlib
 import re
+import weakref
 from collections import OrderedDict
-from copy import copy
 from functools import lru_cache
 from multiprocessing import Event
-from typing import Any, Dict, List, Optional, Set, Tuple, cast
+from typing import Dict, List, Optional, Set, Tuple, cast
 
 from artcommonlib import util as artlib_util
 from artcommonlib.constants import GOLANG_BUILDER_IMAGE_NAME
 from artcommonlib.konflux.konflux_build_record import ArtifactType, Engine, KonfluxBuildOutcome, KonfluxBuildRecord
-from artcommonlib.model import Missing, Model
+from artcommonlib.model import FrozenModel, Missing, Model, freeze
 from artcommonlib.pushd import Dir
 from artcommonlib.release_util import isolate_el_version_in_release
 from artcommonlib.rpm_utils import parse_nvr, to_nevra
@@ -89,6 +89,51 @@ def extract_builder_info_from_pullspec(pullspec: str) -> tuple[int | None, tuple
     return rhel_version, golang_version
 
 
+def _digest_json(o) -> str:
+    # Avoid non serializable objects. Known to occur for PosixPath objects in content.source.modifications.
+    def default(o):
+        return f"<<non-serializable: {type(o).__qualname__}>>"
+
+    return json.dumps(o, sort_keys=True, default=default)
+
+
+class ConfigDigestInputs:
+    """
+    Serialized config digest inputs shared by all images of a runtime (repo definitions and stream images).
+    They are computed at most once per gitdata commit.
+    """
+
+    _by_runtime: "weakref.WeakKeyDictionary[doozerlib.Runtime, Dict[Optional[str], ConfigDigestInputs]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, runtime: "doozerlib.Runtime"):
+        self._runtime = runtime
+        self._repos: Dict[str, str] = {}
+        self._streams: Dict[str, str] = {}
+
+    @classmethod
+    def of(cls, runtime: "doozerlib.Runtime") -> "ConfigDigestInputs":
+        commit = getattr(getattr(runtime, "gitdata", None), "commit_hash", None)
+        by_commit = cls._by_runtime.setdefault(runtime, {})
+        inputs = by_commit.get(commit)
+        if inputs is None:
+            by_commit.clear()  # inputs of a previous commit will not be asked for again
+            inputs = by_commit[commit] = cls(runtime)
+        return inputs
+
+    def repo_json(self, name: str) -> str:
+        if name not in self._repos:
+            # Use runtime.repos which handles both old-style and new-style configurations
+            self._repos[name] = _digest_json(self._runtime.repos[name].to_dict())
+        return self._repos[name]
+
+    def stream_json(self, name: str) -> str:
+        if name not in self._streams:
+            self._streams[name] = _digest_json(self._runtime.resolve_stream(name).get('image'))
+        return self._streams[name]
+
+
 class ImageMetadata(Metadata):
     def __init__(
         self,
@@ -117,6 +162,8 @@ class ImageMetadata(Metadata):
                     continue
                 dependent.dependencies.add(self.distgit_key)
                 self.children.append(dependent)
+        self._frozen_config: Optional[FrozenModel] = None
+        """ The config as of the last calculate_config_digest() """
         self.rebase_event = Event()
         """ Event that is set when this image is being rebased. """
         self.rebase_status = False
@@ -720,37 +767,28 @@ class ImageMetadata(Metadata):
             "external_scanners",
             "delivery",
         ]  # list of keys that shouldn't be involved in config digest calculation
-        image_config = copy(self.config)
+        # Digest a frozen view of the config: dropping the ignored keys rebuilds only the models along their paths,
+        # and the serializations of subtrees shared with other images (or earlier calls) are reused.
+        # Keeping a reference keeps those subtrees interned for the next image.
+        image_config = self._frozen_config = freeze(self.config)
         # If there is a konflux stanza in the image config, merge it with the main config
         if image_config.konflux is not Missing:
-            image_config = Model(deep_merge(image_config.primitive(), image_config.konflux.primitive()))
-        image_config: Dict[str, Any] = image_config.primitive()
-
-        group_config: Dict[str, Any] = group_config.primitive()
-        streams: Dict[str, Any] = streams.primitive()
+            image_config = image_config.deep_merged(image_config.konflux)
 
         # Remove image_config fields specified in ignore_keys
         for key in ignore_keys:
-            c = image_config
-            seg = None
-            p = None
-            for seg in key.split("."):
-                if seg not in c:
-                    p = None
-                    break
-                p = c
-                c = c[seg]
-            if p and seg:
-                del p[seg]
-
-        message = {
-            "config": image_config,
-        }
+            image_config = image_config.delete_in(key.split("."))
+
+        # The digest is the sha256 of json.dumps({"config": ..., "repos": ..., "streams": ...}, sort_keys=True).
+        # Repos and streams are shared by many images, so their serializations are spliced in from
+        # ConfigDigestInputs instead of being resolved and serialized again for every image.
+        shared_inputs = ConfigDigestInputs.of(self.runtime)
+        parts = [f'"config": {image_config.canonical_json()}']
 
         repos = set(image_config.get("enabled_repos", []) + image_config.get("non_shipping_repos", []))
         if repos:
-            # Use runtime.repos which handles both old-style and new-style configurations
-            message["repos"] = {repo: self.runtime.repos[repo].to_dict() for repo in repos}
+            entries = ', '.join(f'{json.dumps(repo)}: {shared_inputs.repo_json(repo)}' for repo in sorted(repos))
+            parts.append(f'"repos": {{{entries}}}')
 
         builders = image_config.get("from", {}).get("builder", [])
         from_stream = image_config.get("from", {}).get("stream")
@@ -758,15 +796,13 @@ class ImageMetadata(Metadata):
         if from_stream:
             referred_streams.add(from_stream)
         if referred_streams:
-            message["streams"] = {
-                stream: self.runtime.resolve_stream(stream).get('image') for stream in referred_streams
-            }
-
-        # Avoid non serializable objects. Known to occur for PosixPath objects in content.source.modifications.
-        def default(o):
-            return f"<<non-serializable: {type(o).__qualname__}>>"
+            entries = ', '.join(
+                f'{json.dumps(stream)}: {shared_inputs.stream_json(stream)}' for stream in sorted(referred_streams)
+            )
+            parts.append(f'"streams": {{{entries}}}')
 
-        digest = hashlib.sha256(json.dumps(message, sort_keys=True, default=default).encode("utf-8")).hexdigest()
+        message = '{' + ', '.join(parts) + '}'
+        digest = hashlib.sha256(message.encode("utf-8")).hexdigest()
         return "sha256:" + digest
 
     @property
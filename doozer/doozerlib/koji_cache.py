@@ -0,0 +1,130 @@
+"""
+Persistent storage for koji API results which can safely be reused across doozer invocations
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from artcommonlib import logutil
+
+LOGGER = logutil.get_logger(__name__)
+
+# Default upper bound on the total size of the serialized results kept in the store
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# The total size of the store is only recomputed every this many writes
+EVICTION_CHECK_INTERVAL = 200
+
+# Fraction of max_bytes the store is trimmed down to once it grows beyond max_bytes
+EVICTION_LOW_WATERMARK = 0.8
+
+
+class KojiResultCache:
+    """
+    A size-bounded, least-recently-used key/value store backed by sqlite.
+    Values must be JSON serializable. The store can be shared by threads within a process and by
+    concurrent processes using the same database file. Storage errors are logged and treated as
+    cache misses; they never fail the koji call being cached.
+    """
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=60, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+        with self._lock:
+            self._evict_unsafe()
+
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, return_on_miss: Any = None) -> Any:
+        hashed_key = self._hash_key(key)
+        with self._lock:
+            try:
+                row = self._conn.execute('SELECT value FROM results WHERE key = ?', (hashed_key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return return_on_miss
+                self._conn.execute('UPDATE results SET accessed = ? WHERE key = ?', (time.time(), hashed_key))
+            except sqlite3.Error as e:
+                LOGGER.warning('Failed reading koji result cache %s: %s', self.path, e)
+                self.misses += 1
+                return return_on_miss
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store value under key. Returns False if the value could not be stored.
+        """
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            return False
+        hashed_key = self._hash_key(key)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)',
+                    (hashed_key, serialized, len(serialized), time.time()),
+                )
+                self.writes += 1
+                self._writes_since_check += 1
+                if self._writes_since_check >= EVICTION_CHECK_INTERVAL:
+                    self._evict_unsafe()
+            except sqlite3.Error as e:
+                LOGGER.warning('Failed writing koji result cache %s: %s', self.path, e)
+                return False
+        return True
+
+    def _evict_unsafe(self):
+        """Call while holding lock! Drops least recently used entries once the store exceeds max_bytes."""
+        self._writes_since_check = 0
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        to_free = total - int(self.max_bytes * EVICTION_LOW_WATERMARK)
+        victims = []
+        for key, size in self._conn.execute('SELECT key, size FROM results ORDER BY accessed'):
+            victims.append((key,))
+            to_free -= size
+            if to_free <= 0:
+                break
+        self._conn.executemany('DELETE FROM results WHERE key = ?', victims)
+        self.evictions += len(victims)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'writes': self.writes,
+                'evictions': self.evictions,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from io import StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from artcommonlib import exectools
 from ruamel.yaml import YAML
@@ -15,6 +15,7 @@ from semver import VersionInfo
 from tenacity import retry, stop_after_attempt, wait_fixed
 
 LOGGER = logging.getLogger(__name__)
+_WHITESPACE = re.compile(r'\s*')
 yaml = YAML(typ='safe')
 yaml.default_flow_style = False
 yaml.preserve_quotes = True
@@ -139,10 +140,29 @@ async def render(
             return None
         # For other errors or when strict=True, raise an exception
         raise IOError(f"opm render failed with exit code {rc}: {err}")
+    if output_format == "json":
+        return list(load_json_stream(out))
     blobs = yaml.load_all(StringIO(out))
     return list(blobs)
 
 
+def load_json_stream(content: str) -> Iterator[dict]:
+    """Parse concatenated JSON documents, like the output of `opm render -o json`, one document at a time.
+
+    Unlike loading the same catalog as YAML, this doesn't build a YAML event stream and node tree first,
+    which is much faster and lighter on the large outputs of production index images.
+
+    :param content: The concatenated JSON documents.
+    :return: An iterator over the parsed documents.
+    """
+    decoder = json.JSONDecoder()
+    pos = _WHITESPACE.match(content).end()
+    while pos < len(content):
+        blob, pos = decoder.raw_decode(content, pos)
+        yield blob
+        pos = _WHITESPACE.match(content, pos).end()
+
+
 async def generate_basic_template(catalog_file: Path, template_file: Path, output_format: str = "yaml"):
     """
     Generate a basic FBC template from a catalog file.
@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from logging import Logger
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from artcommonlib import logutil
 from artcommonlib.assembly import assembly_metadata_config, assembly_rhcos_config
@@ -9,11 +9,14 @@ from artcommonlib.model import Model
 from artcommonlib.rpm_utils import parse_nvr
 from koji import ClientSession
 
-from doozerlib.brew import get_build_objects, list_archives_by_builds
+from doozerlib.brew import get_build_objects, list_archives_by_builds, list_tagged_builds
 from doozerlib.image import ImageMetadata
 from doozerlib.rpmcfg import RPMMetadata
 from doozerlib.util import strip_epoch, to_nvre
 
+# Arguments of a listTagged query for rpm builds: (tag, latest, inherit, event)
+TagListing = Tuple[str, bool, bool, Optional[int]]
+
 
 class PlashetBuilder:
     def __init__(self, koji_api: ClientSession, logger: Optional[Logger] = None) -> None:
@@ -22,6 +25,122 @@ class PlashetBuilder:
         self._build_cache: Dict[
             str, Optional[Dict]
         ] = {}  # Cache build_id/nvre -> build_dict to prevent unnecessary queries.
+        self._tagged_cache: Dict[TagListing, List[Dict]] = {}  # Cache listTagged results for rpm builds
+
+    @staticmethod
+    def tag_listing(tag: str, inherit: bool, assembly: Optional[str], event: Optional[int] = None) -> TagListing:
+        """Returns the listTagged query from_tag makes for the given arguments"""
+        # With assemblies enabled, all tagged builds are needed to find the latest ones for the assembly.
+        return tag, not assembly, inherit, event
+
+    def list_tagged(self, tag: str, latest: bool, inherit: bool, event: Optional[int] = None) -> List[Dict]:
+        """Returns RPM builds tagged into the specified brew tag. Results are cached.
+        :param tag: Brew tag name
+        :param latest: Only return the latest build of each package
+        :param inherit: Descend into brew tag inheritance
+        :param event: Brew event ID
+        :return: a list of Brew build dicts
+        """
+        key = (tag, latest, inherit, event)
+        if key not in self._tagged_cache:
+            self._tagged_cache[key] = self._koji_api.listTagged(
+                tag, latest=latest, inherit=inherit, event=event, type='rpm'
+            )
+        return self._tagged_cache[key]
+
+    def prefetch(self, tag_listings: Iterable[TagListing] = (), ids_or_nvrs: Iterable[Union[int, str]] = ()):
+        """Fetches tag listings and build infos the from_* methods will need, in one multicall each.
+        Build infos found in the tag listings are not fetched again.
+        :param tag_listings: listTagged queries, see tag_listing()
+        :param ids_or_nvrs: build IDs or NVRs
+        """
+        tag_listings = [listing for listing in dict.fromkeys(tag_listings) if listing not in self._tagged_cache]
+        if tag_listings:
+            self._logger.info("Prefetching %s Brew tag listings...", len(tag_listings))
+            for listing, builds in zip(tag_listings, list_tagged_builds(tag_listings, 'rpm', self._koji_api)):
+                self._tagged_cache[listing] = builds
+                for build in builds:
+                    self._cache_build(build)
+        ids_or_nvrs = set(ids_or_nvrs)
+        if ids_or_nvrs:
+            self._logger.info("Prefetching %s Brew build infos...", len(ids_or_nvrs))
+            self._get_builds(ids_or_nvrs)
+
+    def plan(
+        self,
+        el_versions: Iterable[int],
+        assembly: Optional[str],
+        releases_config: Model,
+        group_config: Model,
+        rpm_map: Dict[str, RPMMetadata],
+        image_metas: Iterable[ImageMetadata] = (),
+        rhcos: bool = False,
+        pinned_by_is: bool = True,
+    ) -> Set[str]:
+        """Returns every NVR the from_pinned_by_is, from_group_deps, from_image_member_deps and from_rhcos_deps
+        methods will look up for the given RHEL versions; pass them to prefetch().
+        :param el_versions: RHEL versions
+        :param assembly: Assembly name
+        :param releases_config: a Model for releases.yaml
+        :param group_config: a Model for group config
+        :param rpm_map: Map of rpm_distgit_key -> RPMMetadata
+        :param image_metas: Image members whose dependencies will be looked up
+        :param rhcos: True if RHCOS dependencies will be looked up
+        :param pinned_by_is: True if RPMs pinned by "is" will be looked up
+        :return: a set of NVRs
+        """
+        nvrs = set()
+        for el_version in el_versions:
+            if pinned_by_is:
+                nvrs.update(self._pinned_by_is_nvrs(el_version, assembly, releases_config, rpm_map).values())
+            nvrs.update(self._dep_nvrs(el_version, group_config.dependencies.rpms).values())
+            for image_meta in image_metas:
+                nvrs.update(self._image_member_dep_nvrs(el_version, assembly, releases_config, image_meta).values())
+            if rhcos:
+                nvrs.update(self._rhcos_dep_nvrs(el_version, assembly, releases_config).values())
+        return nvrs
+
+    @staticmethod
+    def _dep_nvrs(el_version: int, dependencies) -> Dict[str, str]:
+        """Returns rpms for this rhel version listed in dependencies; keys are rpm component names, values are nvrs"""
+        return {
+            parse_nvr(dep[f"el{el_version}"])["name"]: dep[f"el{el_version}"]
+            for dep in dependencies
+            if dep[f"el{el_version}"]
+        }
+
+    @staticmethod
+    def _pinned_by_is_nvrs(
+        el_version: int, assembly: str, releases_config: Model, rpm_map: Dict[str, RPMMetadata]
+    ) -> Dict[str, str]:
+        """Returns rpms pinned to the runtime assembly; keys are rpm component names, values are nvrs"""
+        pinned_nvrs: Dict[str, str] = {}
+        for distgit_key, rpm_meta in rpm_map.items():
+            meta_config = assembly_metadata_config(releases_config, assembly, 'rpm', distgit_key, rpm_meta.config)
+            nvr = meta_config["is"][f"el{el_version}"]
+            if not nvr:
+                continue
+            nvre_obj = parse_nvr(str(nvr))
+            if nvre_obj["name"] != rpm_meta.rpm_name:
+                raise ValueError(
+                    f"RPM {nvr} is pinned to assembly {assembly} for distgit key {distgit_key}, but its package name is not {rpm_meta.rpm_name}."
+                )
+            pinned_nvrs[nvre_obj["name"]] = nvr
+        return pinned_nvrs
+
+    @classmethod
+    def _image_member_dep_nvrs(
+        cls, el_version: int, assembly: str, releases_config: Model, image_meta: ImageMetadata
+    ) -> Dict[str, str]:
+        meta_config = assembly_metadata_config(
+            releases_config, assembly, 'image', image_meta.distgit_key, image_meta.config
+        )
+        return cls._dep_nvrs(el_version, meta_config.dependencies.rpms)
+
+    @classmethod
+    def _rhcos_dep_nvrs(cls, el_version: int, assembly: str, releases_config: Model) -> Dict[str, str]:
+        rhcos_config = assembly_rhcos_config(releases_config, assembly)
+        return cls._dep_nvrs(el_version, rhcos_config.dependencies.rpms)
 
     def _get_builds(self, ids_or_nvrs: Iterable[Union[int, str]]) -> List[Dict]:
         """Get build dicts from Brew. This method uses an internal cache to avoid unnecessary queries.
@@ -65,11 +184,11 @@ class PlashetBuilder:
         if not assembly:
             # Assemblies are disabled. We need the true latest tagged builds in the brew tag
             self._logger.info("Finding latest RPM builds in Brew tag %s...", tag)
-            builds = self._koji_api.listTagged(tag, latest=True, inherit=inherit, event=event, type='rpm')
+            builds = self.list_tagged(tag, latest=True, inherit=inherit, event=event)
         else:
             # Assemblies are enabled. We need all tagged builds in the brew tag then find the latest ones for the assembly.
             self._logger.info("Finding RPM builds specific to assembly %s in Brew tag %s...", assembly, tag)
-            tagged_builds = self._koji_api.listTagged(tag, latest=False, inherit=inherit, event=event, type='rpm')
+            tagged_builds = self.list_tagged(tag, latest=False, inherit=inherit, event=event)
             builds = find_latest_builds(tagged_builds, assembly)
         component_builds = {build["name"]: build for build in builds}
         for build in component_builds.values():  # Save to cache
@@ -89,25 +208,12 @@ class PlashetBuilder:
         :param rpm_map: Map of rpm_distgit_key -> RPMMetadata
         :return: a dict; keys are component names, values are Brew build dicts
         """
-        pinned_nvrs: Dict[
-            str, str
-        ] = {}  # rpms pinned to the runtime assembly; keys are rpm component names, values are nvrs
         component_builds: Dict[
             str, Dict
         ] = {}  # rpms pinned to the runtime assembly; keys are rpm component names, values are brew build dicts
 
         # Honor pinned rpm nvrs pinned by "is"
-        for distgit_key, rpm_meta in rpm_map.items():
-            meta_config = assembly_metadata_config(releases_config, assembly, 'rpm', distgit_key, rpm_meta.config)
-            nvr = meta_config["is"][f"el{el_version}"]
-            if not nvr:
-                continue
-            nvre_obj = parse_nvr(str(nvr))
-            if nvre_obj["name"] != rpm_meta.rpm_name:
-                raise ValueError(
-                    f"RPM {nvr} is pinned to assembly {assembly} for distgit key {distgit_key}, but its package name is not {rpm_meta.rpm_name}."
-                )
-            pinned_nvrs[nvre_obj["name"]] = nvr
+        pinned_nvrs = self._pinned_by_is_nvrs(el_version, assembly, releases_config, rpm_map)
         if pinned_nvrs:
             pinned_nvr_list = list(pinned_nvrs.values())
             self._logger.info(
@@ -134,11 +240,7 @@ class PlashetBuilder:
             str, Dict
         ] = {}  # rpms pinned to the runtime assembly; keys are rpm component names, values are brew build dicts
         # honor group dependencies
-        dep_nvrs = {
-            parse_nvr(dep[f"el{el_version}"])["name"]: dep[f"el{el_version}"]
-            for dep in group_config.dependencies.rpms
-            if dep[f"el{el_version}"]
-        }  # rpms for this rhel version listed in group dependencies; keys are rpm component names, values are nvrs
+        dep_nvrs = self._dep_nvrs(el_version, group_config.dependencies.rpms)
         if dep_nvrs:
             dep_nvr_list = list(dep_nvrs.values())
             self._logger.info(
@@ -209,15 +311,8 @@ class PlashetBuilder:
             str, Dict
         ] = {}  # rpms pinned to the runtime assembly; keys are rpm component names, values are brew build dicts
 
-        meta_config = assembly_metadata_config(
-            releases_config, assembly, 'image', image_meta.distgit_key, image_meta.config
-        )
         # honor image member dependencies
-        dep_nvrs = {
-            parse_nvr(dep[f"el{el_version}"])["name"]: dep[f"el{el_version}"]
-            for dep in meta_config.dependencies.rpms
-            if dep[f"el{el_version}"]
-        }  # rpms for this rhel version listed in member dependencies; keys are rpm component names, values are nvrs
+        dep_nvrs = self._image_member_dep_nvrs(el_version, assembly, releases_config, image_meta)
         if dep_nvrs:
             dep_nvr_list = list(dep_nvrs.values())
             self._logger.info(
@@ -250,14 +345,8 @@ class PlashetBuilder:
         :return: a dict; keys are component names, values are Brew build dicts
         """
         component_builds: Dict[str, Dict] = {}  # keys are rpm component names, values are brew build dicts
-        rhcos_config = assembly_rhcos_config(releases_config, assembly)
         # honor RHCOS dependencies
-        # rpms for this rhel version listed in RHCOS dependencies; keys are rpm component names, values are nvrs
-        dep_nvrs = {
-            parse_nvr(dep[f"el{el_version}"])["name"]: dep[f"el{el_version}"]
-            for dep in rhcos_config.dependencies.rpms
-            if dep[f"el{el_version}"]
-        }
+        dep_nvrs = self._rhcos_dep_nvrs(el_version, assembly, releases_config)
         if dep_nvrs:
             dep_nvr_list = list(dep_nvrs.values())
             self._logger.info(
@@ -1,13 +1,22 @@
 import asyncio
 import gzip
+import hashlib
 import io
 import logging
 import lzma
+import os
+import pickle
 import re
+import sys
+import tempfile
+import threading
 import xml.etree.ElementTree
+import zlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from logging import Logger
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 from urllib import parse
 
 import aiohttp
@@ -24,9 +33,19 @@ NAMESPACES = {
     "rpm": "http://linux.duke.edu/metadata/rpm",
     'common': 'http://linux.duke.edu/metadata/common',
 }
+PACKAGE_TAG = f"{{{NAMESPACES['common']}}}package"
 
+# Size of the chunks read from the network while streaming primary.xml
+PRIMARY_CHUNK_SIZE = 1024 * 1024
 
-@dataclass
+# Environment variable naming the directory used to cache parsed repodata on disk
+REPODATA_CACHE_DIR_ENV_VAR = 'DOOZER_REPODATA_CACHE_DIR'
+
+# Bump whenever the pickled layout of Repodata / Rpm / RpmModule changes
+REPODATA_CACHE_FORMAT_VERSION = 1
+
+
+@dataclass(slots=True)
 class Rpm:
     name: str
     epoch: int
@@ -119,19 +138,59 @@ class Rpm:
             if sourcerpm_elem is not None and sourcerpm_elem.text:
                 sourcerpm = sourcerpm_elem.text
 
+        # Names, versions, arches and source RPMs are shared by many packages in a repo; intern them
         return Rpm(
-            name=name.text,
+            name=sys.intern(name.text),
             epoch=int(version.attrib["epoch"]),
-            version=version.attrib["ver"],
+            version=sys.intern(version.attrib["ver"]),
             checksum=f'{checksum.attrib["type"]}:{checksum.text}',
             size=int(size.attrib["package"]),
             location=location.attrib["href"],
-            sourcerpm=sourcerpm,
-            release=version.attrib["rel"],
-            arch=arch.text,
+            sourcerpm=sys.intern(sourcerpm),
+            release=sys.intern(version.attrib["rel"]),
+            arch=sys.intern(arch.text),
         )
 
 
+class PrimaryXmlParser:
+    """
+    Incremental parser for primary.xml.
+
+    Data can be fed as it is downloaded and decompressed. Each <package> element is converted into an Rpm
+    as soon as it is complete and then discarded, so the full XML tree is never held in memory.
+    """
+
+    def __init__(self):
+        self._parser = xml.etree.ElementTree.XMLPullParser(
+            events=("start", "end"),
+            _parser=ET.DefusedXMLParser(target=xml.etree.ElementTree.TreeBuilder()),
+        )
+        self._root: Optional[xml.etree.ElementTree.Element] = None
+        self.rpms: List[Rpm] = []
+
+    def feed(self, data: bytes):
+        self._parser.feed(data)
+        self._read_events()
+
+    def close(self) -> List[Rpm]:
+        self._parser.close()
+        self._read_events()
+        return self.rpms
+
+    def _read_events(self):
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                continue
+            if elem.tag != PACKAGE_TAG:
+                continue
+            if elem.attrib.get("type") == "rpm":
+                self.rpms.append(Rpm.from_metadata(elem))
+            # Drop the finished package from the tree
+            self._root.clear()
+
+
 @dataclass
 class RpmModule:
     name: str
@@ -178,6 +237,55 @@ class Repodata:
     modules_checksum: Optional[str] = None
     modules_size: Optional[int] = None
     modules_url: Optional[str] = None
+    # Lazily built indexes over primary_rpms; reset whenever primary_rpms is reassigned
+    _rpms_by_name: Optional[Dict[str, List[Rpm]]] = field(default=None, init=False, repr=False, compare=False)
+    _latest_by_name: Optional[Dict[str, Rpm]] = field(default=None, init=False, repr=False, compare=False)
+    _latest_by_name_arch: Dict[Tuple[str, str], Optional[Rpm]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "primary_rpms":
+            super().__setattr__("_rpms_by_name", None)
+            super().__setattr__("_latest_by_name", None)
+            super().__setattr__("_latest_by_name_arch", {})
+
+    @property
+    def rpms_by_name(self) -> Dict[str, List[Rpm]]:
+        """
+        Index of primary_rpms by package name.
+        """
+        if self._rpms_by_name is None:
+            index: Dict[str, List[Rpm]] = {}
+            for rpm in self.primary_rpms:
+                index.setdefault(rpm.name, []).append(rpm)
+            self._rpms_by_name = index
+        return self._rpms_by_name
+
+    @property
+    def latest_by_name(self) -> Dict[str, Rpm]:
+        """
+        Latest RPM of each package name, regardless of arch.
+        """
+        if self._latest_by_name is None:
+            self._latest_by_name = {name: self._find_latest_rpm(rpms) for name, rpms in self.rpms_by_name.items()}
+        return self._latest_by_name
+
+    def get_rpms_by_name(self, name: str, arch: str) -> List[Rpm]:
+        """
+        Return all RPMs with the given package name that are installable on arch (arch-specific or noarch).
+        """
+        return [rpm for rpm in self.rpms_by_name.get(name, []) if rpm.arch == arch or rpm.arch == 'noarch']
+
+    def get_latest_rpm(self, name: str, arch: str) -> Optional[Rpm]:
+        """
+        Return the latest RPM with the given package name that is installable on arch.
+        """
+        key = (name, arch)
+        if key not in self._latest_by_name_arch:
+            self._latest_by_name_arch[key] = self._find_latest_rpm(self.get_rpms_by_name(name, arch))
+        return self._latest_by_name_arch[key]
 
     def get_rpms(self, items: Union[str, Iterable[str]], arch: str) -> Tuple[list[Rpm], list[str]]:
         """
@@ -205,26 +313,26 @@ class Repodata:
         for item in items:
             is_nvr, rpm_name = self._detect_nvr_vs_name(item)
 
-            matching_rpms = [
-                rpm for rpm in self.primary_rpms if rpm.name == rpm_name and (rpm.arch == arch or rpm.arch == 'noarch')
-            ]
+            if not is_nvr:
+                # For package names, return only the latest version
+                latest_rpm = self.get_latest_rpm(rpm_name, arch)
+                if latest_rpm:
+                    found_rpms.append(latest_rpm)
+                else:
+                    not_found.append(item)
+                continue
 
+            matching_rpms = self.get_rpms_by_name(rpm_name, arch)
             if not matching_rpms:
                 not_found.append(item)
                 continue
 
-            if is_nvr:
-                filtered_rpms = self._filter_nvr_versions(item, matching_rpms, rpm_name)
-                found_rpms.extend(filtered_rpms)
-                # If specific version wasn't found, mark original NVR as not found
-                specific_rpm = self._find_specific_rpm(item, matching_rpms)
-                if not specific_rpm:
-                    not_found.append(item)
-            else:
-                # For package names, return only the latest version
-                latest_rpm = self._find_latest_rpm(matching_rpms)
-                if latest_rpm:
-                    found_rpms.append(latest_rpm)
+            filtered_rpms = self._filter_nvr_versions(item, matching_rpms, rpm_name)
+            found_rpms.extend(filtered_rpms)
+            # If specific version wasn't found, mark original NVR as not found
+            specific_rpm = self._find_specific_rpm(item, matching_rpms)
+            if not specific_rpm:
+                not_found.append(item)
 
         return found_rpms, sorted(not_found)
 
@@ -364,6 +472,101 @@ class Repodata:
 
 
 class RepodataLoader:
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        :param cache_dir: Directory in which parsed repodata is cached, keyed by the primary and modules
+            checksums advertised in repomd.xml. Defaults to $DOOZER_REPODATA_CACHE_DIR; caching is disabled if neither is set.
+        """
+        cache_dir = cache_dir or os.environ.get(REPODATA_CACHE_DIR_ENV_VAR)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    @staticmethod
+    def _data_checksum(data_element) -> Optional[str]:
+        checksum_element = data_element.find('repo:checksum', NAMESPACES)
+        if checksum_element is None or not checksum_element.text:
+            return None
+        return f"{checksum_element.attrib['type']}:{checksum_element.text}"
+
+    def cache_path(self, primary_checksum: str, modules_checksum: Optional[str]) -> Optional[Path]:
+        """
+        Return the location of the cache entry for the given repomd checksums, or None if caching is disabled.
+        The same content published under different URLs shares a single entry.
+        """
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha256(
+            f"{REPODATA_CACHE_FORMAT_VERSION}\0{primary_checksum}\0{modules_checksum or ''}".encode()
+        ).hexdigest()
+        return self.cache_dir / f"{key}.pickle"
+
+    @staticmethod
+    def _read_cache(path: Path, primary_checksum: str, modules_checksum: Optional[str]) -> Optional["Repodata"]:
+        try:
+            with path.open('rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            LOGGER.warning('Ignoring unreadable repodata cache entry %s: %s', path, e)
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get('format_version') != REPODATA_CACHE_FORMAT_VERSION
+            or entry.get('primary_checksum') != primary_checksum
+            or entry.get('modules_checksum') != modules_checksum
+            or not isinstance(entry.get('repodata'), Repodata)
+        ):
+            LOGGER.warning('Ignoring stale repodata cache entry %s', path)
+            return None
+        return entry['repodata']
+
+    @staticmethod
+    def _write_cache(path: Path, primary_checksum: str, modules_checksum: Optional[str], repodata: "Repodata"):
+        # Build the name index before pickling so that readers get it for free
+        repodata.rpms_by_name
+        entry = {
+            'format_version': REPODATA_CACHE_FORMAT_VERSION,
+            'primary_checksum': primary_checksum,
+            'modules_checksum': modules_checksum,
+            'repodata': repodata,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a private temp file and rename it into place, so that concurrent
+            # jobs sharing the cache directory never observe a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            LOGGER.warning('Failed to write repodata cache entry %s: %s', path, e)
+
+    @staticmethod
+    async def _fetch_remote_primary(session: aiohttp.ClientSession, url: str) -> List[Rpm]:
+        """
+        Download, decompress and parse primary.xml in a single streaming pass.
+        """
+        if url.endswith('.gz'):
+            decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        elif url.endswith('.xz'):
+            decompressor = lzma.LZMADecompressor()
+        else:
+            raise IOError(f'Unknown compression for: {url}')
+
+        parser = PrimaryXmlParser()
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.content.iter_chunked(PRIMARY_CHUNK_SIZE):
+                parser.feed(decompressor.decompress(chunk))
+        if hasattr(decompressor, 'flush'):
+            # zlib may hold back buffered output; LZMADecompressor has nothing to flush
+            parser.feed(decompressor.flush())
+        return parser.close()
+
     @staticmethod
     async def _fetch_remote_compressed(session: aiohttp.ClientSession, url: Optional[str]):
         if not url:
@@ -411,6 +614,7 @@ class RepodataLoader:
             if primary_location is None:
                 raise ValueError("Couldn't find primary location in repodata")
             primary_url = parse.urljoin(repo_url, primary_location.attrib['href'])
+            primary_checksum = self._data_checksum(primary_data_element)
 
             modules_url = None
             modules_checksum = None
@@ -422,15 +626,22 @@ class RepodataLoader:
                     raise ValueError("Couldn't find modules location in repodata")
                 modules_url = parse.urljoin(repo_url, modules_location.attrib['href'])
 
-                modules_checksum_element = modules_data_element.find('repo:checksum', NAMESPACES)
-                if modules_checksum_element is not None:
-                    modules_checksum = f"{modules_checksum_element.attrib['type']}:{modules_checksum_element.text}"
+                modules_checksum = self._data_checksum(modules_data_element)
 
                 modules_size_element = modules_data_element.find('repo:size', NAMESPACES)
                 if modules_size_element is not None:
                     modules_size = int(modules_size_element.text)
 
-            @retry(
+            cache_path = self.cache_path(primary_checksum, modules_checksum) if primary_checksum else None
+            if cache_path:
+                repodata = await asyncio.to_thread(self._read_cache, cache_path, primary_checksum, modules_checksum)
+                if repodata:
+                    LOGGER.debug('Loaded %s from repodata cache %s', repo_name, cache_path)
+                    repodata.name = repo_name
+                    repodata.modules_url = modules_url
+                    return repodata
+
+            retry_on_network_errors = retry(
                 reraise=True,
                 stop=stop_after_attempt(5),
                 wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -446,27 +657,104 @@ class RepodataLoader:
                 ),
                 before_sleep=before_sleep_log(LOGGER, logging.WARNING),
             )
+
+            @retry_on_network_errors
             async def fetch_remote_compressed(url: Optional[str]):
                 return await self._fetch_remote_compressed(session, url)
 
-            primary_bytes, modules_bytes = await asyncio.gather(
-                fetch_remote_compressed(primary_url),
+            @retry_on_network_errors
+            async def fetch_remote_primary(url: str):
+                return await self._fetch_remote_primary(session, url)
+
+            primary_rpms, modules_bytes = await asyncio.gather(
+                fetch_remote_primary(primary_url),
                 fetch_remote_compressed(modules_url),
             )
 
         yaml = YAML(typ='safe')
-        repodata = Repodata.from_metadatas(
-            repo_name,
-            ET.fromstring(primary_bytes),
-            list(yaml.load_all(modules_bytes) if modules_bytes else []),
+        modules = [
+            RpmModule.from_metadata(metadata)
+            for metadata in (yaml.load_all(modules_bytes) if modules_bytes else [])
+            if metadata['document'] == 'modulemd'
+        ]
+        repodata = Repodata(
+            name=repo_name,
+            primary_rpms=primary_rpms,
+            modules=modules,
             modules_checksum=modules_checksum,
             modules_size=modules_size,
             modules_url=modules_url,
         )
+        if cache_path:
+            await asyncio.to_thread(self._write_cache, cache_path, primary_checksum, modules_checksum, repodata)
         return repodata
 
 
+@dataclass
+class LatestRpmIndex:
+    """Latest rpms available from one ordered set of repodatas, e.g. the enabled repos of an image for one arch.
+    Images sharing the same enabled repos share the same index.
+    """
+
+    repodatas: List[Repodata]  # also keeps the repodatas alive, so ids in OutdatedRPMFinder's cache keys stay unique
+    all_modules: Dict[
+        str, Dict[int, List[Tuple[str, RpmModule]]]
+    ]  # module_name_stream => version => [(repo_name, module_object)]
+    all_modular_rpms: Dict[
+        str, Dict[str, Dict[str, RpmModule]]
+    ]  # rpm_nvera => repo_name => module_nsvca => module_object
+    candidate_non_modular_rpms: Dict[str, Tuple[str, Rpm]]  # package_name => (repo_name, rpm)
+    # enabled module streams => package_name => (repo_name, rpm)
+    candidate_modular_rpms: Dict[FrozenSet[Tuple[str, FrozenSet[str]]], Dict[str, Tuple[str, Rpm]]] = field(
+        default_factory=dict
+    )
+
+
 class OutdatedRPMFinder:
+    # Maximum number of repodata sets whose LatestRpmIndex is kept
+    INDEX_CACHE_SIZE = 128
+    # Indexes are shared by all finders, keyed by the ids of the repodatas they were built from.
+    # Repodatas are loaded once per runtime and reused by every image enabling them.
+    _index_cache: "OrderedDict[Tuple[int, ...], LatestRpmIndex]" = OrderedDict()
+    _index_cache_lock = threading.Lock()
+
+    @classmethod
+    def clear_index_cache(cls):
+        with cls._index_cache_lock:
+            cls._index_cache.clear()
+
+    def get_latest_rpm_index(self, repodatas: List[Repodata]) -> LatestRpmIndex:
+        """Returns the LatestRpmIndex of the given repodatas, building it on first use"""
+        key = tuple(id(repodata) for repodata in repodatas)
+        with self._index_cache_lock:
+            index = self._index_cache.get(key)
+            if index:
+                self._index_cache.move_to_end(key)
+                return index
+
+        # Populate dicts to hold all modules and all modular rpms
+        all_modules: Dict[str, Dict[int, List[Tuple[str, RpmModule]]]] = {}
+        all_modular_rpms: Dict[str, Dict[str, Dict[str, RpmModule]]] = {}
+        for repodata in repodatas:
+            for module in repodata.modules:
+                all_modules.setdefault(module.name_stream, {}).setdefault(module.version, []).append(
+                    (repodata.name, module)
+                )
+                for nevra in module.rpms:
+                    all_modular_rpms.setdefault(nevra, {}).setdefault(repodata.name, {})[module.nsvca] = module
+        index = LatestRpmIndex(
+            repodatas=list(repodatas),
+            all_modules=all_modules,
+            all_modular_rpms=all_modular_rpms,
+            # fetch all visible non-modular rpms that are latest among all configured repos
+            candidate_non_modular_rpms=self._find_candidate_non_modular_rpms(repodatas, all_modular_rpms),
+        )
+        with self._index_cache_lock:
+            self._index_cache[key] = index
+            while len(self._index_cache) > self.INDEX_CACHE_SIZE:
+                self._index_cache.popitem(last=False)
+        return index
+
     @staticmethod
     def _find_candidate_modular_rpms(all_modules, enabled_streams):
         """Finds all candidate modular rpms in enabled module streams"""
@@ -499,17 +787,26 @@ class OutdatedRPMFinder:
         return candidate_modular_rpms
 
     @staticmethod
-    def _find_candidate_non_modular_rpms(all_non_modular_rpms):
+    def _find_candidate_non_modular_rpms(repodatas: List[Repodata], all_modular_rpms: Dict[str, Any]):
         """Finds all candidate non-modular rpms.
-        For each non-modular rpm, if there is another candidate modular rpm with the same package name,
-        the non-modular rpm will be exempt.
+        For each package name, this is the latest non-modular rpm among all repos.
+        Uses each repo's precomputed latest-by-name index unless some rpms have to be excluded as modular.
         """
         candidate_non_modular_rpms: Dict[str, Tuple[str, Rpm]] = {}  # package_name => (repo_name, rpm)
-        for nevra, repo in all_non_modular_rpms.items():
-            rpm = Rpm.from_nevra(nevra)
-            _, candidate = candidate_non_modular_rpms.get(rpm.name, (None, None))
-            if not candidate or rpm.compare(candidate) > 0:
-                candidate_non_modular_rpms[rpm.name] = (repo, rpm)
+        for repodata in repodatas:
+            if not all_modular_rpms:
+                latest_rpms = repodata.latest_by_name
+            else:
+                latest_rpms = {}
+                for name, rpms in repodata.rpms_by_name.items():
+                    non_modular_rpms = [rpm for rpm in rpms if rpm.nevra not in all_modular_rpms]
+                    if non_modular_rpms:
+                        latest_rpms[name] = repodata._find_latest_rpm(non_modular_rpms)
+            for name, rpm in latest_rpms.items():
+                _, candidate = candidate_non_modular_rpms.get(name, (None, None))
+                # An rpm available from several repos is attributed to the last of them
+                if not candidate or rpm.compare(candidate) > 0 or rpm.nevra == candidate.nevra:
+                    candidate_non_modular_rpms[name] = (repodata.name, rpm)
         return candidate_non_modular_rpms
 
     def find_non_latest_rpms(
@@ -537,20 +834,8 @@ class OutdatedRPMFinder:
         # This approach is not perfect, but it should be good enough for our use cases.
 
         logger.info("Determining which module streams are enabled")
-        # Populate dicts to hold all modules and all modular rpms
-        all_modules: Dict[
-            str, Dict[int, List[Tuple[str, RpmModule]]]
-        ] = {}  # module_name_stream => version => [(repo_name, module_object)]
-        all_modular_rpms: Dict[
-            str, Dict[str, Dict[str, RpmModule]]
-        ] = {}  # rpm_nvera => repo_name => module_nsvca => module_object
-        for repodata in repodatas:
-            for module in repodata.modules:
-                all_modules.setdefault(module.name_stream, {}).setdefault(module.version, []).append(
-                    (repodata.name, module)
-                )
-                for nevra in module.rpms:
-                    all_modular_rpms.setdefault(nevra, {}).setdefault(repodata.name, {})[module.nsvca] = module
+        index = self.get_latest_rpm_index(repodatas)
+        all_modular_rpms = index.all_modular_rpms
 
         # Populate a dict to hold enabled module streams
         enabled_streams: Dict[str, Set[str]] = {}  # module_stream => {context}
@@ -566,18 +851,13 @@ class OutdatedRPMFinder:
         if not enabled_streams:
             logger.info("Looks like no module streams are enabled")
         else:
-            candidate_modular_rpms = self._find_candidate_modular_rpms(all_modules, enabled_streams)
-
-        # Populate a dict to hold all non-modular rpms
-        all_non_modular_rpms: Dict[str, str] = {}  # rpm_nvera => repo_name
-        for repodata in repodatas:
-            for rpm in repodata.primary_rpms:
-                if rpm.nevra in all_modular_rpms:
-                    continue  # It is a modular rpm
-                all_non_modular_rpms[rpm.nevra] = repodata.name
-
-        # fetch all visible non-modular rpms that are latest among all configured repos
-        candidate_non_modular_rpms = self._find_candidate_non_modular_rpms(all_non_modular_rpms)
+            streams_key = frozenset((stream, frozenset(contexts)) for stream, contexts in enabled_streams.items())
+            candidate_modular_rpms = index.candidate_modular_rpms.get(streams_key)
+            if candidate_modular_rpms is None:
+                candidate_modular_rpms = index.candidate_modular_rpms[streams_key] = self._find_candidate_modular_rpms(
+                    index.all_modules, enabled_streams
+                )
+        candidate_non_modular_rpms = index.candidate_non_modular_rpms
 
         # Compare archive rpms to all candidate rpms
         results: List[Tuple[str, str, str]] = []
@@ -161,6 +161,8 @@ class Repo(object):
         # contains repository metadata.
         # This fields holds a cache for the repository metadata.
         self._repodatas: Dict[str, Repodata] = {}  # key is arch, value is Repodata instance
+        # Directory shared across runs in which parsed repodata is cached; see RepodataLoader
+        self.repodata_cache_dir: Optional[str] = None
         self._repodata_cache_locks = {arch: threading.Lock() for arch in valid_arches}
 
     @property
@@ -341,7 +343,7 @@ class Repo(object):
             return repodata
         name = f"{self.name}-{arch}"
         repourl = cast(str, self.baseurl("unsigned", arch))
-        repodata = self._repodatas[arch] = await RepodataLoader().load(name, repourl)
+        repodata = self._repodatas[arch] = await RepodataLoader(self.repodata_cache_dir).load(name, repourl)
 
         if self.excludepkgs:
             LOGGER.info(f"Excluding packages from {name} based on following patterns: {self.excludepkgs}")
@@ -423,6 +425,7 @@ class Repos(object):
         gpgcheck=True,
         plashet_config: Optional[PlashetConfig] = None,
         template_vars: Optional[Dict[str, str]] = None,
+        repodata_cache_dir: Optional[str] = None,
     ):
         """
         Initialize Repos collection.
@@ -432,6 +435,7 @@ class Repos(object):
         :param gpgcheck: Whether to enable GPG signature checking
         :param plashet_config: Global plashet configuration (required for plashet type repos)
         :param template_vars: Additional template variables for URL substitution
+        :param repodata_cache_dir: Directory in which parsed repodata is cached across runs (None to disable)
         """
         self._arches = arches
         self._repos: Dict[str, Repo] = {}
@@ -465,6 +469,9 @@ class Repos(object):
                 self._repos[name] = Repo(name, repo, self._arches, gpgcheck=gpgcheck)
                 repotypes.extend(self._repos[name].repotypes)
 
+        for repo in self._repos.values():
+            repo.repodata_cache_dir = repodata_cache_dir
+
         self.names = tuple(names)
         self.repotypes = list(set(repotypes))  # leave only unique values
 
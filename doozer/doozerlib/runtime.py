@@ -16,7 +16,7 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import click
 import yaml
-from artcommonlib import exectools, gitdata
+from artcommonlib import exectools, gitdata, oc_image_info
 from artcommonlib.assembly import (
     AssemblyTypes,
     assembly_basis_event,
@@ -494,6 +494,12 @@ class Runtime(GroupRuntime):
 
         if self.cache_dir:
             self.cache_dir = os.path.abspath(self.cache_dir)
+            # Results of koji calls pinned to a brew event never change, so keep them across invocations
+            brew.KojiWrapper.enable_persistent_cache(self.koji_cache_path)
+            atexit.register(self._log_koji_cache_stats)
+            # Digest-pinned image metadata never changes; keep it on disk when Redis is not available
+            oc_image_info.set_disk_cache_dir(self.oc_image_info_cache_dir)
+            atexit.register(self._log_oc_image_info_cache_stats)
 
         # get_releases_config also inits self.releases_config
         self.assembly_type = assembly_type(self.get_releases_config(), self.assembly)
@@ -653,7 +659,12 @@ class Runtime(GroupRuntime):
             repos_config = self._get_repos_config()
             plashet_config = self.get_plashet_config()
             self.repos = Repos(
-                repos_config, self.arches, self.gpgcheck, plashet_config=plashet_config, template_vars=replace_vars
+                repos_config,
+                self.arches,
+                self.gpgcheck,
+                plashet_config=plashet_config,
+                template_vars=replace_vars,
+                repodata_cache_dir=self.repodata_cache_dir,
             )
             self.freeze_automation = self.group_config.freeze_automation or FREEZE_AUTOMATION_NO  # type: ignore
 
@@ -1240,6 +1251,61 @@ class Runtime(GroupRuntime):
             return None
         os.path.join(self.cache_dir, self.user or "default", 'git')
 
+    @property
+    def koji_cache_path(self):
+        """Returns the path of the database in which koji API results are persisted.
+        :return: The path. None if caching is disabled.
+        """
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, self.user or "default", 'koji-results.sqlite')
+
+    def _log_koji_cache_stats(self):
+        stats = brew.KojiWrapper.get_persistent_cache_stats()
+        if stats:
+            self._logger.info('Persistent koji result cache %s: %s', self.koji_cache_path, stats)
+
+    @property
+    def oc_image_info_cache_dir(self):
+        """Returns the directory where `oc image info` output is cached when Redis is not available.
+        :return: The directory. None if caching is disabled.
+        """
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, self.user or "default", 'oc-image-info')
+
+    def _log_oc_image_info_cache_stats(self):
+        stats = oc_image_info.get_cache_stats()
+        if stats['lookups']:
+            self._logger.info('oc image info cache: %s', stats)
+
+    @property
+    def createrepo_cache_dir(self):
+        """Returns the directory where createrepo_c caches package checksums.
+        :return: The directory. None if caching is disabled.
+        """
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, self.user or "default", 'createrepo')
+
+    @property
+    def repodata_cache_dir(self):
+        """Returns the directory where parsed yum repodata is cached.
+        :return: The directory. None if caching is disabled.
+        """
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, self.user or "default", 'repodata')
+
+    @property
+    def gitdata_cache_dir(self):
+        """Returns the directory where parsed ocp-build-data files are cached.
+        :return: The directory. None if caching is disabled.
+        """
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, self.user or "default", 'gitdata')
+
     def export_sources(self, output):
         self._logger.info('Writing sources to {}'.format(output))
         with io.open(output, 'w', encoding='utf-8') as sources_file:
@@ -1384,6 +1450,7 @@ class Runtime(GroupRuntime):
             commitish=self.group_commitish,
             reclone=self.upcycle,
             logger=self._logger,
+            parse_cache_dir=self.gitdata_cache_dir,
         )
         self._build_data_loader = BuildDataLoader(
             data_path=self.data_path,
@@ -1,11 +1,14 @@
 import logging
 import os
 import shutil
+import threading
+import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple, cast
 
 from artcommonlib import assertion, constants, exectools
 from artcommonlib import util as art_util
@@ -22,6 +25,11 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+# How long the heads listed from a remote repo are trusted before ls-remote is run again
+REMOTE_HEADS_TTL_SECONDS = 600
+# Maximum number of concurrent ls-remote processes when prefetching heads
+REMOTE_HEADS_CONCURRENCY = 16
+
 
 @dataclass
 class SourceResolution:
@@ -64,6 +72,89 @@ class SourceResolution:
         return self.https_url
 
 
+class RemoteHeadsCache:
+    """A process-wide cache of the branch heads of remote git repos.
+
+    All heads of a repo are listed with a single `git ls-remote --heads`, so that resolving the
+    target, stage and fallback branches of every image sharing that repo costs one subprocess.
+    Concurrent lookups of the same repo wait for the in-flight listing instead of starting another.
+
+    The cache is cleared whenever a SourceResolver is created (i.e. per Runtime) and at the start
+    of each prefetch pass, so heads are never carried over from an earlier resolve pass.
+    """
+
+    def __init__(self, ttl_seconds: float = REMOTE_HEADS_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._url_locks.clear()
+
+    def _get_fresh(self, git_url: str) -> Optional[Dict[str, str]]:
+        entry = self._entries.get(git_url)
+        if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        return None
+
+    def get_heads(self, git_url: str) -> Dict[str, str]:
+        """Return a map of branch name to commit hash for the heads of a remote repo.
+        :param git_url: The HTTPS URL of the repo.
+        :raises ChildProcessError: If the heads could not be listed; failures are not cached.
+        """
+        with self._lock:
+            heads = self._get_fresh(git_url)
+            if heads is not None:
+                return heads
+            url_lock = self._url_locks.setdefault(git_url, threading.Lock())
+
+        with url_lock:
+            with self._lock:
+                heads = self._get_fresh(git_url)
+            if heads is not None:
+                return heads  # Listed by another thread while we waited
+            heads = self._list_heads(git_url)
+            with self._lock:
+                self._entries[git_url] = (time.monotonic(), heads)
+            return heads
+
+    @staticmethod
+    def _list_heads(git_url: str) -> Dict[str, str]:
+        LOGGER.info('Listing branches of %s', git_url)
+        auth_env = get_github_git_auth_env(url=git_url)
+        out, _ = exectools.cmd_assert(['git', 'ls-remote', '--heads', git_url], retries=3, set_env=auth_env)
+        heads = {}
+        for line in out.splitlines():
+            parts = line.split()
+            if len(parts) == 2 and parts[1].startswith('refs/heads/'):
+                heads[parts[1][len('refs/heads/') :]] = parts[0]
+        return heads
+
+    def prefetch(self, git_urls: Iterable[str], concurrency: int = REMOTE_HEADS_CONCURRENCY):
+        """List the heads of many repos concurrently; each unique repo is queried once.
+        Errors are logged and left for the individual lookups to report.
+        """
+        unique_urls = {art_util.ensure_github_https_url(url) for url in git_urls}
+        if not unique_urls:
+            return
+
+        def _prefetch(url: str):
+            try:
+                self.get_heads(url)
+            except Exception as err:
+                LOGGER.warning('Failed to list branches of %s: %s', url, err)
+
+        LOGGER.info('Prefetching branches of %s remote repos', len(unique_urls))
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(unique_urls))) as executor:
+            list(executor.map(_prefetch, sorted(unique_urls)))
+
+
+remote_heads_cache = RemoteHeadsCache()
+
+
 class SourceResolver:
     """A class for resolving source code repositories."""
 
@@ -99,6 +190,8 @@ class SourceResolver:
         self._group_config = group_config
         self._record_logger = record_logger
         self._state_holder = state_holder
+        # Don't resolve branches to heads listed for a previous runtime in this process
+        remote_heads_cache.clear()
 
     def resolve_source(self, meta: 'Metadata', no_clone: bool = False) -> SourceResolution:
         """Resolve the source code repository for the specified metadata.
@@ -334,6 +427,18 @@ class SourceResolver:
             return fallback_branch, result
         raise IOError('Requested fallback branch {} does not exist'.format(branch))
 
+    @staticmethod
+    def prefetch_remote_branches(source_details_list: Iterable[Dict[str, Any]]):
+        """List the branches of the remote repos of many sources up front, so that subsequent calls to
+        detect_remote_source_branch are served from the shared cache.
+        This starts a new resolve pass: heads listed before are dropped and listed again.
+        :param source_details_list: Source details from metadata configs, as passed to detect_remote_source_branch.
+        """
+        remote_heads_cache.clear()
+        remote_heads_cache.prefetch(
+            source_details.get("url_pull", source_details["url"]) for source_details in source_details_list
+        )
+
     @staticmethod
     def is_branch_commit_hash(branch):
         """
@@ -361,21 +466,18 @@ class SourceResolver:
                 hash, the hash will be returned without modification.
         """
         git_url = art_util.ensure_github_https_url(git_url)
-        auth_env = get_github_git_auth_env(url=git_url)
         LOGGER.info('Checking if target branch {} exists in {}'.format(branch, git_url))
 
         try:
-            out, _ = exectools.cmd_assert(
-                'git ls-remote --heads {} refs/heads/{}'.format(git_url, branch), retries=3, set_env=auth_env
-            )
+            heads = remote_heads_cache.get_heads(git_url)
         except Exception as err:
             LOGGER.error('Error attempting to find target branch {} hash: {}'.format(branch, err))
             return None
-        result = out.strip()
+        result = heads.get(branch)
         if not result and SourceResolver.is_branch_commit_hash(branch):
             return branch
 
-        return result.split()[0] if result else None
+        return result
 
     @staticmethod
     def _check_branch_protection(git_url: str, branch: str) -> bool:
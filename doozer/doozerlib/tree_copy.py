@@ -0,0 +1,225 @@
+"""
+Copies a source tree over a destination tree in-process, writing only what differs.
+
+Many images are rebased from the same upstream checkout, so the listing and content
+hashes of a source tree are computed once per process and shared by every copy from it.
+Upstream checkouts are not modified while a rebase runs.
+"""
+
+import fnmatch
+import hashlib
+import os
+import shutil
+import stat
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # not on Linux
+    fcntl = None
+
+# ioctl request cloning the content of one file into another on copy-on-write filesystems (linux/fs.h)
+FICLONE = 0x40049409
+
+
+@dataclass
+class CopyStats:
+    copied_files: int = 0
+    copied_bytes: int = 0
+    skipped_files: int = 0
+    skipped_bytes: int = 0
+    removed: int = 0
+
+
+class SourceTreeSnapshot:
+    """Listing of a source tree, with content hashes computed on demand and remembered."""
+
+    _cache: Dict[Tuple[str, Tuple[str, ...]], 'SourceTreeSnapshot'] = {}
+    # One lock per tree, so that a tree is scanned once while unrelated trees are scanned concurrently
+    _scan_locks: Dict[Tuple[str, Tuple[str, ...]], threading.Lock] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, root: str, ignore: Iterable[str] = ()):
+        self.root = root
+        self.ignore = tuple(sorted(ignore))
+        self.dirs = set()
+        self.files: Dict[str, os.stat_result] = {}
+        self.symlinks: Dict[str, str] = {}
+        self._digests: Dict[str, str] = {}
+        self._digests_lock = threading.Lock()
+        self._scan()
+
+    @classmethod
+    def of(cls, root: str, ignore: Iterable[str] = ()) -> 'SourceTreeSnapshot':
+        """Return the snapshot of a source tree shared by everything copying from it."""
+        key = (os.path.realpath(root), tuple(sorted(ignore)))
+        with cls._cache_lock:
+            snapshot = cls._cache.get(key)
+            if snapshot is not None:
+                return snapshot
+            scan_lock = cls._scan_locks.setdefault(key, threading.Lock())
+        with scan_lock:
+            with cls._cache_lock:
+                snapshot = cls._cache.get(key)
+            if snapshot is None:
+                snapshot = cls(key[0], key[1])
+                with cls._cache_lock:
+                    cls._cache[key] = snapshot
+            return snapshot
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._scan_locks.clear()
+
+    def _scan(self):
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            rel_dir = os.path.relpath(dirpath, self.root)
+            for name in list(dirnames):
+                rel_path = os.path.normpath(os.path.join(rel_dir, name))
+                if is_ignored(name, self.ignore):
+                    dirnames.remove(name)
+                elif os.path.islink(os.path.join(dirpath, name)):
+                    # os.walk does not follow directory symlinks; copy them as links
+                    dirnames.remove(name)
+                    self.symlinks[rel_path] = os.readlink(os.path.join(dirpath, name))
+                else:
+                    self.dirs.add(rel_path)
+            for name in filenames:
+                if is_ignored(name, self.ignore):
+                    continue
+                rel_path = os.path.normpath(os.path.join(rel_dir, name))
+                path = os.path.join(dirpath, name)
+                st = os.lstat(path)
+                if stat.S_ISLNK(st.st_mode):
+                    self.symlinks[rel_path] = os.readlink(path)
+                elif stat.S_ISREG(st.st_mode):
+                    self.files[rel_path] = st
+
+    def digest(self, rel_path: str) -> str:
+        with self._digests_lock:
+            digest = self._digests.get(rel_path)
+        if digest is None:
+            digest = file_digest(os.path.join(self.root, rel_path))
+            with self._digests_lock:
+                self._digests[rel_path] = digest
+        return digest
+
+
+def is_ignored(name: str, ignore: Iterable[str]) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in ignore)
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _remove(path: str):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.unlink(path)
+
+
+def _clone_file(src: str, dest: str):
+    """Copy a file, sharing its blocks with the source where the filesystem supports reflinks."""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as s, open(dest, 'wb') as d:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            return
+        except OSError:
+            pass  # e.g. not a copy-on-write filesystem or across filesystems
+    shutil.copyfile(src, dest)
+
+
+def copy_tree(
+    src: str,
+    dest: str,
+    ignore: Iterable[str] = (),
+    delete: bool = False,
+    protect: Iterable[str] = (),
+    snapshot: Optional[SourceTreeSnapshot] = None,
+) -> CopyStats:
+    """
+    Make dest a copy of src, like rsync -a, without rewriting files whose content is already in place.
+
+    :param src: Source directory
+    :param dest: Destination directory; created if missing
+    :param ignore: Names (glob patterns) to neither copy nor delete at any depth
+    :param delete: Remove destination entries that are not in the source
+    :param protect: Top-level destination names never removed by delete
+    :param snapshot: Snapshot of src; defaults to the one shared across the process
+    :return: What was copied, skipped and removed
+    """
+    snapshot = snapshot or SourceTreeSnapshot.of(src, ignore)
+    stats = CopyStats()
+    os.makedirs(dest, exist_ok=True)
+
+    if delete:
+        protect = set(protect)
+        for dirpath, dirnames, filenames in os.walk(dest):
+            rel_dir = os.path.relpath(dirpath, dest)
+            for name in dirnames + filenames:
+                rel_path = os.path.normpath(os.path.join(rel_dir, name))
+                if is_ignored(name, snapshot.ignore) or (rel_dir == '.' and name in protect):
+                    if name in dirnames:
+                        dirnames.remove(name)
+                    continue
+                path = os.path.join(dirpath, name)
+                if name in dirnames and not os.path.islink(path):
+                    if rel_path in snapshot.dirs:
+                        continue
+                    dirnames.remove(name)
+                elif rel_path in snapshot.files or rel_path in snapshot.symlinks:
+                    continue
+                _remove(path)
+                stats.removed += 1
+
+    for rel_path in sorted(snapshot.dirs):  # parents first
+        path = os.path.join(dest, rel_path)
+        if os.path.lexists(path) and (os.path.islink(path) or not os.path.isdir(path)):
+            _remove(path)
+        os.makedirs(path, exist_ok=True)
+
+    for rel_path, target in snapshot.symlinks.items():
+        path = os.path.join(dest, rel_path)
+        if os.path.islink(path) and os.readlink(path) == target:
+            continue
+        if os.path.lexists(path):
+            _remove(path)
+        os.symlink(target, path)
+
+    for rel_path, src_stat in snapshot.files.items():
+        path = os.path.join(dest, rel_path)
+        try:
+            dest_stat = os.lstat(path)
+        except FileNotFoundError:
+            dest_stat = None
+        if (
+            dest_stat
+            and stat.S_ISREG(dest_stat.st_mode)
+            and dest_stat.st_size == src_stat.st_size
+            and file_digest(path) == snapshot.digest(rel_path)
+        ):
+            if stat.S_IMODE(dest_stat.st_mode) != stat.S_IMODE(src_stat.st_mode):
+                os.chmod(path, stat.S_IMODE(src_stat.st_mode))
+            stats.skipped_files += 1
+            stats.skipped_bytes += src_stat.st_size
+            continue
+        if dest_stat:
+            _remove(path)
+        src_path = os.path.join(snapshot.root, rel_path)
+        _clone_file(src_path, path)
+        shutil.copystat(src_path, path)
+        stats.copied_files += 1
+        stats.copied_bytes += src_stat.st_size
+
+    return stats
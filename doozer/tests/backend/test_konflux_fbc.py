@@ -193,6 +193,7 @@ class TestKonfluxFbcImporter(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(actual, mock_render.return_value)
         mock_render.assert_called_once_with(
             "test-index-image-pullspec",
+            output_format="json",
             migrate_level="none",
             auth=OpmRegistryAuth(path='/path/to/auth.json'),
             strict=True,
@@ -226,9 +227,11 @@ class TestKonfluxFbcImporter(unittest.IsolatedAsyncioTestCase):
             ],
         )
 
+    @patch("doozerlib.backend.konflux_fbc.util.oc_image_info_for_arch_async", new_callable=AsyncMock)
     @patch("doozerlib.backend.konflux_fbc.KonfluxFbcImporter._render_index_image", new_callable=AsyncMock)
-    async def test_get_catalog_blobs_from_index_image(self, mock_render_index_image):
-        index_image = "test-index-image"
+    async def test_get_catalog_blobs_from_index_image(self, mock_render_index_image, mock_oc_image_info):
+        index_image = "registry.example.com/test-index-image:v4.17"
+        mock_oc_image_info.return_value = {"digest": "sha256:arch", "listDigest": "sha256:list"}
         mock_render_index_image.return_value = [
             {"schema": "olm.package", "name": "test-package"},
             {"schema": "olm.channel", "name": "test-channel", "package": "test-package"},
@@ -246,7 +249,14 @@ class TestKonfluxFbcImporter(unittest.IsolatedAsyncioTestCase):
                 {"schema": "olm.channel", "name": "test-channel", "package": "test-package"},
             ],
         )
-        mock_render_index_image.assert_called_once_with(index_image, migrate_level="none", strict=True)
+        # Other packages are served from the same render of the index image, pinned to its digest
+        actual = await self.importer._get_catalog_blobs_from_index_image(index_image, "test-package4")
+        self.assertEqual(actual, [{"schema": "olm.package", "name": "test-package4"}])
+        self.assertIsNone(await self.importer._get_catalog_blobs_from_index_image(index_image, "test-package5"))
+        mock_render_index_image.assert_called_once_with(
+            "registry.example.com/test-index-image@sha256:list", migrate_level="none", strict=True
+        )
+        mock_oc_image_info.assert_called_once_with(index_image, registry_config="/path/to/auth.json")
 
     @patch("pathlib.Path.open")
     @patch("pathlib.Path.glob")
@@ -71,8 +71,8 @@ class TestKonfluxOlmBundleRebaser(IsolatedAsyncioTestCase):
         self.assertEqual(match.group(1), "namespace/image")
         self.assertEqual(match.group(2), "tag")
 
-    @patch("doozerlib.util.oc_image_info_for_arch_async")
-    async def test_replace_image_references(self, mock_oc_image_info):
+    @patch("artcommonlib.util.oc_image_info_many_async")
+    async def test_replace_image_references(self, mock_oc_image_info_many):
         old_registry = "registry.example.com"
         content = """
         apiVersion: v1
@@ -100,7 +100,9 @@ class TestKonfluxOlmBundleRebaser(IsolatedAsyncioTestCase):
             'listDigest': 'sha256:1234567890abcdef',
             'contentDigest': 'sha256:abcdef1234567890',
         }
-        mock_oc_image_info.return_value = mock_image_info
+        mock_oc_image_info_many.side_effect = lambda pullspecs, *options, **kwargs: {
+            pullspec: mock_image_info for pullspec in pullspecs
+        }
         # operator_image_ref_mode defaults to 'manifest-list' (uses listDigest)
         self.rebaser._group_config.get.return_value = 'namespace'
         metadata = MagicMock()
@@ -120,6 +122,8 @@ class TestKonfluxOlmBundleRebaser(IsolatedAsyncioTestCase):
             image: registry.redhat.io/openshift4/image@sha256:1234567890abcdef
         """
         self.assertEqual(new_content.strip(), expected_new_content.strip())
+        mock_oc_image_info_many.assert_awaited_once()
+        self.assertEqual(mock_oc_image_info_many.call_args.args[1], '--filter-by-os=amd64')
         self.assertIn('image', found_images)
         self.assertEqual(
             found_images['image'],
@@ -0,0 +1,270 @@
+import asyncio
+import json
+import queue
+import threading
+import time
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from doozerlib.backend.konflux_watcher import KonfluxWatcher
+from kubernetes.client import ApiClient, Configuration
+from kubernetes.client.exceptions import ApiException
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.resource import Resource
+
+
+def _pipelinerun(name: str, resource_version: str, succeeded: str = "Unknown") -> dict:
+    return {
+        "metadata": {"name": name, "resourceVersion": resource_version},
+        "status": {"conditions": [{"type": "Succeeded", "status": succeeded, "reason": "Test"}]},
+    }
+
+
+class FakeApiServer:
+    """Serves PipelineRun lists and watch events the way DynamicClient and watch.Watch would."""
+
+    def __init__(self, pipelineruns: list, resource_version: str):
+        self.pipelineruns = pipelineruns
+        self.resource_version = resource_version
+        self.expired_resource_versions = set()
+        self.events = queue.Queue()
+        self.list_calls = 0
+        self.watch_calls = []
+
+        self.pipelinerun_api = MagicMock()
+        self.pipelinerun_api.get.side_effect = self._list
+        self.pod_api = MagicMock()
+        self.pod_api.get.return_value = MagicMock(items=[])
+        self.dyn_client = MagicMock()
+        self.dyn_client.resources.get.side_effect = lambda api_version, kind: (
+            self.pipelinerun_api if kind == "PipelineRun" else self.pod_api
+        )
+
+    def _list(self, **kwargs):
+        self.list_calls += 1
+        items = []
+        for plr in self.pipelineruns:
+            item = MagicMock()
+            item.metadata.name = plr["metadata"]["name"]
+            item.to_dict.return_value = plr
+            items.append(item)
+        return MagicMock(items=items, metadata=MagicMock(resourceVersion=self.resource_version))
+
+    def watch(self):
+        server = self
+
+        class FakeWatch:
+            def stop(self):
+                pass
+
+            def stream(self, func, **kwargs):
+                server.watch_calls.append(kwargs)
+                if kwargs["resource_version"] in server.expired_resource_versions:
+                    raise ApiException(status=410, reason="Expired")
+                while True:
+                    try:
+                        event = server.events.get(timeout=0.05)
+                    except queue.Empty:
+                        return  # the server ended the watch request
+                    yield event
+
+        return FakeWatch()
+
+
+class FakeHttpResponse:
+    """An unread urllib3 response, as returned by ApiClient.call_api with _preload_content=False."""
+
+    def __init__(self, body: bytes = b"", chunks: list = ()):
+        self.data = body
+        self.chunks = chunks
+
+    def stream(self, amt=None, decode_content=False):
+        yield from self.chunks
+        if not self.chunks:
+            time.sleep(0.05)  # the server ends an idle watch request after its timeout
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class FakeHttpApiServer:
+    """Answers the HTTP requests of a real DynamicClient, so that watch.Watch parses real watch streams."""
+
+    def __init__(self, pipelinerun_lists: list, watch_streams: dict):
+        self.pipelinerun_lists = pipelinerun_lists  # [(resourceVersion, [pipelinerun, ...]), ...] served in turn
+        self.watch_streams = watch_streams  # resourceVersion -> [event, ...]
+        self.requests = []
+
+    def call_api(self, path, method, path_params, query_params, header_params, **kwargs):
+        query = dict(query_params)
+        self.requests.append((path, query))
+        if path.endswith("/pods"):
+            return FakeHttpResponse(
+                json.dumps({"apiVersion": "v1", "kind": "PodList", "metadata": {}, "items": []}).encode()
+            )
+        if query.get("watch"):
+            events = self.watch_streams.pop(query["resourceVersion"], [])
+            return FakeHttpResponse(chunks=[f"{json.dumps(event)}\n".encode() for event in events])
+        resource_version, items = (
+            self.pipelinerun_lists.pop(0) if len(self.pipelinerun_lists) > 1 else self.pipelinerun_lists[0]
+        )
+        body = {
+            "apiVersion": "tekton.dev/v1",
+            "kind": "PipelineRunList",
+            "metadata": {"resourceVersion": resource_version},
+            "items": items,
+        }
+        return FakeHttpResponse(json.dumps(body).encode())
+
+    def watch_requests(self):
+        return [query for path, query in self.requests if query.get("watch")]
+
+
+class FakeDiscoverer:
+    """Serves the PipelineRun and Pod resources without a discovery round-trip."""
+
+    def __init__(self, client, cache_file=None):
+        self.client = client
+
+    def get(self, api_version, kind):
+        if kind == "PipelineRun":
+            return Resource(
+                prefix="apis",
+                group="tekton.dev",
+                api_version="v1",
+                kind=kind,
+                name="pipelineruns",
+                namespaced=True,
+                client=self.client,
+            )
+        return Resource(
+            prefix="api", group="", api_version="v1", kind=kind, name="pods", namespaced=True, client=self.client
+        )
+
+
+async def _wait_until(predicate, timeout: float = 5):
+    """Wait for the watcher thread to reach a state; asyncio.sleep may be patched by other test modules."""
+    deadline = time.monotonic() + timeout
+    while not await predicate() and time.monotonic() < deadline:
+        await asyncio.to_thread(time.sleep, 0.05)
+
+
+class TestKonfluxWatcherWatchMode(IsolatedAsyncioTestCase):
+    def _start_watcher(self, server: FakeApiServer) -> KonfluxWatcher:
+        with (
+            patch("doozerlib.backend.konflux_watcher.DynamicClient", return_value=server.dyn_client),
+            patch("doozerlib.backend.konflux_watcher.CoreV1Api"),
+        ):
+            watcher = KonfluxWatcher(
+                "test-ns", Configuration(), asyncio.get_running_loop(), {"doozer-watch-id": "1"}, use_watch=True
+            )
+        self.addCleanup(watcher.stop)
+        return watcher
+
+    async def test_waiter_notified_by_watch_event(self):
+        server = FakeApiServer([_pipelinerun("plr-1", "10")], "10")
+        with patch("doozerlib.backend.konflux_watcher.watch.Watch", side_effect=server.watch):
+            watcher = self._start_watcher(server)
+            waiter = asyncio.create_task(watcher.wait_for_pipelinerun_termination("plr-1"))
+            await asyncio.to_thread(time.sleep, 0.2)
+            self.assertFalse(waiter.done())
+
+            server.events.put({"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": "11"}}})
+            server.events.put({"type": "MODIFIED", "raw_object": _pipelinerun("plr-1", "12", succeeded="True")})
+            info = await asyncio.wait_for(waiter, timeout=5)
+
+            async def resumed():
+                return server.watch_calls[-1]["resource_version"] != "10"
+
+            await _wait_until(resumed)
+
+        self.assertTrue(info.is_terminal())
+        self.assertEqual(server.list_calls, 1)
+        self.assertEqual(server.watch_calls[0]["resource_version"], "10")
+        self.assertEqual(server.watch_calls[0]["label_selector"], "doozer-watch-id=1")
+        self.assertIn(("allowWatchBookmarks", "true"), server.watch_calls[0]["query_params"])
+        # Later watches resume from the last resourceVersion observed
+        self.assertEqual(server.watch_calls[-1]["resource_version"], "12")
+
+    async def test_relist_on_gone(self):
+        server = FakeApiServer([_pipelinerun("plr-1", "10")], "10")
+        server.expired_resource_versions.add("10")
+        relisted = threading.Event()
+
+        def list_and_update(**kwargs):
+            # The second list observes a newer state of the PipelineRun
+            if server.list_calls == 1:
+                server.pipelineruns = [_pipelinerun("plr-1", "20", succeeded="False")]
+                server.resource_version = "20"
+                relisted.set()
+            return FakeApiServer._list(server, **kwargs)
+
+        server.pipelinerun_api.get.side_effect = list_and_update
+        with patch("doozerlib.backend.konflux_watcher.watch.Watch", side_effect=server.watch):
+            watcher = self._start_watcher(server)
+            info = await asyncio.wait_for(watcher.wait_for_pipelinerun_termination("plr-1"), timeout=5)
+
+        self.assertTrue(relisted.is_set())
+        self.assertTrue(info.is_terminal())
+        self.assertEqual(server.list_calls, 2)
+
+    async def test_deleted_pipelinerun_is_forgotten(self):
+        server = FakeApiServer([_pipelinerun("plr-1", "10")], "10")
+        with patch("doozerlib.backend.konflux_watcher.watch.Watch", side_effect=server.watch):
+            watcher = self._start_watcher(server)
+            await asyncio.wait_for(watcher.get_pipelinerun_info("plr-1"), timeout=5)
+            server.events.put({"type": "DELETED", "raw_object": _pipelinerun("plr-1", "11")})
+
+            async def forgotten():
+                return not await watcher.get_pipelinerun_infos()
+
+            await _wait_until(forgotten)
+        self.assertEqual(await watcher.get_pipelinerun_infos(), [])
+
+
+class TestKonfluxWatcherWatchStream(IsolatedAsyncioTestCase):
+    """Drives the real watch.Watch stream parsing and DynamicClient request handling."""
+
+    async def test_watch_stream_and_relist_on_gone(self):
+        server = FakeHttpApiServer(
+            pipelinerun_lists=[
+                ("10", [_pipelinerun("plr-1", "10")]),
+                ("20", [_pipelinerun("plr-1", "20")]),
+            ],
+            watch_streams={
+                "10": [
+                    {"type": "MODIFIED", "object": _pipelinerun("plr-1", "11")},
+                    # The resourceVersion the watch resumed from has been compacted away
+                    {
+                        "type": "ERROR",
+                        "object": {"kind": "Status", "code": 410, "reason": "Expired", "message": "gone"},
+                    },
+                ],
+                "20": [{"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "25"}}}],
+                "25": [{"type": "MODIFIED", "object": _pipelinerun("plr-1", "26", succeeded="True")}],
+            },
+        )
+        with (
+            patch.object(ApiClient, "call_api", side_effect=server.call_api),
+            patch(
+                "doozerlib.backend.konflux_watcher.DynamicClient",
+                side_effect=lambda client: DynamicClient(client, discoverer=FakeDiscoverer),
+            ),
+        ):
+            watcher = KonfluxWatcher(
+                "test-ns", Configuration(), asyncio.get_running_loop(), {"doozer-watch-id": "1"}, use_watch=True
+            )
+            self.addCleanup(watcher.stop)
+            info = await asyncio.wait_for(watcher.wait_for_pipelinerun_termination("plr-1"), timeout=5)
+
+        self.assertTrue(info.is_terminal())
+        lists = [query for path, query in server.requests if path.endswith("/pipelineruns") and not query.get("watch")]
+        self.assertEqual(len(lists), 2)
+        watches = server.watch_requests()
+        self.assertEqual([query["resourceVersion"] for query in watches[:3]], ["10", "20", "25"])
+        self.assertEqual(watches[0]["labelSelector"], "doozer-watch-id=1")
+        self.assertEqual(watches[0]["allowWatchBookmarks"], "true")
+        self.assertEqual(watches[0]["timeoutSeconds"], KonfluxWatcher.WATCH_TIMEOUT_SECONDS)
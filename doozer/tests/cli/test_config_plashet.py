@@ -1,7 +1,11 @@
+import tempfile
 import unittest
-from unittest.mock import patch
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from artcommonlib.rpm_utils import parse_nvr
+from doozerlib.cli import config_plashet
 from doozerlib.cli.config_plashet import compare_nvr_openshift_aware
 
 
@@ -323,5 +327,150 @@ class TestCompareNvrOpenshiftAwareWithTarget(unittest.TestCase):
         self.assertEqual(result, 1, "rhaos4.21 should beat rhaos4.22 when target is (4, 21)")
 
 
+@patch("doozerlib.cli.config_plashet.logger", MagicMock())
+class TestAssembleRepo(unittest.TestCase):
+    NVRS = ["foo-1.0-1.el9", "bar-2.0-1.el9"]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.config = SimpleNamespace(
+            arch=[("x86_64", "signed"), ("s390x", "signed")],
+            dest_dir=str(self.root / "dest"),
+            repo_subdir=None,
+            exclude_package=[],
+            packages_path=str(self.root / "brewroot" / "el{el_version}"),
+            signing_keys=("fd431d51",),
+            incremental_from=None,
+        )
+        self.expected_rpms = {}
+        for nvr in self.NVRS:
+            parsed = parse_nvr(nvr)
+            rpms = []
+            for arch in ("x86_64", "s390x", "noarch"):
+                rpm = {"name": parsed["name"], "version": parsed["version"], "release": parsed["release"], "arch": arch}
+                rpms.append(rpm)
+                self._add_rpm(nvr, rpm)
+            self.expected_rpms[nvr] = rpms
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _rpm_path(self, nvr: str, rpm: dict) -> Path:
+        parsed = parse_nvr(nvr)
+        filename = f"{rpm['name']}-{rpm['version']}-{rpm['release']}.{rpm['arch']}.rpm"
+        return (
+            self.root
+            / "brewroot/el9"
+            / parsed["name"]
+            / parsed["version"]
+            / parsed["release"]
+            / "data/signed/fd431d51"
+            / rpm["arch"]
+            / filename
+        )
+
+    def _add_rpm(self, nvr: str, rpm: dict):
+        path = self._rpm_path(nvr, rpm)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    def _assemble(self, createrepo_stats=None):
+        builds = [{"id": i, "nvr": nvr} for i, nvr in enumerate(self.NVRS)]
+        timings = {}
+        with (
+            patch("doozerlib.cli.config_plashet.get_build_objects", return_value=builds),
+            patch(
+                "doozerlib.cli.config_plashet.list_build_rpms",
+                side_effect=lambda ids, _: [self.expected_rpms[self.NVRS[i]] for i in ids],
+            ),
+            patch("doozerlib.cli.config_plashet.exectools.cmd_assert") as cmd_assert,
+        ):
+            config_plashet._assemble_repo(
+                self.config,
+                self.NVRS,
+                koji_api=MagicMock(),
+                timings=timings,
+                createrepo_cache_dir="/cache/createrepo",
+                createrepo_stats=createrepo_stats,
+            )
+        return cmd_assert, timings
+
+    def test_assemble_repo(self):
+        cmd_assert, timings = self._assemble()
+
+        self.assertEqual(
+            sorted(call.kwargs["cwd"] for call in cmd_assert.call_args_list),
+            [str(self.root / "dest/s390x"), str(self.root / "dest/x86_64")],
+        )
+        rpm_list = (self.root / "dest/x86_64/rpm_list").read_text().splitlines()
+        self.assertEqual(
+            rpm_list,
+            [
+                "Packages/foo-1.0-1.el9__x86_64__fd431d51/foo-1.0-1.el9.x86_64.rpm",
+                "Packages/foo-1.0-1.el9__noarch__fd431d51/foo-1.0-1.el9.noarch.rpm",
+                "Packages/bar-2.0-1.el9__x86_64__fd431d51/bar-2.0-1.el9.x86_64.rpm",
+                "Packages/bar-2.0-1.el9__noarch__fd431d51/bar-2.0-1.el9.noarch.rpm",
+            ],
+        )
+        self.assertTrue((self.root / "dest/s390x/Packages/bar-2.0-1.el9__s390x__fd431d51").is_symlink())
+        self.assertEqual(set(timings), {"koji_metadata", "scan", "list_rpms", "createrepo"})
+
+    def test_assemble_repo_waits_for_signed_rpms_together(self):
+        # Signing of several RPMs across arches is still in progress
+        late_rpms = [(nvr, rpm) for nvr in self.NVRS for rpm in self.expected_rpms[nvr] if rpm["arch"] != "noarch"]
+        for nvr, rpm in late_rpms:
+            self._rpm_path(nvr, rpm).unlink()
+
+        def _sign(_):
+            for nvr, rpm in late_rpms:
+                self._add_rpm(nvr, rpm)
+
+        with patch("doozerlib.cli.config_plashet.time.sleep", side_effect=_sign) as sleep:
+            cmd_assert, _ = self._assemble()
+        sleep.assert_called_once()
+        self.assertEqual(cmd_assert.call_count, 2)
+        self.assertIn(
+            "Packages/bar-2.0-1.el9__s390x__fd431d51/bar-2.0-1.el9.s390x.rpm",
+            (self.root / "dest/s390x/rpm_list").read_text().splitlines(),
+        )
+
+    def test_assemble_repo_incremental(self):
+        self._assemble()
+        previous_plashet = self.config.dest_dir
+        # Only x86_64 has repodata in the previous plashet (createrepo_c is mocked)
+        Path(previous_plashet, "x86_64/repodata").mkdir()
+        Path(previous_plashet, "x86_64/repodata/repomd.xml").touch()
+        self.NVRS = self.NVRS + ["baz-1.0-1.el9"]
+        parsed = parse_nvr("baz-1.0-1.el9")
+        self.expected_rpms["baz-1.0-1.el9"] = [
+            {"name": "baz", "version": parsed["version"], "release": parsed["release"], "arch": "x86_64"}
+        ]
+        self._add_rpm("baz-1.0-1.el9", self.expected_rpms["baz-1.0-1.el9"][0])
+
+        self.config.dest_dir = str(self.root / "dest2")
+        self.config.incremental_from = previous_plashet
+        createrepo_stats = {}
+        cmd_assert, _ = self._assemble(createrepo_stats)
+
+        cmds = {call.kwargs["cwd"]: call.args[0] for call in cmd_assert.call_args_list}
+        x86_64_cmd = cmds[str(self.root / "dest2/x86_64")]
+        self.assertIn("--update", x86_64_cmd)
+        self.assertIn(f"--update-md-path={previous_plashet}/x86_64", x86_64_cmd)
+        self.assertIn("--cachedir=/cache/createrepo", x86_64_cmd)
+        self.assertNotIn("--update", cmds[str(self.root / "dest2/s390x")])
+        self.assertEqual(createrepo_stats["x86_64"], {"rpm_overlap": 4, "total": 5})
+        self.assertEqual(createrepo_stats["s390x"], {"rpm_overlap": 0, "total": 4})
+
+    @patch("doozerlib.cli.config_plashet.SIGNED_RPMS_WAIT_SECONDS", 0)
+    def test_assemble_repo_incomplete_signed_rpms(self):
+        self._rpm_path("foo-1.0-1.el9", self.expected_rpms["foo-1.0-1.el9"][0]).unlink()
+        self._add_rpm(
+            "foo-1.0-1.el9", {"name": "foo-debuginfo", "version": "1.0", "release": "1.el9", "arch": "x86_64"}
+        )
+        with self.assertRaisesRegex(IOError, "incomplete"):
+            self._assemble()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,8 @@
+import asyncio
 import io
+import json
 import os
+from pathlib import Path
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -566,6 +569,131 @@ class TestGenPayloadCli(IsolatedAsyncioTestCase):
             ["good_src=good_pullspec"],  # mismatched_image notably absent
         )
 
+    @patch("aiofiles.open")
+    @patch("artcommonlib.exectools.cmd_gather_async")
+    @patch("artcommonlib.exectools.cmd_assert_async")
+    async def test_mirror_payload_content_skips_present_digests(self, exec_mock, gather_mock, open_mock):
+        gpcli = rgp_cli.GenPayloadCli(
+            output_dir="/tmp", apply=True, runtime=MagicMock(build_system='brew'), mirror_registry_concurrency=1
+        )
+        payload_entries = dict(
+            present=rgp_cli.PayloadEntry(
+                issues=[],
+                dest_pullspec="quay.io/org/repo:sha256-aaa",
+                image_inspector=Mock(get_pullspec=lambda: "registry.example.com/src@sha256:aaa"),
+            ),
+            absent=rgp_cli.PayloadEntry(
+                issues=[],
+                dest_pullspec="quay.io/org/repo:sha256-bbb",
+                image_inspector=Mock(get_pullspec=lambda: "registry.example.com/src@sha256:bbb"),
+            ),
+            other_registry=rgp_cli.PayloadEntry(
+                issues=[],
+                dest_pullspec="registry.example.com/org/repo:sha256-ccc",
+                image_inspector=Mock(get_pullspec=lambda: "registry.example.com/src@sha256:ccc"),
+            ),
+        )
+
+        async def fake_gather(cmd, check=True):
+            pullspec = cmd[6]
+            if pullspec.endswith("sha256-aaa"):
+                return 0, json.dumps({"digest": "sha256:aaa"}), ""
+            if pullspec.endswith("sha256-ccc"):
+                return 0, json.dumps([{"digest": "sha256:arch", "listDigest": "sha256:other"}]), ""
+            return 1, "", "manifest unknown"
+
+        gather_mock.side_effect = fake_gather
+        written = {}
+
+        def fake_open(path, **_):
+            buffer = written.setdefault(path.name, io.StringIO())
+            ctx = MagicMock()
+            ctx.__aenter__.return_value.write = AsyncMock(side_effect=lambda s: buffer.write(s))
+            return ctx
+
+        open_mock.side_effect = fake_open
+        exec_mock.return_value = None  # do not actually run the command
+
+        await gpcli.mirror_payload_content("s390x", payload_entries)
+
+        # The already-present digest is skipped; each remaining registry gets its own chunk
+        self.assertEqual(
+            sorted(buffer.getvalue() for buffer in written.values()),
+            [
+                "registry.example.com/src@sha256:bbb=quay.io/org/repo:sha256-bbb\n",
+                "registry.example.com/src@sha256:ccc=registry.example.com/org/repo:sha256-ccc\n",
+            ],
+        )
+        self.assertEqual(exec_mock.await_count, 2)
+        self.assertEqual(set(gpcli.mirror_registry_semaphores), {"quay.io", "registry.example.com"})
+
+    @patch("doozerlib.cli.release_gen_payload.MIRROR_CHUNK_SIZE", 1)
+    @patch("aiofiles.open")
+    @patch("artcommonlib.exectools.cmd_gather_async")
+    @patch("artcommonlib.exectools.cmd_assert_async")
+    async def test_mirror_payload_content_saturated_registry(self, exec_mock, gather_mock, open_mock):
+        gpcli = rgp_cli.GenPayloadCli(
+            output_dir="/tmp",
+            apply=True,
+            runtime=MagicMock(build_system='brew'),
+            mirror_concurrency=2,
+            mirror_registry_concurrency=1,
+        )
+        payload_entries = {
+            name: rgp_cli.PayloadEntry(
+                issues=[],
+                dest_pullspec=f"{registry}/org/repo:sha256-{name}",
+                image_inspector=Mock(get_pullspec=lambda name=name: f"registry.example.com/src@sha256:{name}"),
+            )
+            for name, registry in [("q1", "quay.io"), ("q2", "quay.io"), ("q3", "quay.io"), ("r1", "other.io")]
+        }
+        gather_mock.return_value = (1, "", "manifest unknown")
+        written = {}
+
+        def fake_open(path, **_):
+            buffer = written.setdefault(path.name, io.StringIO())
+            ctx = MagicMock()
+            ctx.__aenter__.return_value.write = AsyncMock(side_effect=lambda s: buffer.write(s))
+            return ctx
+
+        open_mock.side_effect = fake_open
+        other_registry_mirrored = asyncio.Event()
+
+        async def fake_mirror(cmd):
+            # quay.io chunks only finish once the other registry's chunk has run alongside them
+            content = written[Path(cmd[5].split("=", 1)[1]).name].getvalue()
+            if "=quay.io/" in content:
+                await other_registry_mirrored.wait()
+            else:
+                other_registry_mirrored.set()
+
+        exec_mock.side_effect = fake_mirror
+
+        await asyncio.wait_for(gpcli.mirror_payload_content("s390x", payload_entries), timeout=5)
+        self.assertEqual(exec_mock.await_count, 4)
+
+    @patch("artcommonlib.exectools.cmd_gather_async")
+    async def test_drop_already_mirrored_unreadable_info(self, gather_mock):
+        gpcli = rgp_cli.GenPayloadCli(output_dir="/tmp", runtime=MagicMock(build_system='brew'))
+        outputs = {
+            "sha256-aaa": "W1201 warning: partial output",
+            "sha256-bbb": json.dumps("unexpected"),
+            "sha256-ccc": json.dumps({"digest": "sha256:ccc"}),
+        }
+        gather_mock.side_effect = lambda cmd, check=True: (0, outputs[cmd[6].split(":")[-1]], "")
+        mirror_src_for_dest = {f"quay.io/org/repo:{tag}": f"src@{tag}" for tag in outputs}
+
+        remaining = await gpcli.drop_already_mirrored(mirror_src_for_dest)
+
+        # Destinations whose lookup cannot be understood are mirrored rather than failing the run
+        self.assertEqual(sorted(remaining), ["quay.io/org/repo:sha256-aaa", "quay.io/org/repo:sha256-bbb"])
+
+    def test_get_mirroring_destination_digest(self):
+        dest = rgp_cli.PayloadGenerator.get_mirroring_destination("sha256:abc", "quay.io/org/repo")
+        self.assertEqual(rgp_cli.PayloadGenerator.get_mirroring_destination_digest(dest), "sha256:abc")
+        self.assertIsNone(rgp_cli.PayloadGenerator.get_mirroring_destination_digest("quay.io/org/repo:latest"))
+        self.assertIsNone(rgp_cli.PayloadGenerator.get_mirroring_destination_digest("localhost:5000/repo"))
+
     @patch("doozerlib.cli.release_gen_payload.PayloadGenerator.build_payload_istag")
     async def test_generate_specific_payload_imagestreams(self, build_mock):
         build_mock.side_effect = lambda name, _: name  # just to make the test simpler
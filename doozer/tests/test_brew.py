@@ -320,3 +320,86 @@ class TestBrew(unittest.TestCase):
         errors = brew.watch_tasks(brew_session, log_func, tasks, terminate_event)
         self.assertTrue(all(map(lambda failure: failure == "Timeout watching task", errors.values())))
         brew_session.cancelTask.assert_has_calls([mock.call(task, recurse=True) for task in tasks], any_order=True)
+
+
+class TestKojiWrapperBatch(unittest.TestCase):
+    def setUp(self):
+        brew.KojiWrapper.clear_global_cache()
+        patcher = mock.patch("koji.ClientSession._callMethod", autospec=True)
+        self.super_call_method = patcher.start()
+        self.super_call_method.side_effect = self._fake_call
+        self.addCleanup(patcher.stop)
+        self.multicalls = []
+
+    def _fake_call(self, _session, name, args, kwargs=None, retry=True):
+        if name == "getEvent":
+            return {"id": args[0], "ts": 1700000000.0}
+        if name == "getBuild":
+            return {"nvr": args[0]}
+        if name != "multiCall":
+            raise ValueError(name)
+        self.multicalls.append(args[0])
+        entries = []
+        for call in args[0]:
+            params = call["params"]
+            if call["methodName"] == "getBuild":
+                if params[0] == "missing":
+                    entries.append({"faultCode": 1000, "faultString": "No such build"})
+                else:
+                    entries.append([{"nvr": params[0]}])
+            elif call["methodName"] == "getLatestBuilds":
+                entries.append([[{"event": params[-1]["event"]}]])
+        return entries
+
+    def test_batch_chunks_calls(self):
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"])
+        with koji_api.batch(chunk_size=2) as b:
+            calls = [b.getBuild(f"foo-1.0-{i}") for i in range(5)]
+        self.assertEqual([call.result["nvr"] for call in calls], [f"foo-1.0-{i}" for i in range(5)])
+        self.assertEqual([len(chunk) for chunk in self.multicalls], [2, 2, 1])
+
+    def test_batch_constrains_to_brew_event(self):
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"], brew_event=123)
+        with koji_api.batch() as b:
+            call = b.getLatestBuilds("tag", package="foo")
+        self.assertEqual(call.result, [{"event": 123}])
+
+        with self.assertRaises(IOError):
+            with koji_api.batch() as b:
+                b.getLastEvent()  # cannot be constrained to an event
+
+    def test_batch_uses_result_cache(self):
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"], force_instance_caching=True)
+        koji_api.getBuild("foo-1.0-1")  # a plain call populates the cache
+        with koji_api.batch() as b:
+            cached = b.getBuild("foo-1.0-1")
+            fetched = b.getBuild("foo-1.0-2")
+        self.assertTrue(cached.cache_hit)
+        self.assertFalse(fetched.cache_hit)
+        # Only the plain call and the miss went to koji
+        self.assertEqual([[call["params"][0] for call in chunk] for chunk in self.multicalls], [["foo-1.0-2"]])
+
+        # Batched results are cached individually
+        with koji_api.batch() as b:
+            call = b.getBuild("foo-1.0-2")
+        self.assertTrue(call.cache_hit)
+        self.assertEqual(len(self.multicalls), 1)
+
+    def test_batch_faults(self):
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"])
+        with self.assertRaises(koji.GenericError):
+            with koji_api.batch() as b:
+                b.getBuild("missing")
+
+        with koji_api.batch(strict=False) as b:
+            missing = b.getBuild("missing")
+            found = b.getBuild("foo-1.0-1")
+        self.assertEqual(found.result, {"nvr": "foo-1.0-1"})
+        with self.assertRaises(koji.GenericError):
+            missing.result
+
+    def test_helpers_use_batch(self):
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"])
+        builds = brew.get_build_objects(["a-1-1", "b-1-1", "c-1-1"], koji_api)
+        self.assertEqual([b["nvr"] for b in builds], ["a-1-1", "b-1-1", "c-1-1"])
+        self.assertEqual(len(self.multicalls), 1)
@@ -1,5 +1,9 @@
+import copy
+import hashlib
+import json
 import logging
 import os
+import pathlib
 import shutil
 import tempfile
 import unittest
@@ -8,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from artcommonlib import exectools
 from artcommonlib.model import Missing, Model
+from artcommonlib.util import deep_merge
 from artcommonlib.variants import BuildVariant
 from doozerlib import build_info, image
 from doozerlib.image import ImageMetadata, extract_builder_info_from_pullspec
@@ -625,6 +630,60 @@ class TestImageMetadata(unittest.TestCase):
         self.assertTrue(digest.startswith('sha256:'))
         self.assertEqual(len(digest), 71)  # 'sha256:' + 64 hex chars
 
+    def test_calculate_config_digest_shared_inputs(self):
+        """
+        Test that calculate_config_digest is unchanged by splicing in shared repo and stream serializations,
+        and that those are resolved once per runtime.
+        """
+        metadata = self._create_image_metadata('openshift/test_digest_shared')
+        metadata.config = Model(
+            {
+                'name': 'test-image',
+                'owners': ['someone@example.com'],
+                'enabled_repos': ['repo2', 'repo1'],
+                'from': {'builder': [{'stream': 'golang'}], 'stream': 'rhel'},
+                'content': {'source': {'git': {'url': 'x'}, 'modifications': [{'path': pathlib.Path('/a')}]}},
+            }
+        )
+        rt = metadata.runtime
+        rt.repos = {name: MagicMock(to_dict=MagicMock(return_value={'name': name})) for name in ['repo1', 'repo2']}
+        rt.resolve_stream.side_effect = lambda stream: Model({'image': f'registry/{stream}:latest'})
+
+        message = {
+            'config': {
+                'name': 'test-image',
+                'enabled_repos': ['repo2', 'repo1'],
+                'from': {'builder': [{'stream': 'golang'}], 'stream': 'rhel'},
+                'content': {'source': {'modifications': [{'path': '<<non-serializable: PosixPath>>'}]}},
+            },
+            'repos': {'repo1': {'name': 'repo1'}, 'repo2': {'name': 'repo2'}},
+            'streams': {'golang': 'registry/golang:latest', 'rhel': 'registry/rhel:latest'},
+        }
+        expected = 'sha256:' + hashlib.sha256(json.dumps(message, sort_keys=True).encode('utf-8')).hexdigest()
+        self.assertEqual(metadata.calculate_config_digest(rt.group_config, rt.streams), expected)
+        self.assertEqual(metadata.calculate_config_digest(rt.group_config, rt.streams), expected)
+        self.assertEqual(rt.resolve_stream.call_count, 2)
+        rt.repos['repo1'].to_dict.assert_called_once()
+
+    def test_calculate_config_digest_konflux_stanza(self):
+        """
+        Test that the konflux stanza is merged into the digested config and that the config itself is left alone.
+        """
+        metadata = self._create_image_metadata('openshift/test_digest_konflux')
+        config = {
+            'name': 'test-image',
+            'content': {'source': {'git': {'url': 'x'}, 'dockerfile': 'Dockerfile'}},
+            'konflux': {'content': {'source': {'dockerfile': 'Dockerfile.konflux'}}, 'network_mode': 'open'},
+        }
+        metadata.config = Model(copy.deepcopy(config))
+
+        merged = deep_merge(config, config['konflux'])
+        del merged['content']['source']['git']
+        message = {'config': merged}
+        expected = 'sha256:' + hashlib.sha256(json.dumps(message, sort_keys=True).encode('utf-8')).hexdigest()
+        self.assertEqual(metadata.calculate_config_digest(Model({}), Model({})), expected)
+        self.assertEqual(metadata.config.primitive(), config)
+
     @patch('doozerlib.image.SourceResolver')
     @patch('builtins.open', create=True)
     @patch('pathlib.Path.joinpath')
@@ -0,0 +1,107 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import koji
+from doozerlib import brew
+from doozerlib.koji_cache import KojiResultCache
+
+
+class TestKojiResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name, "koji.sqlite")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_put(self):
+        cache = KojiResultCache(self.path)
+        self.assertIsNone(cache.get("a"))
+        self.assertTrue(cache.put("a", {"id": 1, "nvr": "foo-1.0-1"}))
+        self.assertEqual(cache.get("a"), {"id": 1, "nvr": "foo-1.0-1"})
+        self.assertFalse(cache.put("b", object()))
+        cache.close()
+
+        # Entries survive across instances
+        cache = KojiResultCache(self.path)
+        self.assertEqual(cache.get("a"), {"id": 1, "nvr": "foo-1.0-1"})
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 0, "hit_rate": 1.0, "writes": 0, "evictions": 0})
+        cache.close()
+
+    @patch("doozerlib.koji_cache.EVICTION_CHECK_INTERVAL", 1)
+    def test_lru_eviction(self):
+        cache = KojiResultCache(self.path, max_bytes=30)
+        cache.put("a", "x" * 8)
+        cache.put("b", "x" * 8)
+        cache.put("c", "x" * 8)
+        cache.get("a")  # "b" is now the least recently used entry
+        cache.put("d", "x" * 8)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "x" * 8)
+        self.assertEqual(cache.get("d"), "x" * 8)
+        self.assertGreater(cache.stats()["evictions"], 0)
+        cache.close()
+
+
+class TestKojiWrapperPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        brew.KojiWrapper.enable_persistent_cache(Path(self.tmp_dir.name, "koji.sqlite"))
+
+    def tearDown(self):
+        brew.KojiWrapper.disable_persistent_cache()
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def _fake_call(name, args, kwargs=None, retry=True):
+        if name == "getEvent":
+            return {"id": args[0], "ts": 1700000000.0}
+        if name == "getBuild":
+            state = koji.BUILD_STATES["COMPLETE"] if args[0] == 1 else koji.BUILD_STATES["BUILDING"]
+            return {"id": args[0], "state": state}
+        if name == "getLatestBuilds":
+            return [{"id": 1, "event": kwargs["event"]}]
+        if name == "listTasks":
+            return []
+        raise ValueError(name)
+
+    @patch("koji.ClientSession._callMethod", autospec=True)
+    def test_event_pinned_calls_are_persisted(self, super_call_method):
+        super_call_method.side_effect = lambda _, *args, **kwargs: self._fake_call(*args, **kwargs)
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"], brew_event=100)
+        koji_api.getLatestBuilds("tag")
+        koji_api.getBuild(1)
+        koji_api.getBuild(2)  # still building; must not be persisted
+        koji_api.listTasks(brew.KojiWrapperOpts(brew_event_aware=True))  # not persistable
+        self.assertEqual(super_call_method.call_count, 5)
+
+        # A new invocation pinned to the same event is served from the store
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"], brew_event=100)
+        self.assertEqual(koji_api.getLatestBuilds("tag"), [{"id": 1, "event": 100}])
+        self.assertEqual(koji_api.getBuild(1)["id"], 1)
+        koji_api.getBuild(2)
+        koji_api.listTasks(brew.KojiWrapperOpts(brew_event_aware=True))
+        self.assertEqual(super_call_method.call_count, 7)
+
+        # Results are scoped to the event
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"], brew_event=101)
+        koji_api.getBuild(1)
+        self.assertEqual(super_call_method.call_count, 9)
+
+        stats = brew.KojiWrapper.get_persistent_cache_stats()
+        self.assertEqual(stats["hits"], 3)
+
+    @patch("koji.ClientSession._callMethod", autospec=True)
+    def test_unpinned_calls_are_not_persisted(self, super_call_method):
+        super_call_method.side_effect = lambda _, *args, **kwargs: self._fake_call(*args, **kwargs)
+        koji_api = brew.KojiWrapper(["https://brewhub.example.com"])
+        koji_api.getBuild(1)
+        koji_api.getBuild(1)
+        self.assertEqual(super_call_method.call_count, 2)
+        self.assertEqual(brew.KojiWrapper.get_persistent_cache_stats()["writes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ from artcommonlib.model import Model
 from artcommonlib.variants import BuildVariant
 from doozerlib.image import ImageMetadata
 from doozerlib.metadata import CgitAtomFeedEntry, Metadata, RebuildHintCode
+from doozerlib.source_resolver import remote_heads_cache
 
 
 class TestMetadata(TestCase):
@@ -460,9 +461,11 @@ class TestMetadata(TestCase):
         self.assertEqual(meta.needs_rebuild().code, RebuildHintCode.DELAYING_NEXT_ATTEMPT)
 
     @patch(
-        "doozerlib.metadata.exectools.cmd_assert", return_value=("296ac244f3e7fd2d937316639892f90f158718b0", "")
+        "doozerlib.metadata.exectools.cmd_assert",
+        return_value=("296ac244f3e7fd2d937316639892f90f158718b0\trefs/heads/master\n", ""),
     )  # emulate response to ls-remote of openshift/release
     def test_needs_rebuild_with_upstream(self, mock_cmd_assert):
+        remote_heads_cache.clear()
         runtime = self.runtime
         meta = self.meta
         koji_mock = self.koji_mock
@@ -482,6 +485,7 @@ class TestMetadata(TestCase):
                 'source': {
                     'git': {
                         'url': 'git@github.com:openshift/release.git',
+                        'branch': {'target': 'master'},
                     },
                 },
             }
@@ -37,6 +37,21 @@ class TestOpm(unittest.IsolatedAsyncioTestCase):
             ['render', '--migrate-level', 'none', '-o', 'yaml', '--', 'test-catalog'], auth=auth, check=False
         )
 
+    @patch('doozerlib.opm.gather_opm', new_callable=AsyncMock)
+    async def test_render_json(self, mock_gather_opm):
+        mock_gather_opm.return_value = (
+            0,
+            '{\n    "schema": "olm.package",\n    "name": "foo"\n}\n{"schema": "olm.channel", "package": "foo"}\n',
+            '',
+        )
+        blobs = await render('test-catalog', output_format='json', migrate_level='bundle-object-to-csv-metadata')
+        self.assertEqual(blobs, [{'schema': 'olm.package', 'name': 'foo'}, {'schema': 'olm.channel', 'package': 'foo'}])
+        mock_gather_opm.assert_called_once_with(
+            ['render', '--migrate-level', 'bundle-object-to-csv-metadata', '-o', 'json', '--', 'test-catalog'],
+            auth=None,
+            check=False,
+        )
+
     @patch("builtins.open")
     @patch('doozerlib.opm.gather_opm', new_callable=AsyncMock)
     async def test_generate_basic_template(self, mock_gather_opm, mock_open):
@@ -281,3 +281,35 @@ class TestPlashetBuilder(TestCase):
         )
         builder._get_builds.assert_called_once_with(["fake1-1.2.3-1.el8", "fake2-1.2.3-1.el8", "fake3-1.2.3-1.el8"])
         assembly_rhcos_config.assert_called_once()
+
+    @patch("doozerlib.plashet.get_build_objects")
+    @patch("doozerlib.plashet.list_tagged_builds")
+    def test_prefetch(self, list_tagged_builds: Mock, get_build_objects: Mock):
+        koji_api = MagicMock()
+        builder = PlashetBuilder(koji_api)
+        tagged = {
+            "id": 1,
+            "build_id": 1,
+            "name": "fake1",
+            "nvr": "fake1-1.2.3-1.assembly.art1.el8",
+            "release": "1.assembly.art1.el8",
+        }
+        list_tagged_builds.return_value = [[tagged]]
+        get_build_objects.return_value = [{"id": 2, "build_id": 2, "name": "dep", "nvr": "dep-1.0-1.el8"}]
+        group_config = Model({"dependencies": {"rpms": [{"el8": "dep-1.0-1.el8"}, {"el9": "dep-1.0-1.el9"}]}})
+
+        nvrs = builder.plan([8], "art1", Model(), group_config, {})
+        self.assertEqual(nvrs, {"dep-1.0-1.el8"})
+        listing = builder.tag_listing("fake-rhel-8-candidate", True, "art1", 123)
+        builder.prefetch([listing, listing], nvrs | {1})
+
+        list_tagged_builds.assert_called_once_with([("fake-rhel-8-candidate", False, True, 123)], "rpm", koji_api)
+        # The build found in the tag listing is not fetched again
+        get_build_objects.assert_called_once_with(["dep-1.0-1.el8"], koji_api)
+
+        # The from_* methods are served from the prefetched data
+        actual = builder.from_tag("fake-rhel-8-candidate", True, "art1", 123)
+        self.assertEqual(actual, {"fake1": tagged})
+        self.assertEqual(list(builder.from_group_deps(8, group_config, {}).keys()), ["dep"])
+        koji_api.listTagged.assert_not_called()
+        get_build_objects.assert_called_once()
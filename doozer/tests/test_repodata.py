@@ -1,10 +1,12 @@
+import gzip
+import tempfile
 from io import StringIO
 from typing import Optional
 from unittest import IsolatedAsyncioTestCase, TestCase
 from unittest.mock import ANY, AsyncMock, MagicMock, Mock, patch
 
 import defusedxml.ElementTree as ET
-from doozerlib.repodata import OutdatedRPMFinder, Repodata, RepodataLoader, Rpm, RpmModule
+from doozerlib.repodata import OutdatedRPMFinder, PrimaryXmlParser, Repodata, RepodataLoader, Rpm, RpmModule
 from ruamel.yaml import YAML
 
 
@@ -279,6 +281,39 @@ data:
             [m.nsvca for m in repodata.modules], ['aaa:rhel8:1:deadbeef:x86_64', 'bbb:rhel9:2:beefdead:x86_64']
         )
 
+    def test_rpms_by_name_index(self):
+        self.assertEqual(self.repodata.get_latest_rpm("foo", "x86_64"), self.rpms[0])
+        self.assertEqual(self.repodata.latest_by_name, {"foo": self.rpms[0], "bar": self.rpms[1]})
+
+        # Reassigning primary_rpms (e.g. when applying includepkgs/excludepkgs) resets the indexes
+        self.repodata.primary_rpms = [self.rpms[1]]
+        self.assertIsNone(self.repodata.get_latest_rpm("foo", "x86_64"))
+        self.assertEqual(self.repodata.rpms_by_name, {"bar": [self.rpms[1]]})
+
+    def test_primary_xml_parser(self):
+        parser = PrimaryXmlParser()
+        primary_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+<metadata packages="2" xmlns="http://linux.duke.edu/metadata/common" xmlns:rpm="http://linux.duke.edu/metadata/rpm">
+    <package type="rpm">
+        <name>foo</name>
+        <checksum pkgid="YES" type="sha256">sfy8dfa</checksum>
+        <size archive="3" installed="4" package="6" />
+        <location href="Packages/l/foo-1.2.3-1.el9.x86_64.rpm" />
+        <arch>x86_64</arch>
+        <version epoch="1" rel="1.el9" ver="1.2.3" />
+    </package>
+    <package type="other">
+        <name>ignored</name>
+    </package>
+</metadata>
+"""
+        # Feed byte by byte to exercise element boundaries spanning chunks
+        for i in range(len(primary_xml)):
+            parser.feed(primary_xml[i : i + 1])
+        rpms = parser.close()
+        self.assertEqual([rpm.nevra for rpm in rpms], ["foo-1:1.2.3-1.el9.x86_64"])
+        self.assertEqual(rpms[0].sourcerpm, "")
+
     def test_get_rpms_by_name_found(self):
         found, not_found = self.repodata.get_rpms("foo", arch="x86_64")
         self.assertEqual(len(found), 1)
@@ -921,9 +956,18 @@ data:
             raise ValueError("url")
 
         _fetch_remote_compressed.side_effect = _fake_fetch_remote_compressed
+
+        # primary.xml is streamed, decompressed and parsed in small chunks
+        compressed_primary = gzip.compress(_fake_fetch_remote_compressed(None, "primary.xml.gz"))
+
+        async def _iter_chunked(_):
+            for i in range(0, len(compressed_primary), 64):
+                yield compressed_primary[i : i + 64]
+
+        resp.__aenter__.return_value.content.iter_chunked = _iter_chunked
+
         repodata = await loader.load(repo_name, repo_url)
-        _fetch_remote_compressed.assert_any_await(
-            ANY,
+        session.get.assert_any_call(
             "https://example.com/repos/test/x86_64/os/repodata/06ed3172b751202671416050ea432945e54a36ee1ab8ef2cc71307234343f1ef-primary.xml.gz",
         )
         _fetch_remote_compressed.assert_any_await(
@@ -938,6 +982,53 @@ data:
             [m.nsvca for m in repodata.modules], ['aaa:rhel8:1:deadbeef:x86_64', 'bbb:rhel9:2:beefdead:x86_64']
         )
 
+    @patch("doozerlib.repodata.RepodataLoader._fetch_remote_compressed", autospec=True)
+    @patch("doozerlib.repodata.RepodataLoader._fetch_remote_primary", autospec=True)
+    @patch("aiohttp.ClientSession", autospec=True)
+    async def test_load_with_disk_cache(
+        self, ClientSession: Mock, _fetch_remote_primary: AsyncMock, _fetch_remote_compressed: AsyncMock
+    ):
+        session = ClientSession.return_value.__aenter__.return_value = Mock(name="session")
+        resp = session.get.return_value = AsyncMock(name="get")
+        resp.__aenter__.return_value.raise_for_status = Mock()
+        repomd_template = """<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo" xmlns:rpm="http://linux.duke.edu/metadata/rpm">
+  <data type="primary">
+    <checksum type="sha256">{checksum}</checksum>
+    <location href="repodata/{checksum}-primary.xml.gz"/>
+  </data>
+</repomd>
+"""
+        resp.__aenter__.return_value.text.return_value = repomd_template.format(checksum="aaaa")
+        _fetch_remote_primary.return_value = [Rpm.from_nevra("foo-1:1.2.3-1.el9.x86_64")]
+        _fetch_remote_compressed.return_value = b''
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            repodata = await RepodataLoader(cache_dir).load("test-x86_64", "https://example.com/a/x86_64/os")
+            self.assertEqual([rpm.nevra for rpm in repodata.primary_rpms], ["foo-1:1.2.3-1.el9.x86_64"])
+            _fetch_remote_primary.assert_awaited_once()
+
+            # Same repomd checksums published under a different repo: served from the cache
+            cached = await RepodataLoader(cache_dir).load("mirror-x86_64", "https://mirror.example.com/a/x86_64/os")
+            _fetch_remote_primary.assert_awaited_once()
+            self.assertEqual(cached.name, "mirror-x86_64")
+            self.assertEqual([rpm.nevra for rpm in cached.primary_rpms], ["foo-1:1.2.3-1.el9.x86_64"])
+            self.assertEqual(cached.get_latest_rpm("foo", "x86_64").nevra, "foo-1:1.2.3-1.el9.x86_64")
+
+            # A changed primary checksum invalidates the entry
+            resp.__aenter__.return_value.text.return_value = repomd_template.format(checksum="bbbb")
+            await RepodataLoader(cache_dir).load("test-x86_64", "https://example.com/a/x86_64/os")
+            self.assertEqual(_fetch_remote_primary.await_count, 2)
+
+    def test_cache_path(self):
+        with patch.dict("os.environ", clear=True):
+            self.assertIsNone(RepodataLoader().cache_path("sha256:aaaa", None))
+        loader = RepodataLoader("/tmp/cache")
+        path = loader.cache_path("sha256:aaaa", None)
+        self.assertEqual(path.parent.as_posix(), "/tmp/cache")
+        self.assertEqual(path, loader.cache_path("sha256:aaaa", None))
+        self.assertNotEqual(path, loader.cache_path("sha256:aaaa", "sha256:bbbb"))
+
 
 class TestOutdatedRPMFinder(IsolatedAsyncioTestCase):
     async def test_find_non_latest_rpms_with_no_repos(self):
@@ -1101,3 +1192,27 @@ class TestOutdatedRPMFinder(IsolatedAsyncioTestCase):
             ('f-0:1.0.0-el8.x86_64', 'f-0:999.0.0-el8.x86_64', 'bravo-x86_64'),
         ]
         self.assertEqual(actual, expected)
+
+    async def test_find_non_latest_rpms_shares_index(self):
+        repodatas = [
+            Repodata(
+                name="alfa-x86_64",
+                primary_rpms=[Rpm.from_nevra("a-0:2.0.0-el8.x86_64"), Rpm.from_nevra("b-0:2.0.0-el8.x86_64")],
+                modules=[],
+            ),
+        ]
+        logger = MagicMock()
+        first = OutdatedRPMFinder().find_non_latest_rpms(
+            [Rpm.from_nevra("a-0:1.0.0-el8.x86_64").to_dict()], repodatas, logger
+        )
+        with patch.object(OutdatedRPMFinder, "_find_candidate_non_modular_rpms") as find_candidates:
+            # Another image with the same enabled repos reuses the index
+            second = OutdatedRPMFinder().find_non_latest_rpms(
+                [Rpm.from_nevra("b-0:1.0.0-el8.x86_64").to_dict()], repodatas, logger
+            )
+            find_candidates.assert_not_called()
+        self.assertEqual(first, [("a-0:1.0.0-el8.x86_64", "a-0:2.0.0-el8.x86_64", "alfa-x86_64")])
+        self.assertEqual(second, [("b-0:1.0.0-el8.x86_64", "b-0:2.0.0-el8.x86_64", "alfa-x86_64")])
+        self.assertIs(
+            OutdatedRPMFinder().get_latest_rpm_index(repodatas), OutdatedRPMFinder().get_latest_rpm_index(repodatas)
+        )
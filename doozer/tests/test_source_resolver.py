@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 
 from artcommonlib import constants, exectools
 from artcommonlib.model import Missing, Model
-from doozerlib.source_resolver import SourceResolution, SourceResolver
+from doozerlib.source_resolver import RemoteHeadsCache, SourceResolution, SourceResolver, remote_heads_cache
 from flexmock import flexmock
 
 
@@ -18,20 +18,98 @@ class SourceResolverTestCase(TestCase):
             group_config=Model(),
         )
 
+    def setUp(self):
+        remote_heads_cache.clear()
+
     @patch("doozerlib.source_resolver.get_github_git_auth_env", return_value={"GIT_ASKPASS": "/tmp/askpass.sh"})
     @patch("doozerlib.source_resolver.art_util.ensure_github_https_url", side_effect=lambda u: u)
     def test_get_remote_branch_ref(self, mock_ensure, mock_auth):
         sr = self.create_source_resolver()
-        flexmock(exectools).should_receive("cmd_assert").once().and_return("spam", "")
+        flexmock(exectools).should_receive("cmd_assert").once().and_return("spam\trefs/heads/branch\n", "")
         res = sr._get_remote_branch_ref("giturl", "branch")
         self.assertEqual(res, "spam")
 
+        remote_heads_cache.clear()
         flexmock(exectools).should_receive("cmd_assert").once().and_return("", "")
         self.assertIsNone(sr._get_remote_branch_ref("giturl", "branch"))
 
+        remote_heads_cache.clear()
         flexmock(exectools).should_receive("cmd_assert").once().and_raise(Exception("whatever"))
         self.assertIsNone(sr._get_remote_branch_ref("giturl", "branch"))
 
+    @patch("doozerlib.source_resolver.get_github_git_auth_env", return_value={})
+    @patch("doozerlib.source_resolver.art_util.ensure_github_https_url", side_effect=lambda u: u)
+    def test_get_remote_branch_ref_lists_heads_once(self, mock_ensure, mock_auth):
+        out = "aaa\trefs/heads/main\nbbb\trefs/heads/release-4.18\n"
+        flexmock(exectools).should_receive("cmd_assert").with_args(
+            ["git", "ls-remote", "--heads", "giturl"], retries=3, set_env={}
+        ).once().and_return(out, "")
+        self.assertEqual(SourceResolver._get_remote_branch_ref("giturl", "main"), "aaa")
+        self.assertEqual(SourceResolver._get_remote_branch_ref("giturl", "release-4.18"), "bbb")
+        self.assertIsNone(SourceResolver._get_remote_branch_ref("giturl", "missing"))
+        # A commit hash is returned as is when there is no such branch
+        self.assertEqual(SourceResolver._get_remote_branch_ref("giturl", "abcdef0123"), "abcdef0123")
+
+    @patch("doozerlib.source_resolver.get_github_git_auth_env", return_value={})
+    @patch("doozerlib.source_resolver.art_util.ensure_github_https_url", side_effect=lambda u: u)
+    def test_remote_heads_cache_expiry_and_failures(self, mock_ensure, mock_auth):
+        cache = RemoteHeadsCache(ttl_seconds=0)
+        flexmock(exectools).should_receive("cmd_assert").twice().and_return("aaa\trefs/heads/main\n", "")
+        self.assertEqual(cache.get_heads("giturl"), {"main": "aaa"})
+        self.assertEqual(cache.get_heads("giturl"), {"main": "aaa"})
+
+        # Failures are not cached
+        cache = RemoteHeadsCache()
+        results = [ChildProcessError("boom"), ("aaa\trefs/heads/main\n", "")]
+
+        def _ls_remote(cmd, retries, set_env):
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        flexmock(exectools).should_receive("cmd_assert").replace_with(_ls_remote)
+        with self.assertRaises(ChildProcessError):
+            cache.get_heads("giturl")
+        self.assertEqual(cache.get_heads("giturl"), {"main": "aaa"})
+
+    @patch("doozerlib.source_resolver.get_github_git_auth_env", return_value={})
+    @patch(
+        "doozerlib.source_resolver.art_util.ensure_github_https_url",
+        side_effect=lambda u: u.replace("git@", "https://"),
+    )
+    def test_prefetch_remote_branches(self, mock_ensure, mock_auth):
+        listed = []
+
+        def _ls_remote(cmd, retries, set_env):
+            listed.append(cmd[-1])
+            if cmd[-1] == "https://broken":
+                raise ChildProcessError("boom")
+            return "aaa\trefs/heads/main\n", ""
+
+        flexmock(exectools).should_receive("cmd_assert").replace_with(_ls_remote)
+        SourceResolver.prefetch_remote_branches(
+            [
+                Model({"url": "git@repo1", "branch": {"target": "main"}}),
+                Model({"url": "https://repo1", "branch": {"target": "main"}}),
+                Model({"url": "git@repo2", "url_pull": "https://repo2", "branch": {"target": "main"}}),
+                Model({"url": "https://broken", "branch": {"target": "main"}}),
+            ]
+        )
+        self.assertEqual(sorted(listed), ["https://broken", "https://repo1", "https://repo2"])
+
+        # Siblings sharing a repo are resolved from the prefetched heads
+        self.assertEqual(SourceResolver._get_remote_branch_ref("git@repo1", "main"), "aaa")
+        self.assertEqual(SourceResolver._get_remote_branch_ref("https://repo2", "main"), "aaa")
+        self.assertEqual(len(listed), 3)
+
+        # A new pass, or a new runtime's resolver, lists heads again rather than reusing those of an earlier pass
+        SourceResolver.prefetch_remote_branches([Model({"url": "https://repo1", "branch": {"target": "main"}})])
+        self.assertEqual(len(listed), 4)
+        self.create_source_resolver()
+        self.assertEqual(SourceResolver._get_remote_branch_ref("https://repo2", "main"), "aaa")
+        self.assertEqual(len(listed), 5)
+
     def test_detect_remote_source_branch(self):
         sr = self.create_source_resolver()
         source_details = dict(
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from doozerlib.tree_copy import SourceTreeSnapshot, copy_tree
+
+
+class TestCopyTree(unittest.TestCase):
+    def setUp(self):
+        SourceTreeSnapshot.clear_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.src = Path(self.tmp_dir.name, "src")
+        self.dest = Path(self.tmp_dir.name, "dest")
+        for path, content in {
+            "Dockerfile": "FROM scratch\n",
+            "pkg/main.go": "package main\n",
+            ".git/HEAD": "ref: refs/heads/main\n",
+        }.items():
+            self.src.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+            self.src.joinpath(path).write_text(content)
+        os.symlink("Dockerfile", self.src.joinpath("Dockerfile.rhel"))
+
+    def test_copy_tree(self):
+        self.dest.joinpath(".oit").mkdir(parents=True)
+        self.dest.joinpath(".oit/reconciled").write_text("keep")
+        self.dest.joinpath("stale/dir").mkdir(parents=True)
+        self.dest.joinpath("Dockerfile").write_text("FROM scratch\n")
+
+        stats = copy_tree(str(self.src), str(self.dest), ignore={".git"}, delete=True, protect=[".git", ".oit"])
+
+        self.assertEqual(self.dest.joinpath("pkg/main.go").read_text(), "package main\n")
+        self.assertEqual(os.readlink(self.dest.joinpath("Dockerfile.rhel")), "Dockerfile")
+        self.assertFalse(self.dest.joinpath(".git").exists())
+        self.assertFalse(self.dest.joinpath("stale").exists())
+        self.assertEqual(self.dest.joinpath(".oit/reconciled").read_text(), "keep")
+        self.assertEqual((stats.copied_files, stats.skipped_files, stats.removed), (1, 1, 1))
+        self.assertEqual(stats.skipped_bytes, len("FROM scratch\n"))
+
+        # A sibling copying from the same checkout reuses its snapshot; changed content is rewritten
+        self.dest.joinpath("pkg/main.go").write_text("package gone\n")
+        stats = copy_tree(str(self.src), str(self.dest), ignore={".git"})
+        self.assertEqual(self.dest.joinpath("pkg/main.go").read_text(), "package main\n")
+        self.assertEqual((stats.copied_files, stats.skipped_files), (1, 1))
+        self.assertIs(SourceTreeSnapshot.of(str(self.src), {".git"}), SourceTreeSnapshot.of(str(self.src), [".git"]))
+
+    def test_copied_file_is_independent_of_source(self):
+        copy_tree(str(self.src), str(self.dest))
+        with open(self.dest.joinpath("pkg/main.go"), "w") as f:
+            f.write("modified")
+        self.assertEqual(self.src.joinpath("pkg/main.go").read_text(), "package main\n")
+
+    def test_snapshots_of_unrelated_trees_scan_concurrently(self):
+        other = Path(self.tmp_dir.name, "other")
+        other.mkdir()
+        other_scanned = threading.Event()
+        scanned = []
+        real_scan = SourceTreeSnapshot._scan
+
+        def scan(snapshot):
+            # Scanning src only finishes once other has been scanned alongside it
+            if snapshot.root == os.path.realpath(self.src):
+                scanned.append(("src", other_scanned.wait(timeout=5)))
+            else:
+                scanned.append(("other", True))
+            real_scan(snapshot)
+            other_scanned.set()
+
+        snapshots = []
+        with patch.object(SourceTreeSnapshot, "_scan", scan):
+            threads = [
+                threading.Thread(target=lambda p=p: snapshots.append(SourceTreeSnapshot.of(str(p))))
+                for p in (self.src, other, self.src)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        # Each tree is scanned once, and src did not have to wait out its timeout for other
+        self.assertEqual(sorted(scanned), [("other", True), ("src", True)])
+        self.assertEqual(len({id(snapshot) for snapshot in snapshots}), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
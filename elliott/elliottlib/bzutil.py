@@ -9,10 +9,11 @@ import os
 import re
 import urllib.parse
 import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from functools import cached_property
 from time import sleep
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import bugzilla
 import requests
@@ -276,13 +277,23 @@ class BugzillaBug(Bug):
 
 
 class JIRABug(Bug):
+    _tracker: Optional['JIRABugTracker'] = None
+
     def __getattr__(self, attr):
         if attr in self.__dict__:
             return getattr(self, attr)
         return getattr(self.bug.fields, attr)
 
-    def __init__(self, bug_obj: Issue):
+    def __init__(self, bug_obj: Issue, tracker: Optional['JIRABugTracker'] = None):
+        """
+        :param tracker: The tracker which fetched bug_obj. Its custom field IDs, which may have been read from
+        the server, are used to read the issue's custom fields.
+        """
         super().__init__(bug_obj)
+        self._tracker = tracker
+
+    def _field_id(self, name: str) -> str:
+        return getattr(self._tracker or JIRABugTracker, f'field_{name}')
 
     @property
     def id(self):
@@ -373,7 +384,7 @@ class JIRABug(Bug):
 
     @property
     def target_release(self):
-        tr_field = getattr(self.bug.fields, JIRABugTracker.field_target_version)
+        tr_field = getattr(self.bug.fields, self._field_id('target_version'))
         if not tr_field:
             raise ValueError(f'bug {self.id} does not have `Target Version` field set')
         if len(tr_field) > 1:
@@ -418,7 +429,7 @@ class JIRABug(Bug):
     @property
     def cve_id(self):
         if self.is_type_vulnerability():
-            return getattr(self.bug.fields, JIRABugTracker.field_cve_id)
+            return getattr(self.bug.fields, self._field_id('cve_id'))
         if not (self.is_tracker_bug() or self.is_flaw_bug()):
             return None
         cve_id = re.search(r'CVE-\d+-\d+', self.summary)
@@ -455,7 +466,7 @@ class JIRABug(Bug):
             return self._normalize_component(pscomponent)
         # If this bug is of type vulnerability, return the component name from the custom "Downstream Component Name" field
         if self.is_type_vulnerability() and (
-            pscomponent := getattr(self.bug.fields, JIRABugTracker.field_cve_component, None)
+            pscomponent := getattr(self.bug.fields, self._field_id('cve_component'), None)
         ):
             return self._normalize_component(pscomponent)
         # Fall back to the label "pscomponent:<component_name>"
@@ -480,19 +491,19 @@ class JIRABug(Bug):
 
     def _get_release_blocker(self):
         # release blocker can be ['None','Approved'=='+','Proposed'=='?','Rejected'=='-']
-        field = getattr(self.bug.fields, JIRABugTracker.field_release_blocker)
+        field = getattr(self.bug.fields, self._field_id('release_blocker'))
         if field:
             return field.value == 'Approved'
         return False
 
     def _get_blocked_reason(self):
-        field = getattr(self.bug.fields, JIRABugTracker.field_blocked_reason)
+        field = getattr(self.bug.fields, self._field_id('blocked_reason'))
         if field:
             return field.value
         return None
 
     def _get_severity(self):
-        field = getattr(self.bug.fields, JIRABugTracker.field_severity)
+        field = getattr(self.bug.fields, self._field_id('severity'))
         if field:
             if "Urgent" in field.value:
                 return "Urgent"
@@ -709,6 +720,8 @@ class BugTracker:
 
 class JIRABugTracker(BugTracker):
     JIRA_BUG_BATCH_SIZE = 50
+    # Maximum number of JIRA searches run at the same time when fetching bugs in bulk
+    JIRA_SEARCH_CONCURRENCY = 8
 
     # Enable security level filtering in JIRA queries
     # If set to True, the JIRA queries will filter out bugs that have "Security" field value and does not match
@@ -778,6 +791,8 @@ class JIRABugTracker(BugTracker):
         self._client: JIRA = self.login()
         self._init_fields()
         self._available_target_versions = None
+        # Maps issue key => (requested fields, issue) fetched by get_bugs; only used when enabled with enable_issue_cache()
+        self._issue_cache: Optional[Dict[str, Tuple[List[str], Issue]]] = None
 
     @retry(reraise=True, stop=stop_after_attempt(3), wait=wait_fixed(5))
     def _get_available_target_versions(self) -> list[str]:
@@ -877,26 +892,74 @@ class JIRABugTracker(BugTracker):
         return bool(pattern.match(str(bug_id)))
 
     def get_bug(self, bugid: str, **kwargs) -> JIRABug:
-        return JIRABug(self._client.issue(bugid, **kwargs))
+        return JIRABug(self._client.issue(bugid, **kwargs), tracker=self)
+
+    def bug_fields(self) -> List[str]:
+        """The issue fields read by JIRABug, for requesting only those from the JIRA API."""
+        return [
+            'summary',
+            'status',
+            'security',
+            'labels',
+            'components',
+            'versions',
+            'resolution',
+            'project',
+            'issuelinks',
+            'issuetype',
+            'created',
+            'updated',
+            self.field_target_version,
+            self.field_release_blocker,
+            self.field_blocked_reason,
+            self.field_severity,
+            self.field_cve_id,
+            self.field_cve_component,
+        ]
 
-    def get_bugs(self, bugids: List[str], permissive=False, verbose=False, **kwargs) -> List[JIRABug]:
+    def enable_issue_cache(self):
+        """Keep the issues fetched by get_bugs for the lifetime of this tracker.
+        A cached issue is reused only while its `updated` timestamp is unchanged on the server.
+        """
+        if self._issue_cache is None:
+            self._issue_cache = {}
+
+    def get_bugs(
+        self, bugids: List[str], permissive=False, verbose=False, fields: Optional[List[str]] = None, **kwargs
+    ) -> List[JIRABug]:
+        """Fetch bugs by key.
+
+        Keys are searched in chunks of JIRA_BUG_BATCH_SIZE, with up to JIRA_SEARCH_CONCURRENCY chunks in flight.
+        :param bugids: Keys of the bugs to fetch
+        :param permissive: If True, log a warning instead of raising ValueError when some bugs are not found
+        :param verbose: Log the queries
+        :param fields: Issue fields to request; defaults to the fields read by JIRABug. Pass ['*all'] for everything.
+        """
         invalid_bugs = [b for b in bugids if not self.looks_like_a_jira_project_bug(b)]
         if invalid_bugs:
             logger.warn(
                 f"Cannot fetch bugs from a different project (current project: {self._project}): {invalid_bugs}"
             )
-        bugids = [b for b in bugids if self.looks_like_a_jira_project_bug(b)]
+        bugids = list(dict.fromkeys(b for b in bugids if self.looks_like_a_jira_project_bug(b)))
         if not bugids:
             return []
-
-        # Split the request in chunks, in order not to fall into
-        # jira.exceptions.JIRAError for request header size too large
-        bugs = []
-        for chunk_of_bugs in chunk(list(bugids), self.JIRA_BUG_BATCH_SIZE):
-            query = self._query(bugids=chunk_of_bugs, with_target_release=False)
-            if verbose:
-                logger.info(query)
-            bugs.extend(self._search(query))
+        if fields is None:
+            fields = self.bug_fields()
+
+        bugs_by_key: Dict[str, JIRABug] = {}
+        bugids_to_fetch = bugids
+        if self._issue_cache is not None:
+            bugs_by_key = self._get_cached_bugs(bugids, fields, verbose)
+            bugids_to_fetch = [b for b in bugids if b not in bugs_by_key]
+
+        for bug in self._search_in_chunks(bugids_to_fetch, fields, verbose):
+            bugs_by_key[bug.id] = bug
+            if self._issue_cache is not None and 'updated' in fields:
+                self._issue_cache[bug.id] = (fields, bug.bug)
+        bugs = [bugs_by_key[b] for b in bugids if b in bugs_by_key]
+        # An issue that was moved to another project or renamed is returned under its new key
+        requested = set(bugids)
+        bugs.extend(bug for key, bug in bugs_by_key.items() if key not in requested)
 
         if len(bugs) < len(bugids):
             bugids_not_found = set(bugids) - {b.id for b in bugs}
@@ -907,6 +970,37 @@ class JIRABugTracker(BugTracker):
                 logger.warn(msg)
         return bugs
 
+    def _search_in_chunks(self, bugids: List[str], fields: List[str], verbose=False) -> List[JIRABug]:
+        # Split the request in chunks, in order not to fall into
+        # jira.exceptions.JIRAError for request header size too large
+        queries = [
+            self._query(bugids=chunk_of_bugs, with_target_release=False)
+            for chunk_of_bugs in chunk(list(bugids), self.JIRA_BUG_BATCH_SIZE)
+        ]
+        if not queries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.JIRA_SEARCH_CONCURRENCY, len(queries))) as executor:
+            results = executor.map(lambda query: self._search(query, verbose=verbose, fields=fields), queries)
+            return list(itertools.chain.from_iterable(results))
+
+    def _get_cached_bugs(self, bugids: List[str], fields: List[str], verbose=False) -> Dict[str, JIRABug]:
+        """Return the cached bugs that are still current, checking only their `updated` timestamps with the server."""
+        cached = {
+            b: self._issue_cache[b][1]
+            for b in bugids
+            if b in self._issue_cache
+            and ('*all' in self._issue_cache[b][0] or set(fields).issubset(self._issue_cache[b][0]))
+        }
+        if not cached:
+            return {}
+        current = {}
+        for bug in self._search_in_chunks(list(cached), ['updated'], verbose):
+            issue = cached.get(bug.id)
+            if issue is not None and bug.bug.fields.updated == issue.fields.updated:
+                current[bug.id] = JIRABug(issue, tracker=self)
+        logger.info(f"Reusing {len(current)} of {len(bugids)} JIRA bugs from cache")
+        return current
+
     def get_bug_remote_links(self, bug: JIRABug):
         remote_links = self._client.remote_links(bug)
         link_dict = {}
@@ -933,7 +1027,7 @@ class JIRABugTracker(BugTracker):
             return
         bug = self._client.create_issue(fields=fields)
         self._client.transition_issue(bug, target_status)
-        return JIRABug(bug)
+        return JIRABug(bug, tracker=self)
 
     def _update_bug_status(self, bugid, target_status):
         return self._client.transition_issue(bugid, target_status)
@@ -1027,12 +1121,15 @@ class JIRABugTracker(BugTracker):
         return query
 
     @retry(reraise=True, stop=stop_after_attempt(3), wait=wait_fixed(5))
-    def _search(self, query, verbose=False) -> List[JIRABug]:
+    def _search(self, query, verbose=False, fields: Optional[List[str]] = None) -> List[JIRABug]:
         if verbose:
             logger.info(query)
         try:
             # Setting maxResults=0 retrieves all matching issues from the JIRA API.
-            results = self._client.search_issues(query, maxResults=0)
+            if fields:
+                results = self._client.search_issues(query, maxResults=0, fields=fields)
+            else:
+                results = self._client.search_issues(query, maxResults=0)
         except JIRAError as e:
             # a lot of times we get JIRAError with massive HTML dump in the error text
             # do not dump full html in the logs
@@ -1042,7 +1139,7 @@ class JIRABugTracker(BugTracker):
 
         if results is None:
             return []
-        return [JIRABug(j) for j in results]
+        return [JIRABug(j, tracker=self) for j in results]
 
     def blocker_search(self, status, search_filter='default', verbose=False, **kwargs):
         query = self._query(
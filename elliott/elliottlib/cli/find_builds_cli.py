@@ -6,7 +6,6 @@ import sys
 
 import click
 import koji
-import requests
 from artcommonlib import logutil
 from artcommonlib.arch_util import BREW_ARCHES
 from artcommonlib.assembly import assembly_excluded_components, assembly_metadata_config, assembly_rhcos_config
@@ -28,7 +27,6 @@ from elliottlib.util import (
     ensure_erratatool_auth,
     get_release_version,
     isolate_el_version_in_brew_tag,
-    parallel_results_with_progress,
     pbar_header,
 )
 
@@ -230,10 +228,10 @@ async def find_builds_cli(
             nvrps = await _fetch_builds_by_kind_rpm(runtime, tag_pv_map, brew_session, include_shipped, member_only)
 
     LOGGER.info('Fetching info for builds from Errata')
-    builds: list[brew.Build] = parallel_results_with_progress(
-        nvrps,
-        lambda nvrp: errata.get_brew_build(f'{nvrp[0]}-{nvrp[1]}-{nvrp[2]}', nvrp[3], session=requests.Session()),
-    )
+    async with AsyncErrataAPI() as errata_api:
+        builds: list[brew.Build] = await asyncio.gather(
+            *[errata_api.get_brew_build(f'{nvrp[0]}-{nvrp[1]}-{nvrp[2]}', nvrp[3]) for nvrp in nvrps]
+        )
 
     if as_json:
         _json_dump(as_json, [build.nvr for build in builds])
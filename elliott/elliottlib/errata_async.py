@@ -1,6 +1,7 @@
 import asyncio
 import base64
-from typing import Dict, Iterable, List, Optional, Set, Union, cast
+import json
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 from urllib.parse import quote, urlparse
 
 import aiohttp
@@ -9,14 +10,19 @@ from aiohttp import ClientResponse, ClientResponseError, ClientTimeout
 from artcommonlib import logutil
 from artcommonlib.exectools import limit_concurrency
 from artcommonlib.rpm_utils import parse_nvr
+from tenacity import retry, stop_after_attempt, wait_fixed
 
-from elliottlib import constants, util
+from elliottlib import brew, constants, util
 
 _LOGGER = logutil.get_logger(__name__)
 
 
 class AsyncErrataAPI:
-    def __init__(self, url: str = constants.errata_url):
+    def __init__(self, url: str = constants.errata_url, max_connections: int = 32):
+        """
+        :param url: Errata Tool URL
+        :param max_connections: Maximum number of requests in flight; connections are kept alive and reused
+        """
         self._errata_url = urlparse(url).geturl()
         self._timeout = ClientTimeout(total=60 * 15)  # 900 seconds (15 min)
         self._errata_gssapi_name = gssapi.Name(
@@ -24,12 +30,14 @@ class AsyncErrataAPI:
         )
         self._gssapi_flags = [gssapi.RequirementFlag.out_of_sequence_detection]
         self._session = aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(limit=32, force_close=True), timeout=self._timeout
+            connector=aiohttp.TCPConnector(limit=max_connections, keepalive_timeout=15), timeout=self._timeout
         )
         self._headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        # Identical GET requests in flight share one response
+        self._pending_gets: Dict[Tuple, asyncio.Future] = {}
 
     async def __aenter__(self):
         return self
@@ -46,16 +54,33 @@ class AsyncErrataAPI:
         return f'Negotiate {base64.b64encode(out_token).decode()}'
 
     async def _make_request(self, method: str, path: str, parse_json: bool = True, **kwargs) -> Union[Dict, bytes]:
-        auth_header = self._generate_auth_header()
-        headers = self._headers.copy()
-        headers["Authorization"] = auth_header
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
-        async with self._session.request(method, self._errata_url + path, headers=headers, **kwargs) as resp:
-            # resp.raise_for_status()
-            await self._raise_for_status(resp)
-            result = await (resp.json() if parse_json else resp.read())
-        return result
+        """Send a request to Errata Tool.
+        Concurrent GET requests for the same path and params are coalesced; callers must not modify the result.
+        """
+        if method != aiohttp.hdrs.METH_GET or not set(kwargs).issubset({"params"}):
+            return await self._send_request(method, path, parse_json, **kwargs)
+        params = dict(kwargs.get("params") or {})
+        key = (path, parse_json, tuple(sorted(params.items())))
+        request = self._pending_gets.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._send_request(method, path, parse_json, **kwargs))
+            self._pending_gets[key] = request
+            request.add_done_callback(lambda _: self._pending_gets.pop(key, None))
+        return await asyncio.shield(request)
+
+    async def _send_request(self, method: str, path: str, parse_json: bool = True, **kwargs) -> Union[Dict, bytes]:
+        extra_headers = kwargs.pop("headers", {})
+        for attempt in range(2):
+            headers = {**self._headers, "Authorization": self._generate_auth_header(), **extra_headers}
+            try:
+                async with self._session.request(method, self._errata_url + path, headers=headers, **kwargs) as resp:
+                    await self._raise_for_status(resp)
+                    return await (resp.json() if parse_json else resp.read())
+            except aiohttp.ServerDisconnectedError:
+                # The server may close a kept-alive connection just as it is reused; retry once on a new one
+                if attempt or method != aiohttp.hdrs.METH_GET:
+                    raise
+                _LOGGER.debug("Errata Tool closed the connection for %s %s; retrying", method, path)
 
     @staticmethod
     async def _raise_for_status(response: ClientResponse):
@@ -88,6 +113,48 @@ class AsyncErrataAPI:
         path = f"/api/v1/erratum/{quote(str(advisory))}/builds"
         return await self._make_request(aiohttp.hdrs.METH_GET, path)
 
+    async def get_brew_builds(self, advisory: Union[int, str]) -> List[brew.Build]:
+        """Get the builds attached to an advisory, with the product version they are attached to."""
+        pv_builds = await self.get_builds(advisory)
+        return [
+            brew.Build(nvr=next(iter(build)), product_version=pv)
+            for pv, pv_info in pv_builds.items()
+            for build in pv_info["builds"]
+        ]
+
+    @retry(reraise=True, stop=stop_after_attempt(10), wait=wait_fixed(3))
+    async def get_brew_build(self, nvr: str, product_version: str = "") -> brew.Build:
+        """Get Errata Tool's view of a Brew build, including the advisories it is attached to.
+        :param nvr: NVR or Brew build ID
+        :param product_version: The product version the build would be attached to
+        """
+        path = f"/api/v1/build/{quote(str(nvr))}"
+        return brew.Build(
+            nvr=nvr, body=await self._make_request(aiohttp.hdrs.METH_GET, path), product_version=product_version
+        )
+
+    async def get_advisory_nvrs(self, advisory: Union[int, str]) -> Dict[str, str]:
+        """Get the builds attached to an advisory as a dict of package name to '{version}-{release}'."""
+        nvrs = {}
+        for nvr in await self.get_builds_flattened(advisory):
+            n, v, r = nvr.rsplit("-", 2)
+            nvrs[n] = f"{v}-{r}"
+        return nvrs
+
+    async def get_blocking_advisories(self, advisory: Union[int, str]) -> List[int]:
+        """Get the IDs of the advisories blocking the given advisory."""
+        advisory_id = int(advisory)
+        errata = (await self.get_advisory(advisory_id))["errata"]
+        for info in errata.values():
+            if info["id"] == advisory_id:
+                return info["blocking_advisories"]
+        raise IOError(f"Failed to find blocking advisories for {advisory_id} in ET response: {errata}")
+
+    async def add_comment(self, advisory: Union[int, str], comment: Dict) -> Dict:
+        """Add a comment to an advisory. The comment is serialized as JSON."""
+        path = f"/api/v1/erratum/{quote(str(advisory))}/add_comment"
+        return await self._make_request(aiohttp.hdrs.METH_POST, path, json={"comment": json.dumps(comment)})
+
     async def get_builds_flattened(self, advisory: Union[int, str]) -> Set[str]:
         pv_builds = await self.get_builds(advisory)
         return {nvr for pv in pv_builds.values() for pvb in pv["builds"] for nvr in pvb}
@@ -362,7 +362,11 @@ class Runtime(GroupRuntime):
             bug_tracker_cls = BugzillaBugTracker
         elif bug_tracker_type == 'jira':
             bug_tracker_cls = JIRABugTracker
-        self._bug_trackers[bug_tracker_type] = bug_tracker_cls(bug_tracker_cls.get_config(self))
+        bug_tracker = bug_tracker_cls(bug_tracker_cls.get_config(self))
+        if isinstance(bug_tracker, JIRABugTracker):
+            # Bugs are fetched repeatedly over a run; only refetch those updated in the meantime
+            bug_tracker.enable_issue_cache()
+        self._bug_trackers[bug_tracker_type] = bug_tracker
         return self._bug_trackers[bug_tracker_type]
 
     @property
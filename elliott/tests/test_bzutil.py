@@ -1,4 +1,5 @@
 import logging
+import re
 import unittest
 import xmlrpc.client
 from datetime import datetime, timezone
@@ -508,6 +509,111 @@ class TestJIRABugTracker(unittest.TestCase):
         result = tracker.cve_tracker_search(["NEW"])
         self.assertEqual(result, [])
 
+    @staticmethod
+    def _fake_search_issues(issues, calls):
+        def search_issues(query, maxResults, fields):
+            calls.append((query, fields))
+            keys = re.search(r"issue in \(([^)]*)\)", query).group(1).split(",")
+            return [
+                flexmock(
+                    # A moved or renamed issue is found by its old key but returned under its new one
+                    key=issues[key].get("moved_to", key),
+                    fields=flexmock(updated=issues[key]["updated"], summary=issues[key]["summary"]),
+                )
+                for key in keys
+                if key in issues
+            ]
+
+        return search_issues
+
+    @mock.patch.object(JIRABugTracker, "JIRA_BUG_BATCH_SIZE", 2)
+    def test_get_bugs_in_concurrent_chunks(self):
+        issues = {f"OCPBUGS-{i}": {"updated": "t0", "summary": f"bug {i}"} for i in range(1, 6)}
+        calls = []
+        mock_jira_client = flexmock(search_issues=self._fake_search_issues(issues, calls))
+        flexmock(JIRABugTracker).should_receive("login").and_return(mock_jira_client)
+        flexmock(JIRABugTracker).should_receive("_init_fields")
+        tracker = JIRABugTracker({"project": "OCPBUGS", "server": JIRA_SERVER_URL})
+
+        bugids = ["OCPBUGS-5", "OCPBUGS-1", "OCPBUGS-3", "OCPBUGS-2", "OCPBUGS-4", "OCPBUGS-1"]
+        bugs = tracker.get_bugs(bugids)
+        self.assertEqual([b.id for b in bugs], ["OCPBUGS-5", "OCPBUGS-1", "OCPBUGS-3", "OCPBUGS-2", "OCPBUGS-4"])
+        self.assertEqual(len(calls), 3)
+        # Only the fields JIRABug reads are requested
+        for _, fields in calls:
+            self.assertEqual(fields, tracker.bug_fields())
+            self.assertIn(JIRABugTracker.field_target_version, fields)
+
+        with self.assertRaises(ValueError):
+            tracker.get_bugs(["OCPBUGS-1", "OCPBUGS-99"])
+        self.assertEqual([b.id for b in tracker.get_bugs(["OCPBUGS-1", "OCPBUGS-99"], permissive=True)], ["OCPBUGS-1"])
+
+    def test_get_bugs_moved_issue(self):
+        issues = {
+            "OCPBUGS-1": {"updated": "t0", "summary": "bug 1"},
+            "OCPBUGS-2": {"updated": "t0", "summary": "bug 2", "moved_to": "OCPBUGS-20"},
+        }
+        mock_jira_client = flexmock(search_issues=self._fake_search_issues(issues, []))
+        flexmock(JIRABugTracker).should_receive("login").and_return(mock_jira_client)
+        flexmock(JIRABugTracker).should_receive("_init_fields")
+        tracker = JIRABugTracker({"project": "OCPBUGS", "server": JIRA_SERVER_URL})
+
+        bugs = tracker.get_bugs(["OCPBUGS-2", "OCPBUGS-1"])
+        self.assertEqual([b.id for b in bugs], ["OCPBUGS-1", "OCPBUGS-20"])
+        self.assertEqual(bugs[1].summary, "bug 2")
+
+    def test_get_bugs_with_server_field_ids(self):
+        server_fields = {
+            "Target Version": "customfield_1",
+            "Release Blocker": "customfield_2",
+            "Severity": "customfield_3",
+        }
+        values = {
+            "customfield_1": [flexmock(name="4.18.z", archived=False)],
+            "customfield_2": flexmock(value="Approved"),
+            "customfield_3": flexmock(value="Important (High)"),
+            "customfield_10483": None,
+        }
+
+        def search_issues(query, maxResults, fields):
+            # Like the JIRA API, only the requested fields are returned
+            return [flexmock(key="OCPBUGS-1", fields=flexmock(**{f: values[f] for f in fields if f in values}))]
+
+        mock_jira_client = flexmock(
+            search_issues=search_issues,
+            fields=lambda: [{"name": name, "id": field_id} for name, field_id in server_fields.items()],
+        )
+        flexmock(JIRABugTracker).should_receive("login").and_return(mock_jira_client)
+        tracker = JIRABugTracker({"project": "OCPBUGS", "server": JIRA_SERVER_URL})
+        self.assertNotEqual(tracker.field_target_version, JIRABugTracker.field_target_version)
+
+        bug = tracker.get_bugs(["OCPBUGS-1"])[0]
+        self.assertEqual(bug.target_release, ["4.18.z"])
+        self.assertTrue(bug.release_blocker)
+        self.assertEqual(bug.severity, "High")
+
+    def test_get_bugs_with_issue_cache(self):
+        issues = {f"OCPBUGS-{i}": {"updated": "t0", "summary": f"bug {i}"} for i in range(1, 4)}
+        calls = []
+        mock_jira_client = flexmock(search_issues=self._fake_search_issues(issues, calls))
+        flexmock(JIRABugTracker).should_receive("login").and_return(mock_jira_client)
+        flexmock(JIRABugTracker).should_receive("_init_fields")
+        tracker = JIRABugTracker({"project": "OCPBUGS", "server": JIRA_SERVER_URL})
+        tracker.enable_issue_cache()
+
+        tracker.get_bugs(["OCPBUGS-1", "OCPBUGS-2"])
+        issues["OCPBUGS-2"] = {"updated": "t1", "summary": "bug 2 updated"}
+        calls.clear()
+        bugs = tracker.get_bugs(["OCPBUGS-1", "OCPBUGS-2", "OCPBUGS-3"])
+
+        self.assertEqual([b.summary for b in bugs], ["bug 1", "bug 2 updated", "bug 3"])
+        # Cached bugs are revalidated by their update timestamp; only changed or new bugs are fetched in full
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0][1], ["updated"])
+        self.assertIn("issue in (OCPBUGS-1,OCPBUGS-2)", calls[0][0])
+        self.assertEqual(calls[1][1], tracker.bug_fields())
+        self.assertIn("issue in (OCPBUGS-2,OCPBUGS-3)", calls[1][0])
+
 
 class TestBugzillaBugTracker(unittest.TestCase):
     def test_get_config(self):
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -139,6 +140,72 @@ class TestAsyncErrataAPI(IsolatedAsyncioTestCase):
         )
         self.assertEqual(actual, [{'id': 1}, {'id': 2}, {'id': 3}, {'id': 4}, {'id': 5}])
 
+    @patch("elliottlib.errata_async.AsyncErrataAPI._generate_auth_header", return_value='Negotiate abcdef')
+    @patch("aiohttp.ClientSession")
+    async def test_make_request_coalesces_gets(self, session_mock: AsyncMock, _generate_auth_header: Mock):
+        release = asyncio.Event()
+
+        async def _json():
+            await release.wait()
+            return {"result": "fake"}
+
+        request = session_mock.return_value.request
+        fake_response = request.return_value.__aenter__.return_value
+        fake_response.ok = True
+        fake_response.json.side_effect = _json
+        api = AsyncErrataAPI("https://errata.example.com")
+
+        gets = [
+            asyncio.create_task(api._make_request("GET", "/api/path", params={"a": 1})),
+            asyncio.create_task(api._make_request("GET", "/api/path", params={"a": 1})),
+            asyncio.create_task(api._make_request("GET", "/api/path", params={"a": 2})),
+            asyncio.create_task(api._make_request("POST", "/api/path")),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*gets)
+
+        self.assertEqual(results, [{"result": "fake"}] * 4)
+        self.assertEqual(request.call_count, 3)
+        self.assertEqual(api._pending_gets, {})
+        # Once completed, the same GET is sent again
+        await api._make_request("GET", "/api/path", params={"a": 1})
+        self.assertEqual(request.call_count, 4)
+
+    @patch("aiohttp.ClientSession", autospec=True)
+    @patch("elliottlib.errata_async.AsyncErrataAPI._make_request", autospec=True)
+    async def test_get_brew_builds_and_nvrs(self, _make_request: Mock, ClientSession: Mock):
+        api = AsyncErrataAPI("https://errata.example.com")
+        _make_request.return_value = {
+            "ProductVersion1": {"builds": [{"a-1.0.0-1": {}}, {"b-1.0.0-1": {}}]},
+            "ProductVersion2": {"builds": [{"c-1.0.0-1": {}}]},
+        }
+        builds = await api.get_brew_builds(1)
+        self.assertEqual(
+            [(b.nvr, b.product_version) for b in builds],
+            [("a-1.0.0-1", "ProductVersion1"), ("b-1.0.0-1", "ProductVersion1"), ("c-1.0.0-1", "ProductVersion2")],
+        )
+        self.assertEqual(await api.get_advisory_nvrs(1), {"a": "1.0.0-1", "b": "1.0.0-1", "c": "1.0.0-1"})
+
+    @patch("aiohttp.ClientSession", autospec=True)
+    @patch("elliottlib.errata_async.AsyncErrataAPI._make_request", autospec=True)
+    async def test_get_blocking_advisories(self, _make_request: Mock, ClientSession: Mock):
+        api = AsyncErrataAPI("https://errata.example.com")
+        _make_request.return_value = {"errata": {"rhba": {"id": 1, "blocking_advisories": [100, 200]}}}
+        self.assertEqual(await api.get_blocking_advisories("1"), [100, 200])
+        _make_request.assert_awaited_once_with(ANY, "GET", "/api/v1/erratum/1")
+        with self.assertRaises(IOError):
+            await api.get_blocking_advisories(2)
+
+    @patch("aiohttp.ClientSession", autospec=True)
+    @patch("elliottlib.errata_async.AsyncErrataAPI._make_request", autospec=True)
+    async def test_add_comment(self, _make_request: Mock, ClientSession: Mock):
+        api = AsyncErrataAPI("https://errata.example.com")
+        await api.add_comment(1, {"release": "4.18.1"})
+        _make_request.assert_awaited_once_with(
+            ANY, "POST", "/api/v1/erratum/1/add_comment", json={"comment": '{"release": "4.18.1"}'}
+        )
+
 
 class TestAsyncErrataUtils(IsolatedAsyncioTestCase):
     @patch("elliottlib.errata_async.AsyncErrataAPI", autospec=True)
@@ -1041,6 +1041,9 @@ class PromotePipeline:
             signing_key_ids=os.environ.get("KMS_KEY_ID", "dummy-key").strip().split(','),
             rekor_url=os.environ.get("REKOR_URL", ""),
             concurrency_limit=CONCURRENCY_LIMIT,
+            # re-runs reuse what was discovered and signed before, and skip images signed already
+            cache_dir=self.runtime.working_dir,
+            skip_signed=True,
         )
 
         # --- Phase 1: Discover release images and their manifests ---
@@ -320,6 +320,25 @@ async def build_plashets(
         plashet_name_template = string.Template(plashet_config.plashet_dir)
         plashet_name = plashet_name_template.substitute(**variables)
 
+        remote_base_dir = Path("/mnt/data/pub/RHOCP/plashets", base_dir_name)
+
+        # Reuse the metadata of the previous plashet for RPMs that have not changed since it was built.
+        # Jobs usually start from a fresh workspace, so unless it is still around locally,
+        # fetch its metadata from the remote host where every plashet is published.
+        incremental_from = None
+        if plashet_config.create_symlinks:
+            previous_plashet = Path(local_base_dir, plashet_config.symlink_name)
+            if previous_plashet.is_dir():
+                incremental_from = str(previous_plashet.resolve())
+            else:
+                previous_metadata = await fetch_plashet_metadata(
+                    PLASHET_REMOTES[0]['host'],
+                    Path(remote_base_dir, plashet_config.symlink_name),
+                    Path(working_dir, 'previous', base_dir_name),
+                    dry_run=dry_run,
+                )
+                incremental_from = str(previous_metadata) if previous_metadata else None
+
         local_path = await build_plashet_from_tags(
             group_param=group_param,
             assembly=assembly,
@@ -337,6 +356,7 @@ async def build_plashets(
             data_path=data_path,
             dry_run=dry_run,
             doozer_working=doozer_working,
+            incremental_from=incremental_from,
         )
 
         logger.info('Plashet repo for %s created: %s', repo.name, local_path)
@@ -346,7 +366,6 @@ async def build_plashets(
             )
             logger.info('Symlink for %s created: %s', repo.name, symlink_path)
 
-        remote_base_dir = Path("/mnt/data/pub/RHOCP/plashets", base_dir_name)
         logger.info('Copying %s to remote host...', remote_base_dir)
 
         await asyncio.gather(
@@ -384,9 +403,12 @@ async def build_plashet_from_tags(
     data_path: str = constants.OCP_BUILD_DATA_URL,
     doozer_working: str = 'doozer-working',
     dry_run: bool = False,
+    incremental_from: Optional[str] = None,
 ):
     """
     Builds Plashet repo with "from-tags"
+
+    If incremental_from names a previous plashet, createrepo_c reuses its metadata for unchanged RPMs.
     """
 
     repo_path = Path(base_dir, name)
@@ -409,6 +431,8 @@ async def build_plashet_from_tags(
     ]
     if repo_subdir:
         cmd.extend(["--repo-subdir", repo_subdir])
+    if incremental_from:
+        cmd.extend(["--incremental-from", incremental_from])
     for arch in arches:
         cmd.extend(["--arch", arch, signing_mode])
     for pkg in exclude_packages or []:
@@ -459,6 +483,44 @@ def create_latest_symlink(base_dir: os.PathLike, plashet_name: str, symlink_name
     return symlink_path
 
 
+async def fetch_plashet_metadata(
+    plashet_remote_host: str,
+    remote_plashet_dir: os.PathLike,
+    local_dir: os.PathLike,
+    dry_run: bool = False,
+) -> Optional[Path]:
+    """
+    Copies the repodata and rpm_list files (but no packages) of a plashet published on a remote host,
+    so that a new plashet can be built incrementally from it.
+    :return: The local copy, or None if it could not be fetched
+    """
+    local_dir = Path(local_dir)
+    cmd = [
+        "rsync",
+        "-a",
+        "--prune-empty-dirs",
+        "--include=*/",
+        "--include=repodata/***",
+        "--include=rpm_list",
+        "--exclude=*",
+        "--",
+        f"{plashet_remote_host}:{remote_plashet_dir}/",
+        f"{local_dir}/",
+    ]
+    if dry_run:
+        logger.warning("[DRY RUN] Would have run %s", cmd)
+        return None
+    if local_dir.exists():
+        shutil.rmtree(local_dir)
+    local_dir.mkdir(parents=True)
+    logger.info("Executing %s", ' '.join(cmd))
+    rc, _, stderr = await exectools.cmd_gather_async(cmd, check=False, env=os.environ.copy())
+    if rc != 0:
+        logger.warning("Unable to fetch previous plashet %s; building from scratch: %s", remote_plashet_dir, stderr)
+        return None
+    return local_dir
+
+
 async def copy_to_remote(
     plashet_remote_host: str,
     local_base_dir: os.PathLike,
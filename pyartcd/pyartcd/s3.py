@@ -1,29 +1,54 @@
+import asyncio
+import hashlib
+import json
+import logging
+import mimetypes
 import os
 import sys
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from artcommonlib import exectools
 from tenacity import retry, stop_after_attempt, wait_fixed
 
+_LOGGER = logging.getLogger(__name__)
+
+S3_MIRROR_BUCKET = 'art-srv-enterprise'
+# The manifests recording what upload_repo_to_s3_mirror synced to each prefix are kept under this prefix,
+# outside of the pub/ tree served by the mirror
+SYNC_MANIFEST_PREFIX = 'art-s3-sync-manifests/'
+SYNC_MANIFEST_NAME = 'manifest.json'
+# Files larger than this are uploaded in parts
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+# Size of each part of a multipart upload; every concurrent upload holds one part in memory
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+# Maximum number of files uploaded or deleted at the same time per endpoint
+UPLOAD_CONCURRENCY = 16
+
 
 async def sync_repo_to_s3_mirror(local_dir: str, s3_path: str, dry_run: bool = False, remove_old: bool = True):
     # Sync is not transactional. If we update repomd.xml before files it references are populated,
-    # users of the repo will get a 404. So we run in three passes:
-    # 1. On the first pass, exclude files like repomd.xml and do not delete any old files.
+    # users of the repo will get a 404. So we upload in three passes:
+    # 1. On the first pass, upload new or changed files except repomd.xml and do not delete any old files.
     #    This ensures that we  are only adding new rpms, filelist archives, etc.
-    await sync_dir_to_s3_mirror(
-        local_dir, s3_path, exclude='*/repomd.xml', include_only='', dry_run=dry_run, remove_old=False
-    )
-    # 2. On the second pass, include only the repomd.xml.
-    await sync_dir_to_s3_mirror(
-        local_dir, s3_path, exclude='', include_only='*/repomd.xml', dry_run=dry_run, remove_old=False
-    )
+    # 2. On the second pass, upload repomd.xml.
+    # 3. For most repos, clean up the old rpms so they don't grow unbounded. Specify remove_old=false to prevent this step.
+    await upload_repo_to_s3_mirror(local_dir, s3_path, dry_run=dry_run, remove_old=remove_old)
 
-    # For most repos, clean up the old rpms so they don't grow unbounded. Specify remove_old=false to prevent this step.
-    # Otherwise:
-    # 3. Everything should be synced in a consistent way -- delete anything old with --delete.
-    if remove_old:
-        await sync_dir_to_s3_mirror(local_dir, s3_path, exclude='', include_only='', dry_run=dry_run, remove_old=True)
+
+def _check_s3_path(s3_path: str):
+    if (
+        not s3_path.startswith('/')
+        or s3_path.startswith('/pub/openshift-v4/clients')
+        or s3_path.startswith('/pub/openshift-v4/amd64')
+        or s3_path.startswith('/pub/openshift-v4/arm64')
+        or s3_path.startswith('/pub/openshift-v4/dependencies')
+    ):
+        raise Exception(
+            f'Invalid location on s3 ({s3_path}); these are virtual/read-only locations on the s3 '
+            'backed mirror. Qualify your path with /pub/openshift-v4/<brew_arch_name>/ instead.'
+        )
 
 
 async def sync_dir_to_s3_mirror(
@@ -44,20 +69,10 @@ async def sync_dir_to_s3_mirror(
     :param dry_run: Print what would happen, but don't actually do it.
     :param remove_old: Remove old files with --delete
     """
-    if (
-        not s3_path.startswith('/')
-        or s3_path.startswith('/pub/openshift-v4/clients')
-        or s3_path.startswith('/pub/openshift-v4/amd64')
-        or s3_path.startswith('/pub/openshift-v4/arm64')
-        or s3_path.startswith('/pub/openshift-v4/dependencies')
-    ):
-        raise Exception(
-            f'Invalid location on s3 ({s3_path}); these are virtual/read-only locations on the s3 '
-            'backed mirror. Qualify your path with /pub/openshift-v4/<brew_arch_name>/ instead.'
-        )
+    _check_s3_path(s3_path)
 
     env = os.environ.copy()
-    full_s3_path = f's3://art-srv-enterprise{s3_path}'  # Note that s3_path has / prefix.
+    full_s3_path = f's3://{S3_MIRROR_BUCKET}{s3_path}'  # Note that s3_path has / prefix.
     base_cmd = ['aws', 's3', 'sync', '--no-progress', '--exact-timestamps']
     options = []
     if dry_run:
@@ -87,3 +102,253 @@ async def sync_dir_to_s3_mirror(
         stop=(stop_after_attempt(3)),  # max 3 attempts
         reraise=True,
     )(exectools.cmd_assert_async)(full_command, env=env, stdout=sys.stderr)
+
+
+@dataclass
+class S3SyncStats:
+    """What one upload_repo_to_s3_mirror run did on one endpoint."""
+
+    endpoint: str
+    uploaded_files: int = 0
+    deleted_files: int = 0
+    # Bytes uploaded and seconds spent in each pass ("content", "repomd", "cleanup")
+    pass_bytes: Dict[str, int] = field(default_factory=dict)
+    pass_seconds: Dict[str, float] = field(default_factory=dict)
+
+
+def create_s3_mirror_clients() -> Dict[str, Any]:
+    """Create S3 clients for the mirror bucket on AWS and on Cloudflare."""
+    import botocore.session  # provided by awscli
+
+    return {
+        'aws': botocore.session.get_session().create_client('s3'),
+        'cloudflare': botocore.session.Session(profile='cloudflare').create_client(
+            's3', endpoint_url=os.environ['CLOUDFLARE_ENDPOINT']
+        ),
+    }
+
+
+def build_local_manifest(local_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Map the path of each file under local_dir, relative to it, to its size and sha256.
+
+    Directory symlinks are followed like `aws s3 sync` does; plashets link Packages/<name> into brewroot.
+    """
+    manifest = {}
+    # Real paths of the directories leading to each walked directory, to stop at symlink loops
+    ancestors = {local_dir: frozenset([os.path.realpath(local_dir)])}
+    for root, dirs, files in os.walk(local_dir, followlinks=True):
+        dirs[:] = [d for d in dirs if os.path.realpath(os.path.join(root, d)) not in ancestors[root]]
+        for d in dirs:
+            path = os.path.join(root, d)
+            ancestors[path] = ancestors[root] | {os.path.realpath(path)}
+        for name in files:
+            path = os.path.join(root, name)
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            manifest[os.path.relpath(path, local_dir)] = {
+                'size': os.path.getsize(path),
+                'sha256': digest.hexdigest(),
+            }
+    return manifest
+
+
+class S3MirrorUploader:
+    """Uploads a local directory to a prefix of one S3 endpoint, only sending files that changed.
+
+    The content hash and resulting ETag of every file synced to a prefix are kept in a manifest object
+    (under SYNC_MANIFEST_PREFIX), so that the changed set is computed from one manifest read and one listing
+    instead of comparing every object. A file is uploaded again if its content hash differs from the manifest,
+    or if the object's size or ETag no longer match what was uploaded, e.g. because sync_dir_to_s3_mirror or
+    anything else wrote it since.
+
+    This assumes a single writer per prefix at a time: concurrent syncs of the same prefix could
+    leave a manifest which does not describe the objects.
+    """
+
+    def __init__(self, name: str, client, bucket: str = S3_MIRROR_BUCKET, concurrency: int = UPLOAD_CONCURRENCY):
+        self.name = name
+        self._client = client
+        self._bucket = bucket
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def sync(
+        self,
+        local_dir: str,
+        prefix: str,
+        local_manifest: Dict[str, Dict[str, Any]],
+        dry_run: bool = False,
+        remove_old: bool = True,
+    ) -> S3SyncStats:
+        stats = S3SyncStats(endpoint=self.name)
+        manifest_key = f'{SYNC_MANIFEST_PREFIX}{prefix}{SYNC_MANIFEST_NAME}'
+        remote_objects = await asyncio.to_thread(self._list_objects, prefix)
+        remote_manifest = (
+            await asyncio.to_thread(self._get_manifest, manifest_key)
+            if manifest_key in await asyncio.to_thread(self._list_objects, manifest_key)
+            else {}
+        )
+
+        def _is_current(path: str, info: Dict[str, Any]) -> bool:
+            remote = remote_objects.get(prefix + path)
+            synced = remote_manifest.get(path, {})
+            return (
+                remote is not None
+                and remote['size'] == info['size']
+                and synced.get('sha256') == info['sha256']
+                and synced.get('etag') == remote['etag']
+            )
+
+        changed = [path for path, info in local_manifest.items() if not _is_current(path, info)]
+        etags = {
+            path: remote_objects[prefix + path]['etag'] for path in local_manifest if prefix + path in remote_objects
+        }
+        repomds = [path for path in changed if os.path.basename(path) == 'repomd.xml']
+        content = [path for path in changed if path not in repomds]
+        _LOGGER.info(
+            '[%s] %d of %d files under s3://%s/%s need uploading',
+            self.name,
+            len(changed),
+            len(local_manifest),
+            self._bucket,
+            prefix,
+        )
+
+        # repomd.xml must only be updated once everything it references is in place
+        for pass_name, paths in (('content', content), ('repomd', repomds)):
+            start = time.monotonic()
+            uploaded = await asyncio.gather(
+                *[self._upload(os.path.join(local_dir, path), prefix + path, dry_run) for path in paths]
+            )
+            etags.update(zip(paths, uploaded))
+            stats.uploaded_files += len(paths)
+            stats.pass_bytes[pass_name] = sum(local_manifest[path]['size'] for path in paths)
+            stats.pass_seconds[pass_name] = time.monotonic() - start
+        if changed and not dry_run:
+            synced_manifest = {path: {**info, 'etag': etags[path]} for path, info in local_manifest.items()}
+            await asyncio.to_thread(self._put_manifest, manifest_key, synced_manifest)
+
+        if remove_old:
+            start = time.monotonic()
+            keep = {prefix + path for path in local_manifest}
+            stale = sorted(key for key in remote_objects if key not in keep)
+            await asyncio.gather(*[self._delete(key, dry_run) for key in stale])
+            stats.deleted_files = len(stale)
+            stats.pass_bytes['cleanup'] = 0
+            stats.pass_seconds['cleanup'] = time.monotonic() - start
+
+        _LOGGER.info(
+            '[%s] Uploaded %d files (%s bytes), deleted %d files, in %s seconds',
+            self.name,
+            stats.uploaded_files,
+            stats.pass_bytes,
+            stats.deleted_files,
+            {pass_name: round(seconds, 1) for pass_name, seconds in stats.pass_seconds.items()},
+        )
+        return stats
+
+    def _list_objects(self, prefix: str) -> Dict[str, Dict[str, Any]]:
+        """Map the key of each object under prefix to its size and ETag."""
+        objects = {}
+        kwargs = {'Bucket': self._bucket, 'Prefix': prefix}
+        while True:
+            response = self._client.list_objects_v2(**kwargs)
+            for obj in response.get('Contents', []):
+                objects[obj['Key']] = {'size': obj['Size'], 'etag': obj['ETag']}
+            if not response.get('IsTruncated'):
+                return objects
+            kwargs['ContinuationToken'] = response['NextContinuationToken']
+
+    def _get_manifest(self, key: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            return json.loads(self._client.get_object(Bucket=self._bucket, Key=key)['Body'].read())
+        except ValueError as e:
+            _LOGGER.warning('[%s] Ignoring unreadable sync manifest %s: %s', self.name, key, e)
+            return {}
+
+    def _put_manifest(self, key: str, manifest: Dict[str, Dict[str, Any]]):
+        self._client.put_object(
+            Bucket=self._bucket, Key=key, Body=json.dumps(manifest).encode(), ContentType='application/json'
+        )
+
+    async def _upload(self, path: str, key: str, dry_run: bool) -> Optional[str]:
+        """:return: The ETag of the uploaded object (None on a dry run)"""
+        if dry_run:
+            _LOGGER.info('[%s] [DRY RUN] Would have uploaded %s to s3://%s/%s', self.name, path, self._bucket, key)
+            return None
+        async with self._semaphore:
+            return await asyncio.to_thread(self._upload_file, path, key)
+
+    @retry(wait=wait_fixed(10), stop=stop_after_attempt(3), reraise=True)
+    def _upload_file(self, path: str, key: str) -> str:
+        extra_args = {}
+        content_type = mimetypes.guess_type(path)[0]
+        if content_type:
+            extra_args['ContentType'] = content_type
+
+        if os.path.getsize(path) <= MULTIPART_THRESHOLD:
+            # Stream the file rather than reading it into memory
+            with open(path, 'rb') as f:
+                return self._client.put_object(Bucket=self._bucket, Key=key, Body=f, **extra_args)['ETag']
+
+        upload_id = self._client.create_multipart_upload(Bucket=self._bucket, Key=key, **extra_args)['UploadId']
+        try:
+            parts = []
+            with open(path, 'rb') as f:
+                for part_number, chunk in enumerate(iter(lambda: f.read(MULTIPART_PART_SIZE), b''), start=1):
+                    response = self._client.upload_part(
+                        Bucket=self._bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=chunk
+                    )
+                    parts.append({'PartNumber': part_number, 'ETag': response['ETag']})
+            return self._client.complete_multipart_upload(
+                Bucket=self._bucket, Key=key, UploadId=upload_id, MultipartUpload={'Parts': parts}
+            )['ETag']
+        except Exception:
+            self._client.abort_multipart_upload(Bucket=self._bucket, Key=key, UploadId=upload_id)
+            raise
+
+    async def _delete(self, key: str, dry_run: bool):
+        if dry_run:
+            _LOGGER.info('[%s] [DRY RUN] Would have deleted s3://%s/%s', self.name, self._bucket, key)
+            return
+        async with self._semaphore:
+            await asyncio.to_thread(self._client.delete_object, Bucket=self._bucket, Key=key)
+
+
+async def upload_repo_to_s3_mirror(
+    local_dir: str,
+    s3_path: str,
+    dry_run: bool = False,
+    remove_old: bool = True,
+    clients: Optional[Dict[str, Any]] = None,
+    concurrency: int = UPLOAD_CONCURRENCY,
+) -> List[S3SyncStats]:
+    """
+    Upload a repo directory to the s3 mirror on every endpoint concurrently, updating repomd.xml last.
+
+    :param local_dir: The directory to upload.
+    :param s3_path: The s3 path to upload to.
+    :param dry_run: Log what would happen, but don't actually do it.
+    :param remove_old: Remove remote files that no longer exist locally, once the repo is consistent.
+    :param clients: S3 clients by endpoint name; defaults to create_s3_mirror_clients()
+    :param concurrency: Maximum number of files transferred at the same time per endpoint
+    :return: Upload stats per endpoint
+    """
+    _check_s3_path(s3_path)
+    prefix = s3_path.strip('/') + '/'
+    if clients is None:
+        clients = create_s3_mirror_clients()
+
+    start = time.monotonic()
+    local_manifest = await asyncio.to_thread(build_local_manifest, local_dir)
+    _LOGGER.info('Hashed %d files under %s in %.1f seconds', len(local_manifest), local_dir, time.monotonic() - start)
+
+    return await asyncio.gather(
+        *[
+            S3MirrorUploader(name, client, concurrency=concurrency).sync(
+                local_dir, prefix, local_manifest, dry_run=dry_run, remove_old=remove_old
+            )
+            for name, client in clients.items()
+        ]
+    )
@@ -258,6 +258,58 @@ class DiscoveryResult:
     errors: Dict[str, Exception] = field(default_factory=dict)
 
 
+class DiscoveryCache:
+    """What discovery and signing already learned about image digests, optionally persisted as JSON.
+
+    A digest is immutable, so whether it is a manifest list, and which manifests it lists, never changes.
+    Children are recorded as digests and are expected in the same repo as their manifest list.
+    Pullspecs signed by us are recorded with the key ids they were signed with.
+    """
+
+    FILENAME = "sigstore-discovery-cache.json"
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._manifests: Dict[str, List[str]] = {}  # digest => child digests; empty for a single manifest
+        self._signed: Dict[str, List[str]] = {}  # digest pullspec => signing key ids
+        if path and os.path.isfile(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                self._manifests = data.get("manifests", {})
+                self._signed = data.get("signed", {})
+            except (OSError, ValueError) as e:
+                _LOGGER.warning("Ignoring unreadable discovery cache %s: %s", path, e)
+
+    @staticmethod
+    def digest_of(pullspec: str) -> Optional[str]:
+        """Return the digest of a digest pullspec, or None for a tag, which may move."""
+        if "@sha256:" not in pullspec:
+            return None
+        return "sha256:" + pullspec.rsplit("@sha256:", 1)[1]
+
+    def get_children(self, digest: str) -> Optional[List[str]]:
+        """Return the child digests of a manifest list, [] for a single manifest, or None if unknown."""
+        return self._manifests.get(digest)
+
+    def set_children(self, digest: str, children: List[str]):
+        self._manifests[digest] = sorted(children)
+
+    def is_signed(self, pullspec: str, key_ids: Iterable[str]) -> bool:
+        return set(key_ids).issubset(self._signed.get(pullspec, []))
+
+    def set_signed(self, pullspec: str, key_ids: Iterable[str]):
+        self._signed[pullspec] = sorted(set(key_ids).union(self._signed.get(pullspec, [])))
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"manifests": self._manifests, "signed": self._signed}, f)
+        os.replace(tmp_path, self.path)
+
+
 class SigstoreSignatory:
     """
     SigstoreSignatory uses sigstore's cosign to sign container image manifests keylessly and publish
@@ -285,7 +337,13 @@ class SigstoreSignatory:
         concurrency_limit: int,
         batch_retries: int = 3,
         batch_retry_delay: float = 30.0,
+        cache_dir: Optional[str] = None,
+        skip_signed: bool = False,
     ) -> None:
+        """
+        :param cache_dir: If set, discovery results and signed digests are persisted here and reused by re-runs
+        :param skip_signed: If True, component images that already have a valid signature are not signed again
+        """
         self._logger = logger
         self.dry_run = dry_run  # if true, run discovery but do not sign anything
         self.signing_key_ids = signing_key_ids  # key ids for signing
@@ -324,6 +382,8 @@ class SigstoreSignatory:
         self.concurrency_limit = concurrency_limit  # limit on concurrent lookups or signings
         self.batch_retries = batch_retries  # number of batch-level retries for failed images
         self.batch_retry_delay = batch_retry_delay  # seconds to wait between batch retries
+        self.skip_signed = skip_signed  # if true, check the registry for existing signatures before signing
+        self._discovery_cache = DiscoveryCache(os.path.join(cache_dir, DiscoveryCache.FILENAME) if cache_dir else None)
 
     @staticmethod
     def redigest_pullspec(pullspec: str, digest: str) -> str:
@@ -446,6 +506,7 @@ class SigstoreSignatory:
 
             need_examining = next_to_examine
 
+        self._discovery_cache.save()
         return component_images, errors
 
     async def _examine_component(self, pullspec: str) -> Tuple[Set[str], Set[str], Dict[str, Exception]]:
@@ -459,6 +520,16 @@ class SigstoreSignatory:
         need_examining: Set[str] = set()
         errors: Dict[str, Exception] = {}
 
+        digest = DiscoveryCache.digest_of(pullspec)
+        children = self._discovery_cache.get_children(digest) if digest else None
+        if children is not None:
+            self._logger.debug("%s found in discovery cache", pullspec)
+            if children:
+                need_examining.update(self.redigest_pullspec(pullspec, child) for child in children)
+            else:
+                need_signing.add(pullspec)
+            return need_signing, need_examining, errors
+
         await asyncio.sleep(uniform(0, self.THROTTLE_DELAY))
         registry_config = os.environ.get("QUAY_AUTH_FILE")
 
@@ -473,13 +544,36 @@ class SigstoreSignatory:
             self._logger.debug("%s is a manifest list", pullspec)
             for manifest in img_info:
                 need_examining.add(self.redigest_pullspec(manifest["name"], manifest["digest"]))
+            if digest:
+                self._discovery_cache.set_children(digest, [manifest["digest"] for manifest in img_info])
         else:
             # Single manifest: sign it
             self._logger.debug("%s is a single manifest", pullspec)
             need_signing.add(pullspec)
+            if digest:
+                self._discovery_cache.set_children(digest, [])
 
         return need_signing, need_examining, errors
 
+    async def _is_signed(self, pullspec: str) -> bool:
+        """Check whether a digest pullspec already has a valid signature from each of our keys."""
+        if not DiscoveryCache.digest_of(pullspec):
+            return False
+        if self._discovery_cache.is_signed(pullspec, self.signing_key_ids):
+            return True
+        for signing_key_id in self.signing_key_ids:
+            cmd = ["cosign", "verify", "--key", f"awskms:///{signing_key_id}"]
+            if self.rekor_url:
+                cmd.append(f"--rekor-url={self.rekor_url}")
+            else:
+                cmd.append("--insecure-ignore-tlog=true")
+            cmd.append(pullspec)
+            rc, _, _ = await exectools.cmd_gather_async(cmd, check=False, env=self.ENV)
+            if rc:
+                return False
+        self._discovery_cache.set_signed(pullspec, self.signing_key_ids)
+        return True
+
     @staticmethod
     async def get_release_image_references(pullspec: str) -> Set[str]:
         """Retrieve the pullspecs referenced by a release image."""
@@ -560,6 +654,16 @@ class SigstoreSignatory:
         :return: Dict of any signing errors per pullspec
         """
         pullspecs = list(component_images)
+        if self.skip_signed:
+
+            async def _check_signed(ps: str) -> Tuple[str, bool]:
+                return ps, await self._is_signed(ps)
+
+            results = await run_limited_unordered(_check_signed, [(ps,) for ps in pullspecs], self.concurrency_limit)
+            already_signed = {ps for ps, is_signed in results if is_signed}
+            if already_signed:
+                self._logger.info(f"Skipping {len(already_signed)} component images that are already signed")
+                pullspecs = [ps for ps in pullspecs if ps not in already_signed]
         self._logger.info(f"Signing {len(pullspecs)} component images")
 
         args: List[Tuple[str, None]] = [(ps, None) for ps in pullspecs]
@@ -582,6 +686,13 @@ class SigstoreSignatory:
                     f"Batch attempt {attempt}/{self.batch_retries}: {len(errors)} images still failing "
                     f"after all retries: {failed}"
                 )
+
+        if not self.dry_run:
+            # Remember what was signed so that a re-run only signs what failed or changed
+            for ps in pullspecs:
+                if ps not in errors and DiscoveryCache.digest_of(ps):
+                    self._discovery_cache.set_signed(ps, self.signing_key_ids)
+            self._discovery_cache.save()
         return errors
 
     async def _sign_manifest(
@@ -1,8 +1,15 @@
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from pyartcd.plashets import CLEANUP_SCRIPT, copy_to_remote, run_cleanup_script
+from pyartcd.plashets import (
+    CLEANUP_SCRIPT,
+    build_plashet_from_tags,
+    copy_to_remote,
+    fetch_plashet_metadata,
+    run_cleanup_script,
+)
 
 BASE = '/mnt/data/pub/RHOCP/plashets/4.20/stream/el9'
 
@@ -90,3 +97,52 @@ class TestCopyToRemoteCleanup(unittest.IsolatedAsyncioTestCase):
         mock_cmd.assert_not_awaited()
         # cleanup still called with dry_run=True
         mock_cleanup.assert_awaited_once_with('remote-host', Path(BASE), keep=3, dry_run=True)
+
+
+class TestBuildPlashetFromTags(unittest.IsolatedAsyncioTestCase):
+    @patch('pyartcd.plashets.exectools.cmd_assert_async', new_callable=AsyncMock)
+    async def test_incremental_from(self, mock_cmd):
+        kwargs = dict(
+            group_param='openshift-4.20',
+            assembly='stream',
+            base_dir='/tmp/plashet-working/4.20/stream/el9',
+            name='2025-01/202501010000',
+            arches=['x86_64'],
+            include_embargoed=False,
+            signing_mode='signed',
+            signing_advisory=1,
+            tag_pvs=[('rhaos-4.20-rhel-9-candidate', 'OSE-4.20-RHEL-9')],
+            embargoed_tags=None,
+            include_previous_packages=[],
+        )
+        await build_plashet_from_tags(**kwargs, incremental_from='/tmp/plashet-working/4.20/stream/el9/2024-12/1')
+        cmd = mock_cmd.call_args[0][0]
+        index = cmd.index('--incremental-from')
+        assert cmd[index + 1] == '/tmp/plashet-working/4.20/stream/el9/2024-12/1'
+        assert index < cmd.index('from-tags')
+
+        await build_plashet_from_tags(**kwargs)
+        assert '--incremental-from' not in mock_cmd.call_args[0][0]
+
+
+class TestFetchPlashetMetadata(unittest.IsolatedAsyncioTestCase):
+    @patch('pyartcd.plashets.exectools.cmd_gather_async', new_callable=AsyncMock)
+    async def test_fetch(self, mock_cmd):
+        with tempfile.TemporaryDirectory() as tmp:
+            local_dir = Path(tmp, 'previous')
+            mock_cmd.return_value = (0, '', '')
+            result = await fetch_plashet_metadata('remote-host', Path(BASE, 'latest'), local_dir)
+            self.assertEqual(result, local_dir)
+            cmd = mock_cmd.call_args[0][0]
+            self.assertEqual(cmd[-2:], [f'remote-host:{BASE}/latest/', f'{local_dir}/'])
+            self.assertIn('--include=repodata/***', cmd)
+            self.assertEqual(cmd[cmd.index('--') - 1], '--exclude=*')
+
+            # e.g. no plashet has been published yet
+            mock_cmd.return_value = (23, '', 'No such file or directory')
+            self.assertIsNone(await fetch_plashet_metadata('remote-host', Path(BASE, 'latest'), local_dir))
+
+    @patch('pyartcd.plashets.exectools.cmd_gather_async', new_callable=AsyncMock)
+    async def test_fetch_dry_run(self, mock_cmd):
+        self.assertIsNone(await fetch_plashet_metadata('remote-host', Path(BASE, 'latest'), '/tmp/x', dry_run=True))
+        mock_cmd.assert_not_awaited()
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import tempfile
+from io import BytesIO
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from pyartcd import s3
+
+
+class FakeS3Client:
+    """Keeps objects in memory and records the order of writes, like a botocore S3 client would see them."""
+
+    def __init__(self):
+        self.objects = {}
+        self.writes = []
+        self.deletes = []
+
+    def list_objects_v2(self, Bucket, Prefix, **kwargs):
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        contents = [{"Key": key, "Size": len(self.objects[key]), "ETag": self.etag(key)} for key in keys]
+        return {"Contents": contents, "IsTruncated": False}
+
+    def etag(self, key):
+        return f'"{hashlib.md5(self.objects[key]).hexdigest()}"'
+
+    def get_object(self, Bucket, Key):
+        return {"Body": BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body.read() if hasattr(Body, "read") else Body
+        self.writes.append(Key)
+        return {"ETag": self.etag(Key)}
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        self.objects[f"upload:{Key}"] = b""
+        return {"UploadId": Key}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.objects[f"upload:{Key}"] += Body
+        return {"ETag": str(PartNumber)}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.objects[Key] = self.objects.pop(f"upload:{Key}")
+        self.writes.append(Key)
+        return {"ETag": self.etag(Key)}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.objects.pop(f"upload:{Key}")
+
+    def delete_object(self, Bucket, Key):
+        del self.objects[Key]
+        self.deletes.append(Key)
+
+
+class TestUploadRepoToS3Mirror(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.repo = self.tmp_dir.name
+        self._write("repodata/repomd.xml", b"<repomd/>")
+        self._write("repodata/primary.xml.gz", b"primary")
+        self._write("Packages/foo-1.0.rpm", b"foo")
+        self.clients = {"aws": FakeS3Client(), "cloudflare": FakeS3Client()}
+
+    def _write(self, path, content):
+        path = os.path.join(self.repo, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+    async def test_upload_repomd_last_and_only_changes(self):
+        prefix = "pub/openshift-v4/x86_64/repo/"
+        manifest_key = f"{s3.SYNC_MANIFEST_PREFIX}{prefix}{s3.SYNC_MANIFEST_NAME}"
+        stats = await s3.upload_repo_to_s3_mirror(self.repo, "/pub/openshift-v4/x86_64/repo", clients=self.clients)
+        for client in self.clients.values():
+            self.assertEqual(client.writes[-2:], [f"{prefix}repodata/repomd.xml", manifest_key])
+            self.assertFalse(any(key.startswith(prefix) and key.endswith(".json") for key in client.objects))
+            self.assertEqual(client.objects[f"{prefix}Packages/foo-1.0.rpm"], b"foo")
+        self.assertEqual([s.endpoint for s in stats], ["aws", "cloudflare"])
+        self.assertEqual(stats[0].uploaded_files, 3)
+        self.assertEqual(stats[0].pass_bytes["repomd"], len(b"<repomd/>"))
+
+        # A new package replaces the old one: only it and the new repomd.xml are sent, then the old one is removed
+        os.remove(os.path.join(self.repo, "Packages/foo-1.0.rpm"))
+        self._write("Packages/foo-1.1.rpm", b"foo-1.1")
+        self._write("repodata/repomd.xml", b"<repomd>1.1</repomd>")
+        client = self.clients["aws"]
+        client.writes.clear()
+        stats = await s3.upload_repo_to_s3_mirror(self.repo, "/pub/openshift-v4/x86_64/repo", clients=self.clients)
+        self.assertEqual(
+            client.writes,
+            [f"{prefix}Packages/foo-1.1.rpm", f"{prefix}repodata/repomd.xml", manifest_key],
+        )
+        self.assertEqual(client.deletes, [f"{prefix}Packages/foo-1.0.rpm"])
+        self.assertEqual(stats[0].deleted_files, 1)
+
+        # Nothing changed, nothing is sent
+        client.writes.clear()
+        await s3.upload_repo_to_s3_mirror(self.repo, "/pub/openshift-v4/x86_64/repo", clients=self.clients)
+        self.assertEqual(client.writes, [])
+
+        # An object overwritten by another writer no longer matches the recorded ETag and is sent again
+        client.objects[f"{prefix}repodata/primary.xml.gz"] = b"PRIMARY"
+        await s3.upload_repo_to_s3_mirror(self.repo, "/pub/openshift-v4/x86_64/repo", clients=self.clients)
+        self.assertEqual(client.writes, [f"{prefix}repodata/primary.xml.gz", manifest_key])
+        self.assertEqual(client.objects[f"{prefix}repodata/primary.xml.gz"], b"primary")
+
+    async def test_multipart_and_dry_run(self):
+        prefix = "pub/openshift-v4/x86_64/repo/"
+        with patch("pyartcd.s3.MULTIPART_THRESHOLD", 4), patch("pyartcd.s3.MULTIPART_PART_SIZE", 2):
+            await s3.upload_repo_to_s3_mirror(
+                self.repo, "/pub/openshift-v4/x86_64/repo", remove_old=False, clients=self.clients
+            )
+        self.assertEqual(self.clients["aws"].objects[f"{prefix}repodata/primary.xml.gz"], b"primary")
+
+        clients = {"aws": FakeS3Client()}
+        await s3.upload_repo_to_s3_mirror(self.repo, "/pub/openshift-v4/x86_64/repo", dry_run=True, clients=clients)
+        self.assertEqual(clients["aws"].objects, {})
+
+        with self.assertRaises(Exception):
+            await s3.upload_repo_to_s3_mirror(self.repo, "/pub/openshift-v4/clients/repo", clients=clients)
+
+    async def test_symlinked_packages_dir(self):
+        prefix = "pub/openshift-v4/x86_64/repo/"
+        brewroot = tempfile.TemporaryDirectory()
+        self.addCleanup(brewroot.cleanup)
+        os.makedirs(os.path.join(brewroot.name, "x86_64"))
+        with open(os.path.join(brewroot.name, "x86_64", "bar-1.0.rpm"), "wb") as f:
+            f.write(b"bar")
+        os.symlink(brewroot.name, os.path.join(brewroot.name, "x86_64", "loop"))
+        os.symlink(os.path.join(brewroot.name, "x86_64"), os.path.join(self.repo, "Packages", "bar"))
+
+        client = FakeS3Client()
+        client.objects[f"{prefix}Packages/bar/bar-1.0.rpm"] = b"bar"
+        await s3.upload_repo_to_s3_mirror(self.repo, "/pub/openshift-v4/x86_64/repo", clients={"aws": client})
+        self.assertEqual(client.objects[f"{prefix}Packages/bar/bar-1.0.rpm"], b"bar")
+        # The walk stops where the loop link leads back into a directory it came through
+        self.assertEqual([key for key in client.objects if "/bar/" in key], [f"{prefix}Packages/bar/bar-1.0.rpm"])
+        self.assertEqual(client.deletes, [])
@@ -1,6 +1,7 @@
 import asyncio
 import base64
 import json
+import tempfile
 from datetime import datetime, timedelta, timezone
 from io import BytesIO
 from unittest import IsolatedAsyncioTestCase
@@ -491,3 +492,60 @@ class TestSigstoreSignatory(IsolatedAsyncioTestCase):
         err_msg = str(result[ps])
         self.assertIn("identity=", err_msg)
         self.assertIn("key=my-key-123", err_msg)
+
+    @patch("pyartcd.signatory.asyncio.sleep", new_callable=AsyncMock)
+    @patch("pyartcd.signatory.get_image_info", new_callable=AsyncMock)
+    @patch("pyartcd.signatory.SigstoreSignatory.get_release_image_references", new_callable=AsyncMock)
+    async def test_discover_component_images_uses_persisted_cache(self, mock_refs, mock_image_info, mock_sleep):
+        """Digests examined by a previous run are not examined again"""
+        repo = "quay.io/openshift-release-dev/ocp-v4.0-art-dev"
+        mock_refs.return_value = {f"{repo}@sha256:list", f"{repo}@sha256:single"}
+
+        async def fake_image_info(pullspec, raise_if_not_found, registry_config=None):
+            if pullspec.endswith("sha256:list"):
+                return [
+                    {"name": f"{repo}@sha256:amd64", "digest": "sha256:amd64"},
+                    {"name": f"{repo}@sha256:arm64", "digest": "sha256:arm64"},
+                ]
+            return {"digest": pullspec.rsplit("@", 1)[1]}
+
+        mock_image_info.side_effect = fake_image_info
+        expected = {f"{repo}@sha256:amd64", f"{repo}@sha256:arm64", f"{repo}@sha256:single"}
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            signatory = self._create_signatory(cache_dir=cache_dir)
+            components, errors = await signatory.discover_component_images(f"{repo}:release", "4.16.1")
+            self.assertEqual((components, errors), (expected, {}))
+            self.assertEqual(mock_image_info.await_count, 4)
+
+            mock_image_info.reset_mock()
+            signatory = self._create_signatory(cache_dir=cache_dir)
+            components, errors = await signatory.discover_component_images(f"{repo}:release", "4.16.1")
+            self.assertEqual((components, errors), (expected, {}))
+            mock_image_info.assert_not_awaited()
+
+    @patch("pyartcd.signatory.asyncio.sleep", new_callable=AsyncMock)
+    @patch("pyartcd.signatory.exectools.cmd_gather_async", new_callable=AsyncMock)
+    async def test_sign_component_images_skips_signed(self, mock_cmd, mock_sleep):
+        """Images with a valid signature are not signed again, and a re-run skips what it signed"""
+        ps_signed = "quay.io/ocp-v4.0-art-dev@sha256:signed"
+        ps_unsigned = "quay.io/ocp-v4.0-art-dev@sha256:unsigned"
+        commands = []
+
+        async def fake_cmd(cmd, check=False, env=None):
+            commands.append((cmd[1], cmd[-1]))
+            if cmd[1] == "verify" and cmd[-1] != ps_signed:
+                return (1, "", "no signatures found")
+            return (0, "ok", "")
+
+        mock_cmd.side_effect = fake_cmd
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            signatory = self._create_signatory(dry_run=False, cache_dir=cache_dir, skip_signed=True)
+            self.assertEqual(await signatory.sign_component_images([ps_signed, ps_unsigned]), {})
+            self.assertCountEqual(commands, [("verify", ps_signed), ("verify", ps_unsigned), ("sign", ps_unsigned)])
+
+            commands.clear()
+            signatory = self._create_signatory(dry_run=False, cache_dir=cache_dir, skip_signed=True)
+            self.assertEqual(await signatory.sign_component_images([ps_signed, ps_unsigned]), {})
+            self.assertEqual(commands, [])